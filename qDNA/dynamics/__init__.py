@@ -1,2 +1,11 @@
 from .reduced_dm import *
+from .liouvillian import *
+from .propagator import *
+from .spectral import *
+from .time_average import *
+from .krylov import *
+from .ode import *
+from .mcwf import *
+from .trajectory import *
 from .solver import *
+from .cache import *
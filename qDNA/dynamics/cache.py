@@ -0,0 +1,320 @@
+"""Module for caching the observables calculated by the master equation solver on disk.
+The cache entries are addressed by a hash of the canonicalized inputs, the contents of
+the tight-binding parameter files and the version of qDNA, such that results are reused
+across sessions and invalidated when the parameters or the code change. The entries are
+stored in a per-user cache directory, see ``get_cache_dir``.
+
+Shortcuts
+---------
+- pop: population
+- coh: coherence
+"""
+
+import hashlib
+import json
+import os
+import uuid
+
+import numpy as np
+
+from .. import __version__, DATA_DIR
+from ..tools import DEFAULTS
+from .solver import get_me_solver
+
+__all__ = [
+    "CACHE_DIR",
+    "get_cache_dir",
+    "get_cache_key",
+    "load_cache",
+    "save_cache",
+    "clear_cache",
+    "calc_observables",
+]
+
+# ------------------------------------------------
+
+
+def get_cache_dir():
+    """Returns the default cache directory. The directory is taken from the environment
+    variable ``QDNA_CACHE_DIR`` if it is set and otherwise defaults to
+    ``$XDG_CACHE_HOME/qDNA`` or ``~/.cache/qDNA``.
+
+    Returns
+    -------
+    str
+        The cache directory.
+    """
+
+    cache_dir = os.environ.get("QDNA_CACHE_DIR")
+    if cache_dir:
+        return os.path.expanduser(cache_dir)
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join("~", ".cache")
+    return os.path.join(os.path.expanduser(cache_home), "qDNA")
+
+
+CACHE_DIR: str = get_cache_dir()
+_QUANTITIES = ["pop", "coh", "groundstate_pop", "expect"]
+
+# ------------------------------------------------
+
+
+def _canonicalize(value):
+    """Converts a value into a JSON-serializable form that does not depend on the order
+    of dictionary keys or the distinction between integers and floats."""
+
+    if isinstance(value, dict):
+        return {str(key): _canonicalize(value[key]) for key in sorted(value)}
+    if isinstance(value, (list, tuple)):
+        return [_canonicalize(item) for item in value]
+    if isinstance(value, np.generic):
+        value = value.item()
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return float(value)
+    return value
+
+
+def _get_tb_params_hash(source, tb_model_name):
+    """Hashes the contents of the tight-binding parameter files of a source."""
+
+    sha = hashlib.sha256()
+    directory = os.path.join(DATA_DIR, "raw", "tb_params")
+    for particle in ["electron", "hole", "exciton"]:
+        filepath = os.path.join(directory, f"{source}_{particle}_{tb_model_name}.json")
+        if os.path.exists(filepath):
+            with open(filepath, "rb") as file:
+                sha.update(file.read())
+    return sha.hexdigest()
+
+
+def _get_e_ops_hash(e_ops):
+    """Hashes the names and matrices of custom observables."""
+
+    sha = hashlib.sha256()
+    for key in sorted(e_ops):
+        e_op = e_ops[key]
+        e_op = e_op.full() if hasattr(e_op, "full") else e_op
+        e_op = np.ascontiguousarray(e_op, dtype=np.complex128)
+        sha.update(key.encode("utf-8"))
+        sha.update(str(e_op.shape).encode("utf-8"))
+        sha.update(e_op.tobytes())
+    return sha.hexdigest()
+
+
+def get_cache_key(upper_strand, tb_model_name, quantities, e_ops=None, **kwargs):
+    """Calculates the cache key of a calculation. Keyword arguments are completed with
+    the default values, such that equivalent inputs have the same key.
+
+    Parameters
+    ----------
+    upper_strand : str
+        The upper strand of DNA sequence.
+    tb_model_name : str
+        The name of the tight-binding model.
+    quantities : List[str]
+        The calculated quantities.
+    e_ops : dict, optional
+        Dictionary of custom observables (``np.ndarray`` or ``qutip.Qobj``).
+    kwargs : dict
+        Additional keyword arguments for the master equation solver.
+
+    Returns
+    -------
+    str
+        The hexadecimal cache key.
+    """
+
+    inputs = {
+        "upper_strand": upper_strand,
+        "lower_strand": kwargs.get("lower_strand") or "auto_complete",
+        "tb_model_name": tb_model_name,
+        "quantities": sorted(quantities),
+        "version": __version__,
+    }
+    for kwargs_name in [
+        "ham_kwargs_default",
+        "diss_kwargs_default",
+        "me_kwargs_default",
+    ]:
+        inputs[kwargs_name] = {
+            key: kwargs.get(key, default)
+            for key, default in DEFAULTS[kwargs_name].items()
+        }
+    source = inputs["ham_kwargs_default"]["source"]
+    inputs["tb_params"] = _get_tb_params_hash(source, tb_model_name)
+    if e_ops:
+        inputs["e_ops"] = _get_e_ops_hash(e_ops)
+
+    serialized = json.dumps(_canonicalize(inputs), sort_keys=True)
+    return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+
+
+def load_cache(key, directory=None):
+    """Loads a cache entry. The modification time of the entry is updated on every hit,
+    which is used for the least-recently-used eviction.
+
+    Parameters
+    ----------
+    key : str
+        The cache key.
+    directory : str, optional
+        The cache directory. Defaults to ``CACHE_DIR``.
+
+    Returns
+    -------
+    dict or None
+        The cached arrays or None if the entry does not exist.
+    """
+
+    if directory is None:
+        directory = CACHE_DIR
+    filepath = os.path.join(directory, key + ".npz")
+    try:
+        with np.load(filepath) as file:
+            data = dict(file)
+    except (FileNotFoundError, OSError, ValueError):
+        return None
+    os.utime(filepath)
+    return data
+
+
+def save_cache(key, data, directory=None, max_size=None):
+    """Saves a cache entry in the compressed ``.npz`` format and evicts the least
+    recently used entries if the cache exceeds its size limit.
+
+    Parameters
+    ----------
+    key : str
+        The cache key.
+    data : dict
+        Dictionary of arrays.
+    directory : str, optional
+        The cache directory. Defaults to ``CACHE_DIR``.
+    max_size : float, optional
+        Size limit of the cache in MB. Defaults to ``cache_max_size`` in the defaults.
+    """
+
+    if directory is None:
+        directory = CACHE_DIR
+    if max_size is None:
+        max_size = DEFAULTS["cache_max_size"]
+    os.makedirs(directory, exist_ok=True)
+
+    # write to a temporary file first, such that parallel processes never read partial
+    # entries
+    filepath = os.path.join(directory, key + ".npz")
+    tmp_filepath = os.path.join(directory, f"{key}_{uuid.uuid4().hex}.tmp.npz")
+    np.savez_compressed(tmp_filepath, **data)
+    os.replace(tmp_filepath, filepath)
+
+    # evict the least recently used entries
+    entries = []
+    for filename in os.listdir(directory):
+        if filename.endswith(".npz") and not filename.endswith(".tmp.npz"):
+            stat = os.stat(os.path.join(directory, filename))
+            entries.append((stat.st_mtime, stat.st_size, filename))
+    entries.sort()
+    total_size = sum(size for _, size, _ in entries)
+    for _, size, filename in entries:
+        if total_size <= max_size * 2**20 or filename == key + ".npz":
+            continue
+        os.remove(os.path.join(directory, filename))
+        total_size -= size
+
+
+def clear_cache(directory=None):
+    """Removes all cache entries.
+
+    Parameters
+    ----------
+    directory : str, optional
+        The cache directory. Defaults to ``CACHE_DIR``.
+    """
+
+    if directory is None:
+        directory = CACHE_DIR
+    if not os.path.exists(directory):
+        return
+    for filename in os.listdir(directory):
+        if filename.endswith(".npz"):
+            os.remove(os.path.join(directory, filename))
+
+
+# ------------------------------------------------
+
+
+def calc_observables(
+    upper_strand,
+    tb_model_name,
+    quantities="all",
+    e_ops=None,
+    use_cache=True,
+    cache_dir=None,
+    **kwargs,
+):
+    """Calculates the populations, coherences, ground state population and the
+    expectation values of custom observables. Cached results are loaded without setting
+    up the Hamiltonian, the dissipator and the solver.
+
+    Parameters
+    ----------
+    upper_strand : str
+        The upper strand of DNA sequence.
+    tb_model_name : str
+        The name of the tight-binding model.
+    quantities : list of str or str, optional
+        List of quantities to calculate ("pop", "coh" and "groundstate_pop"). If "all",
+        all quantities available for the Hamiltonian description are calculated.
+        Default is "all".
+    e_ops : dict, optional
+        Dictionary of custom observables (``np.ndarray`` or ``qutip.Qobj``) whose
+        expectation values are returned in ``expect`` under the same keys.
+    use_cache : bool, optional
+        If True, the results are loaded from and saved to the cache. Default is True.
+    cache_dir : str, optional
+        The cache directory. Defaults to ``CACHE_DIR``.
+    kwargs : dict
+        Additional keyword arguments for the master equation solver.
+
+    Returns
+    -------
+    tuple
+        pop : dict
+            Population of each particle on each tight-binding site.
+        coh : dict
+            Coherence of each particle.
+        groundstate_pop : dict
+            Ground state population.
+        expect : dict
+            Expectation values of the custom observables.
+
+    Examples
+    --------
+    >>> pop, coh, groundstate_pop, _ = calc_observables("GCG", "ELM", relax_rate=3)
+    """
+
+    if quantities == "all":
+        quantities = ["pop", "coh"]
+        ham_kwargs = {**DEFAULTS["ham_kwargs_default"], **kwargs}
+        if ham_kwargs["description"] == "2P" and ham_kwargs["relaxation"]:
+            quantities.append("groundstate_pop")
+
+    key = get_cache_key(
+        upper_strand, tb_model_name, quantities, e_ops=e_ops, **kwargs
+    )
+    data = load_cache(key, directory=cache_dir) if use_cache else None
+
+    if data is None:
+        me_solver = get_me_solver(upper_strand, tb_model_name, **kwargs)
+        observables = me_solver.observe(quantities, e_ops=e_ops)
+        data = {}
+        for quantity, observable in zip(_QUANTITIES, observables):
+            for name, values in observable.items():
+                data[quantity + ":" + name] = np.asarray(values)
+        if use_cache:
+            save_cache(key, data, directory=cache_dir)
+
+    observables = {quantity: {} for quantity in _QUANTITIES}
+    for name, values in data.items():
+        quantity, name = name.split(":", maxsplit=1)
+        observables[quantity][name] = values
+    return tuple(observables[quantity] for quantity in _QUANTITIES)
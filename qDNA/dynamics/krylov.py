@@ -0,0 +1,193 @@
+"""Module for propagating vectorized density matrices with the action of the matrix
+exponential of the sparse Liouvillian in a Krylov subspace. Only sparse matrix-vector
+products with the Liouvillian are needed, such that the memory consumption scales with
+the dimension of the Liouville space times the dimension of the Krylov subspace.
+
+Shortcuts
+---------
+- vec: vectorized
+- dim: dimension
+"""
+
+import numpy as np
+import scipy.linalg
+import scipy.sparse as sp
+
+__all__ = ["get_krylov_dim", "krylov_expmv", "krylov_propagate"]
+
+# ------------------------------------------------
+
+
+def get_krylov_dim(vec_dim, krylov_dim, max_memory):
+    """Limits the dimension of the Krylov subspace such that the Krylov basis fits into
+    the memory ceiling.
+
+    Parameters
+    ----------
+    vec_dim : int
+        Dimension of the Liouville space.
+    krylov_dim : int
+        Requested dimension of the Krylov subspace.
+    max_memory : float
+        Memory ceiling for the Krylov basis in MB.
+
+    Returns
+    -------
+    int
+        The dimension of the Krylov subspace.
+
+    Examples
+    --------
+    >>> get_krylov_dim(10**6, 30, 256)
+    15
+    """
+
+    max_dim = int(max_memory * 2**20 // (16 * vec_dim)) - 1
+    assert max_dim >= 2, (
+        f"max_memory {max_memory} MB is too small for a Krylov subspace of a "
+        f"Liouville space with dimension {vec_dim}"
+    )
+    return min(krylov_dim, max_dim, vec_dim)
+
+
+def _arnoldi(liouvillian, vec, krylov_dim):
+    """Constructs an orthonormal basis of the Krylov subspace spanned by the normalized
+    vector and its images under the Liouvillian. Returns the basis, the upper Hessenberg
+    matrix and a flag indicating an invariant subspace (happy breakdown)."""
+
+    # the basis vectors are stored as rows to keep them contiguous in memory
+    basis = np.zeros((krylov_dim + 1, len(vec)), dtype=vec.dtype)
+    hessenberg = np.zeros((krylov_dim + 1, krylov_dim), dtype=complex)
+    basis[0] = vec
+
+    for j in range(krylov_dim):
+        new_vec = liouvillian @ basis[j]
+        # classical Gram-Schmidt orthogonalization with reorthogonalization
+        for _ in range(2):
+            coeffs = (basis[: j + 1] @ new_vec.conj()).conj()
+            new_vec -= coeffs @ basis[: j + 1]
+            hessenberg[: j + 1, j] += coeffs
+        hessenberg[j + 1, j] = np.linalg.norm(new_vec)
+        if hessenberg[j + 1, j] < 1e-12:
+            return basis[: j + 1], hessenberg[: j + 2, : j + 1], True
+        basis[j + 1] = new_vec / hessenberg[j + 1, j]
+    return basis, hessenberg, False
+
+
+def krylov_expmv(liouvillian, vec, t, tol=1e-8, krylov_dim=30):
+    r"""Calculates :math:`e^{\mathcal{L} t} v` in a Krylov subspace. The time interval
+    is divided into substeps that are adapted to the error estimate of the Krylov
+    approximation.
+
+    Parameters
+    ----------
+    liouvillian : scipy.sparse.spmatrix
+        The Liouvillian superoperator.
+    vec : np.ndarray
+        The vectorized density matrix.
+    t : float
+        The propagation time.
+    tol : float, optional
+        Tolerance for the error of the result. Default is 1e-8.
+    krylov_dim : int, optional
+        Dimension of the Krylov subspace. Default is 30.
+
+    Returns
+    -------
+    np.ndarray
+        The propagated vector.
+
+    Examples
+    --------
+    >>> liouvillian = sp.csr_matrix(np.diag([0, -1]))
+    >>> krylov_expmv(liouvillian, np.array([1, 1]), 1.0).real
+    array([1.        , 0.36787944])
+    """
+
+    vec = np.asarray(vec)
+    vec = vec.astype(np.result_type(vec, np.complex64))
+    t_done, t_step = 0.0, t
+    while t_done < t:
+        t_step = min(t_step, t - t_done)
+        beta = np.linalg.norm(vec)
+        if beta == 0:
+            return vec
+        basis, hessenberg, happy = _arnoldi(liouvillian, vec / beta, krylov_dim)
+        dim = hessenberg.shape[1]
+
+        # reduce the substep until the error estimate is below the tolerance
+        while True:
+            exp_hessenberg = scipy.linalg.expm(t_step * hessenberg[:dim, :dim])
+            error = 0.0
+            if not happy:
+                error = beta * abs(hessenberg[dim, dim - 1] * exp_hessenberg[dim - 1, 0])
+            ratio = np.inf if error == 0 else tol * t_step / (t * error)
+            if ratio >= 1:
+                break
+            t_step *= max(0.2, 0.9 * ratio ** (1 / dim))
+
+        vec = (beta * exp_hessenberg[:, 0]).astype(vec.dtype) @ basis[:dim]
+        t_done += t_step
+
+        # the error of the Krylov approximation scales with the power of the substep
+        t_step *= min(5.0, 0.9 * ratio ** (1 / dim))
+    return vec
+
+
+def krylov_propagate(
+    liouvillian,
+    init_vec,
+    times,
+    e_ops_matrix=None,
+    tol=1e-8,
+    krylov_dim=30,
+    return_final=False,
+):
+    """Propagates a vectorized density matrix over a time grid with the Krylov
+    approximation of the matrix exponential.
+
+    Parameters
+    ----------
+    liouvillian : scipy.sparse.spmatrix
+        The Liouvillian superoperator.
+    init_vec : np.ndarray
+        The vectorized initial density matrix of shape (D^2,).
+    times : np.ndarray
+        Time points (not necessarily uniform).
+    e_ops_matrix : np.ndarray, optional
+        Observables as returned by ``get_e_ops_matrix`` of shape (K, D^2). If given,
+        only the expectation values are returned.
+    tol : float, optional
+        Tolerance for the error of each time step. Default is 1e-8.
+    krylov_dim : int, optional
+        Dimension of the Krylov subspace. Default is 30.
+    return_final : bool, optional
+        If True, the vectorized final state is returned as well. Default is False.
+
+    Returns
+    -------
+    np.ndarray or tuple
+        The vectorized states of shape (T, D^2) or, if ``e_ops_matrix`` is given, the
+        expectation values of shape (K, T). If ``return_final`` is True, a tuple with
+        the final state.
+    """
+
+    liouvillian = sp.csr_matrix(liouvillian)
+    # single precision (complex64) inputs are propagated in single precision
+    vec = np.asarray(init_vec)
+    vec = vec.astype(np.result_type(vec, np.complex64))
+    if e_ops_matrix is None:
+        out = np.empty((len(times), len(vec)), dtype=vec.dtype)
+    else:
+        out = np.empty((e_ops_matrix.shape[0], len(times)), dtype=vec.dtype)
+
+    for step, t_step in enumerate(np.diff(times, prepend=times[0])):
+        if t_step > 0:
+            vec = krylov_expmv(liouvillian, vec, t_step, tol, krylov_dim)
+        if e_ops_matrix is None:
+            out[step] = vec
+        else:
+            out[:, step] = e_ops_matrix @ vec
+    if return_final:
+        return out, vec
+    return out
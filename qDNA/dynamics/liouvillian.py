@@ -0,0 +1,211 @@
+"""Module for constructing the Liouvillian superoperator of the Lindblad master equation
+and for switching between density matrices and their vectorized representation.
+
+The density matrix is vectorized by stacking its columns (as in qutip), such that
+:math:`\\mathrm{vec}(A \\rho B) = (B^T \\otimes A)\\, \\mathrm{vec}(\\rho)`.
+
+Shortcuts
+---------
+- dm: density matrix
+- vec: vectorized
+- ham: hamiltonian
+- dim: dimension
+"""
+
+import numpy as np
+import scipy.sparse as sp
+
+from ..environment import get_dissipator
+
+__all__ = [
+    "get_liouvillian",
+    "vectorize_dm",
+    "unvectorize_dm",
+    "get_e_ops_matrix",
+    "get_max_decay_rate",
+    "get_groundstate_block_indices",
+]
+
+# ------------------------------------------------
+
+
+def _to_array(operator):
+    """Converts a ``qutip.Qobj`` or array-like operator to a numpy array."""
+
+    if hasattr(operator, "full"):
+        return operator.full()
+    return np.asarray(operator)
+
+
+def get_liouvillian(ham_matrix, c_ops=None, dissipator=None):
+    r"""Constructs the Liouvillian superoperator of the Lindblad master equation as a
+    sparse matrix.
+
+    Parameters
+    ----------
+    ham_matrix : np.ndarray, scipy.sparse.spmatrix or qutip.Qobj
+        The Hamiltonian matrix of dimension :math:`D`.
+    c_ops : list, optional
+        List of collapse operators (``np.ndarray`` or ``qutip.Qobj``).
+    dissipator : scipy.sparse.spmatrix, optional
+        Precomputed dissipator (e.g., from ``Lindblad_Diss.get_dissipator``) that is
+        used instead of the collapse operators.
+
+    Returns
+    -------
+    scipy.sparse.csr_matrix
+        The Liouvillian of dimension :math:`D^2`.
+
+    Notes
+    -----
+    .. note::
+
+        For column-stacked density matrices the Liouvillian reads
+
+        .. math::
+            \mathcal{L} = -i (I \otimes H - H^T \otimes I)
+            + \sum_k \bar{c}_k \otimes c_k
+            - \frac{1}{2} I \otimes C - \frac{1}{2} C^T \otimes I,
+
+        with :math:`C = \sum_k c_k^\dagger c_k`.
+
+    Examples
+    --------
+    >>> get_liouvillian(np.diag([0, 1]), []).diagonal()
+    array([0.+0.j, 0.-1.j, 0.+1.j, 0.+0.j])
+    """
+
+    if not sp.issparse(ham_matrix):
+        ham_matrix = _to_array(ham_matrix)
+    ham_matrix = sp.csr_matrix(ham_matrix)
+    dim = ham_matrix.shape[0]
+    identity = sp.identity(dim, format="csr")
+
+    liouvillian = -1j * (sp.kron(identity, ham_matrix) - sp.kron(ham_matrix.T, identity))
+    if dissipator is None and c_ops:
+        dissipator = get_dissipator(c_ops)
+    if dissipator is not None:
+        liouvillian += dissipator
+    return sp.csr_matrix(liouvillian, dtype=complex)
+
+
+def vectorize_dm(dm):
+    """Stacks the columns of a density matrix into a vector.
+
+    Parameters
+    ----------
+    dm : np.ndarray or qutip.Qobj
+        Density matrix.
+
+    Returns
+    -------
+    np.ndarray
+        The vectorized density matrix.
+
+    Examples
+    --------
+    >>> vectorize_dm(np.array([[1, 2], [3, 4]]))
+    array([1.+0.j, 3.+0.j, 2.+0.j, 4.+0.j])
+    """
+
+    return _to_array(dm).ravel(order="F").astype(complex)
+
+
+def unvectorize_dm(vec):
+    """Reshapes a column-stacked vector (or an array of vectors along the last axis)
+    into density matrices.
+
+    Parameters
+    ----------
+    vec : np.ndarray
+        Vectorized density matrix of shape (..., D^2).
+
+    Returns
+    -------
+    np.ndarray
+        Density matrix of shape (..., D, D).
+
+    Examples
+    --------
+    >>> unvectorize_dm(np.array([1, 3, 2, 4]))
+    array([[1, 2],
+           [3, 4]])
+    """
+
+    dim = int(round(np.sqrt(vec.shape[-1])))
+    return np.swapaxes(vec.reshape(vec.shape[:-1] + (dim, dim)), -1, -2)
+
+
+def get_e_ops_matrix(e_ops):
+    r"""Stacks observables into a matrix such that the expectation values are obtained
+    by a single product with the vectorized density matrix,
+    :math:`\mathrm{Tr}(O \rho) = \sum_{ij} O_{ij} \rho_{ji}`.
+
+    Parameters
+    ----------
+    e_ops : list
+        List of observables (``np.ndarray`` or ``qutip.Qobj``).
+
+    Returns
+    -------
+    np.ndarray
+        Matrix of shape (K, D^2).
+    """
+
+    return np.array([_to_array(e_op).ravel() for e_op in e_ops], dtype=complex)
+
+
+def get_max_decay_rate(c_ops):
+    """Estimates the fastest decay rate of the Liouvillian from the largest eigenvalue of
+    :math:`C = \\sum_k c_k^\\dagger c_k`, such that the Liouvillian is not diagonalized.
+
+    Parameters
+    ----------
+    c_ops : list
+        List of collapse operators (``np.ndarray`` or ``qutip.Qobj``).
+
+    Returns
+    -------
+    float
+        The estimated fastest decay rate.
+
+    Examples
+    --------
+    >>> get_max_decay_rate([np.diag([0, 2]), np.diag([1, 0])])
+    4.0
+    """
+
+    if not c_ops:
+        return 0.0
+    rate_matrix = sum(_to_array(c_op).conj().T @ _to_array(c_op) for c_op in c_ops)
+    return float(np.linalg.eigvalsh(rate_matrix)[-1])
+
+
+def get_groundstate_block_indices(dim):
+    """Returns the indices of the column-stacked density matrix elements that remain if
+    the coherences between the ground state (index 0) and the excited states are
+    dropped. The ground state is only coupled to the excited states by relaxation, which
+    transfers population, such that the excited block and the ground state population
+    evolve independently of these coherences.
+
+    Parameters
+    ----------
+    dim : int
+        Dimension :math:`D` of the density matrix including the ground state.
+
+    Returns
+    -------
+    np.ndarray
+        The indices of the ground state population and the excited block, in total
+        :math:`(D - 1)^2 + 1` indices.
+
+    Examples
+    --------
+    >>> get_groundstate_block_indices(3)
+    array([0, 4, 5, 7, 8])
+    """
+
+    rows, cols = np.indices((dim, dim))
+    mask = (rows > 0) & (cols > 0)
+    mask[0, 0] = True
+    return np.flatnonzero(mask.ravel(order="F"))
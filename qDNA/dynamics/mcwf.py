@@ -0,0 +1,194 @@
+"""Module for solving the Lindblad master equation by unravelling it into quantum
+trajectories (Monte Carlo wave function method). Each trajectory evolves a state vector
+with the effective non-hermitian Hamiltonian :math:`H_{eff} = H - \\frac{i}{2} \\sum_k
+c_k^\\dagger c_k` and performs quantum jumps with the collapse operators. Averaging over
+many trajectories reproduces the expectation values of the master equation.
+
+Shortcuts
+---------
+- psi: state vector
+- dm: density matrix
+- traj: trajectory
+- err: error
+"""
+
+import multiprocessing
+from functools import partial
+
+import numpy as np
+import scipy.linalg
+import scipy.sparse as sp
+from scipy.optimize import brentq
+
+__all__ = ["get_eff_eigensystem", "run_trajectory", "run_mcwf"]
+
+# ------------------------------------------------
+
+
+def _sample_init_psi(init_dm, rng):
+    """Samples a pure initial state from the eigendecomposition of the initial density
+    matrix."""
+
+    probs, psis = np.linalg.eigh(init_dm)
+    probs = np.clip(probs, 0, None)
+    idx = rng.choice(len(probs), p=probs / np.sum(probs))
+    return psis[:, idx].astype(complex)
+
+
+def get_eff_eigensystem(ham_matrix, c_ops):
+    """Diagonalizes the generator :math:`-i H_{eff}` of the non-unitary evolution
+    between the quantum jumps.
+
+    Parameters
+    ----------
+    ham_matrix : np.ndarray
+        The Hamiltonian matrix.
+    c_ops : list
+        The collapse operators (``np.ndarray`` or ``scipy.sparse.spmatrix``).
+
+    Returns
+    -------
+    tuple
+        Eigenvalues, eigenvectors and the inverse of the eigenvector matrix.
+    """
+
+    ham_eff = np.asarray(ham_matrix, dtype=complex)
+    for c_op in c_ops:
+        c_op = sp.csr_matrix(c_op)
+        ham_eff = ham_eff - 0.5j * (c_op.conj().T @ c_op).toarray()
+    eigv, eigs = scipy.linalg.eig(-1j * ham_eff)
+    return eigv, eigs, scipy.linalg.inv(eigs)
+
+
+def run_trajectory(
+    ham_matrix, c_ops, init_dm, times, e_ops, seed=None, eff_eigensystem=None
+):
+    """Calculates a single quantum trajectory and the expectation values along it.
+
+    Parameters
+    ----------
+    ham_matrix : np.ndarray
+        The Hamiltonian matrix.
+    c_ops : list of scipy.sparse.spmatrix
+        The collapse operators.
+    init_dm : np.ndarray
+        The initial density matrix from which the initial state is sampled.
+    times : np.ndarray
+        Time points.
+    e_ops : np.ndarray
+        Observables of shape (K, D, D).
+    seed : int or np.random.SeedSequence, optional
+        Seed of the random number generator.
+    eff_eigensystem : tuple, optional
+        Eigensystem as returned by ``get_eff_eigensystem``. Calculated if not given.
+
+    Returns
+    -------
+    np.ndarray
+        Complex expectation values of shape (K, T).
+    """
+
+    rng = np.random.default_rng(seed)
+    if eff_eigensystem is None:
+        eff_eigensystem = get_eff_eigensystem(ham_matrix, c_ops)
+    eigv, eigs, eigs_inv = eff_eigensystem
+
+    def evolve(coeffs, tau):
+        return eigs @ (np.exp(eigv * tau) * coeffs)
+
+    def norm_squared(psi):
+        return np.vdot(psi, psi).real
+
+    psi = _sample_init_psi(init_dm, rng)
+    rand = rng.random()
+    values = np.empty((len(e_ops), len(times)), dtype=complex)
+
+    for step, t_step in enumerate(np.diff(times, prepend=times[0])):
+        coeffs = eigs_inv @ psi
+        new_psi = evolve(coeffs, t_step)
+
+        # the norm decays until it drops below the random number, then a jump occurs
+        while norm_squared(new_psi) < rand:
+            t_jump = brentq(
+                lambda tau, coeffs=coeffs: norm_squared(evolve(coeffs, tau)) - rand,
+                0,
+                t_step,
+                xtol=1e-12 * max(t_step, 1),
+            )
+            psi = evolve(coeffs, t_jump)
+
+            # choose the collapse operator according to the jump probabilities
+            jump_psis = [c_op @ psi for c_op in c_ops]
+            probs = np.array([norm_squared(jump_psi) for jump_psi in jump_psis])
+            idx = rng.choice(len(c_ops), p=probs / np.sum(probs))
+            psi = jump_psis[idx] / np.sqrt(probs[idx])
+            rand = rng.random()
+
+            t_step -= t_jump
+            coeffs = eigs_inv @ psi
+            new_psi = evolve(coeffs, t_step)
+
+        psi = new_psi
+        norm_psi = psi / np.sqrt(norm_squared(psi))
+        values[:, step] = np.einsum("i,kij,j->k", norm_psi.conj(), e_ops, norm_psi)
+    return values
+
+
+def run_mcwf(
+    ham_matrix, c_ops, init_dm, times, e_ops, num_traj=500, seed=None, num_cpu=1
+):
+    """Averages the expectation values over many quantum trajectories, which are
+    distributed over a process pool. The standard errors of the means serve as
+    convergence diagnostics.
+
+    Parameters
+    ----------
+    ham_matrix : np.ndarray
+        The Hamiltonian matrix.
+    c_ops : list
+        The collapse operators (``np.ndarray`` or ``scipy.sparse.spmatrix``).
+    init_dm : np.ndarray
+        The initial density matrix.
+    times : np.ndarray
+        Time points.
+    e_ops : np.ndarray
+        Observables of shape (K, D, D).
+    num_traj : int, optional
+        Number of trajectories. Default is 500.
+    seed : int, optional
+        Seed from which independent seeds for all trajectories are spawned. Default is None.
+    num_cpu : int, optional
+        Number of processes. If 1, the trajectories are calculated in the current process.
+        Inside a daemonic process (e.g., a worker of a ``multiprocessing.Pool``), which
+        cannot start child processes, the trajectories are always calculated serially.
+        Default is 1.
+
+    Returns
+    -------
+    tuple
+        The mean expectation values and their standard errors, both of shape (K, T).
+    """
+
+    c_ops = [sp.csr_matrix(c_op, dtype=complex) for c_op in c_ops]
+    seeds = np.random.SeedSequence(seed).spawn(num_traj)
+
+    # the effective Hamiltonian is shared by all trajectories
+    partial_run_trajectory = partial(
+        run_trajectory,
+        ham_matrix,
+        c_ops,
+        init_dm,
+        times,
+        e_ops,
+        eff_eigensystem=get_eff_eigensystem(ham_matrix, c_ops),
+    )
+    if num_cpu == 1 or multiprocessing.current_process().daemon:
+        traj_values = [partial_run_trajectory(traj_seed) for traj_seed in seeds]
+    else:
+        with multiprocessing.Pool(processes=num_cpu) as pool:
+            traj_values = pool.map(partial_run_trajectory, seeds)
+
+    traj_values = np.array(traj_values)
+    mean = np.mean(traj_values, axis=0)
+    std_err = np.std(traj_values, axis=0, ddof=1) / np.sqrt(num_traj)
+    return mean, std_err
@@ -0,0 +1,114 @@
+"""Module for integrating the vectorized Lindblad master equation
+:math:`\\dot{\\vec{\\rho}} = \\mathcal{L} \\vec{\\rho}` with the ODE solvers of scipy. Only
+numpy and scipy arrays are used, such that the integration does not depend on qutip and
+returns the same array types for all inputs.
+
+Shortcuts
+---------
+- vec: vectorized
+- ode: ordinary differential equation
+"""
+
+import numpy as np
+import scipy.sparse as sp
+from scipy.integrate import ode
+
+__all__ = ["ode_propagate"]
+
+# ------------------------------------------------
+
+
+def ode_propagate(
+    liouvillian,
+    init_vec,
+    times,
+    e_ops_matrix=None,
+    method="adams",
+    atol=1e-8,
+    rtol=1e-6,
+    nsteps=2500,
+    max_step=0.0,
+    return_final=False,
+):
+    """Propagates a vectorized density matrix over a time grid with the variable-order
+    ``zvode`` integrator (the integrator used by qutip).
+
+    Parameters
+    ----------
+    liouvillian : scipy.sparse.spmatrix
+        The Liouvillian superoperator.
+    init_vec : np.ndarray
+        The vectorized initial density matrix of shape (D^2,).
+    times : np.ndarray
+        Time points (not necessarily uniform).
+    e_ops_matrix : np.ndarray, optional
+        Observables as returned by ``get_e_ops_matrix`` of shape (K, D^2). If given,
+        only the expectation values are returned.
+    method : str, optional
+        'adams' for non-stiff or 'bdf' for stiff problems. Default is 'adams'.
+    atol : float, optional
+        Absolute tolerance. Default is 1e-8.
+    rtol : float, optional
+        Relative tolerance. Default is 1e-6.
+    nsteps : int, optional
+        Maximum number of internal steps between two time points. Default is 2500.
+    max_step : float, optional
+        Maximum step size (0 means no limit). Default is 0.
+    return_final : bool, optional
+        If True, the vectorized final state is returned as well. Default is False.
+
+    Returns
+    -------
+    np.ndarray or tuple
+        The vectorized states of shape (T, D^2) or, if ``e_ops_matrix`` is given, the
+        expectation values of shape (K, T). If ``return_final`` is True, a tuple with
+        the final state.
+
+    Raises
+    ------
+    RuntimeError
+        If the integration fails, e.g., because ``nsteps`` is exceeded.
+
+    Examples
+    --------
+    >>> liouvillian = sp.csr_matrix(np.diag([0, -1]))
+    >>> vecs = ode_propagate(liouvillian, np.array([1, 1]), np.array([0, 1]))
+    >>> vecs.real.round(4)
+    array([[1.    , 1.    ],
+           [1.    , 0.3679]])
+    """
+
+    liouvillian = sp.csr_matrix(liouvillian)
+    vec = np.asarray(init_vec, dtype=complex)
+    if e_ops_matrix is None:
+        out = np.empty((len(times), len(vec)), dtype=complex)
+    else:
+        out = np.empty((e_ops_matrix.shape[0], len(times)), dtype=complex)
+
+    integrator = ode(lambda t, y: liouvillian @ y)
+    integrator.set_integrator(
+        "zvode",
+        method=method,
+        atol=atol,
+        rtol=rtol,
+        nsteps=nsteps,
+        max_step=max_step,
+    )
+    integrator.set_initial_value(vec, times[0])
+
+    for step, t in enumerate(times):
+        if t > integrator.t:
+            vec = integrator.integrate(t)
+            if not integrator.successful():
+                raise RuntimeError(
+                    f"the integration failed at t = {integrator.t} "
+                    f"(return code {integrator.get_return_code()})"
+                )
+        if e_ops_matrix is None:
+            out[step] = vec
+        else:
+            out[:, step] = e_ops_matrix @ vec
+
+    if return_final:
+        return out, vec
+    return out
@@ -0,0 +1,91 @@
+"""Module for propagating vectorized density matrices on uniform time grids with the
+one-step propagator :math:`e^{\\mathcal{L} \\Delta t}` of the Liouvillian."""
+
+import numpy as np
+import scipy.linalg
+import scipy.sparse as sp
+
+__all__ = ["get_propagator", "propagate"]
+
+# ------------------------------------------------
+
+
+def get_propagator(liouvillian, dt, max_density=0.1):
+    r"""Calculates the one-step propagator :math:`e^{\mathcal{L} \Delta t}`.
+
+    Parameters
+    ----------
+    liouvillian : scipy.sparse.spmatrix or np.ndarray
+        The Liouvillian superoperator.
+    dt : float
+        The time step.
+    max_density : float, optional
+        The propagator is stored as a sparse matrix if the fraction of nonzero elements
+        is below this value. Default is 0.1.
+
+    Returns
+    -------
+    np.ndarray or scipy.sparse.csr_matrix
+        The one-step propagator.
+    """
+
+    if sp.issparse(liouvillian):
+        liouvillian = liouvillian.toarray()
+    # a python float keeps the precision of single precision (complex64) Liouvillians
+    propagator = scipy.linalg.expm(liouvillian * float(dt))
+
+    # the block structure of the Liouvillian is preserved by the matrix exponential
+    if np.count_nonzero(propagator) < max_density * propagator.size:
+        return sp.csr_matrix(propagator)
+    return propagator
+
+
+def propagate(
+    propagator, init_vec, num_steps, e_ops_matrix=None, return_final=False
+):
+    """Propagates a vectorized density matrix by repeated application of the one-step
+    propagator.
+
+    Parameters
+    ----------
+    propagator : np.ndarray or scipy.sparse.csr_matrix
+        The one-step propagator.
+    init_vec : np.ndarray
+        The vectorized initial density matrix of shape (D^2,) or a batch of them with
+        shape (D^2, M).
+    num_steps : int
+        Number of time points (including the initial time).
+    e_ops_matrix : np.ndarray, optional
+        Observables as returned by ``get_e_ops_matrix`` of shape (K, D^2). If given,
+        only the expectation values are returned.
+    return_final : bool, optional
+        If True, the vectorized final state is returned as well. Default is False.
+
+    Returns
+    -------
+    np.ndarray or tuple
+        The vectorized states of shape (T, D^2, ...) or, if ``e_ops_matrix`` is given,
+        the expectation values of shape (K, T, ...). If ``return_final`` is True, a tuple
+        with the final state.
+    """
+
+    # single precision (complex64) inputs are propagated in single precision
+    vec = np.asarray(init_vec)
+    vec = vec.astype(np.result_type(vec, np.complex64))
+    if e_ops_matrix is None:
+        out = np.empty((num_steps,) + vec.shape, dtype=vec.dtype)
+    else:
+        out = np.empty(
+            (e_ops_matrix.shape[0], num_steps) + vec.shape[1:], dtype=vec.dtype
+        )
+
+    for step in range(num_steps):
+        if e_ops_matrix is None:
+            out[step] = vec
+        else:
+            out[:, step] = e_ops_matrix @ vec
+        if step < num_steps - 1:
+            vec = propagator @ vec
+    if return_final:
+        return out, vec
+    return out
@@ -1,32 +1,39 @@
 """Module for reducing density matrices to the electron, hole or exciton subspace."""
 
-from itertools import product
 import numpy as np
 
-from ..hamiltonian import delete_groundstate
-from ..environment import get_eh_observable, get_tb_observable
-
 __all__ = ["get_reduced_dm", "get_reduced_dm_eigs"]
 
 # ------------------------------------------------
 
+# the reduced density matrix elements rho_ab are obtained by tracing out the other
+# particle, e.g., rho^e_ab = sum_h rho_(a,h),(b,h)
+_PARTIAL_TRACE_SUBSCRIPTS = {
+    "electron": "...ahbh->...ab",
+    "hole": "...eaeb->...ab",
+    "exciton": "...aabb->...ab",
+}
+
 
 def get_reduced_dm(dm, particle, tb_basis):
-    """Reduces the density matrix for a specific particle type.
+    """Reduces the density matrix for a specific particle type. The partial trace is
+    taken over the electron-hole tensor structure of the density matrix.
 
     Parameters
     ----------
     dm : np.ndarray
-        The initial density matrix.
+        The initial density matrix of shape (D, D) or a trajectory of density matrices of
+        shape (T, D, D).
     particle : str
-        The type of particle ('electron' or 'hole').
+        The type of particle ('electron', 'hole' or 'exciton').
     tb_basis : List[str]
         The list of tight-binding site basis states.
 
     Returns
     -------
     np.ndarray
-        The reduced density matrix for the specified particle.
+        The reduced density matrix for the specified particle of shape (N, N) or
+        (T, N, N).
 
     Raises
     ------
@@ -41,21 +48,21 @@ def get_reduced_dm(dm, particle, tb_basis):
            [0., 2.]])
     """
 
+    if particle not in _PARTIAL_TRACE_SUBSCRIPTS:
+        raise ValueError(f"particle {particle} is not recognized")
+    if hasattr(dm, "full"):
+        dm = dm.full()
+    dm = np.asarray(dm)
     num_sites = len(tb_basis)
 
     # Before taking the trace the groundstate needs to be removed
-    if dm.shape[0] != num_sites**2:
-        dm = delete_groundstate(dm)
-
-    reduced_dm = np.zeros((num_sites, num_sites), dtype=complex)
-    for start_state, end_state in product(tb_basis, repeat=2):
-        # Calculate expectation using the full density matrix
-        observable = get_eh_observable(tb_basis, particle, start_state, end_state)
-        value = np.trace(observable @ dm)
-
-        # Multiply expectation value with the corresponding element of the reduced density matrix
-        reduced_dm += value * get_tb_observable(tb_basis, start_state, end_state).T
-    return reduced_dm
+    if dm.shape[-1] != num_sites**2:
+        dm = dm[..., 1:, 1:]
+
+    # the indices of the density matrix are split into electron and hole indices
+    dm = dm.reshape(dm.shape[:-2] + (num_sites,) * 4)
+    # the exciton reduction without summation would be a view of the input
+    return np.einsum(_PARTIAL_TRACE_SUBSCRIPTS[particle], dm).copy()
 
 
 def get_reduced_dm_eigs(tb_ham, particle, eigenstate_idx):
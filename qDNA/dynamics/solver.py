@@ -10,18 +10,55 @@ Shortcuts
 - coh: coherence
 """
 
-from itertools import permutations
+from itertools import islice, permutations
 import copy
+import multiprocessing
 
 import numpy as np
 import qutip as q
+import scipy.integrate
+import scipy.linalg
+import scipy.sparse as sp
+from scipy.optimize import brentq
 
 from .. import DNA_Seq
 from ..environment import Lindblad_Diss, get_eh_observable
 from ..hamiltonian import TB_Ham, add_groundstate
+from ..model import (
+    get_liouville_perm,
+    is_perm_symmetric,
+    get_sector_basis,
+    get_sector_eigensystem,
+)
 from ..tools import check_me_kwargs, DEFAULTS
+from ..utils import get_dm_fourier, get_expect_fourier
 
 from .reduced_dm import get_reduced_dm
+from .liouvillian import (
+    get_liouvillian,
+    vectorize_dm,
+    unvectorize_dm,
+    get_e_ops_matrix,
+    get_max_decay_rate,
+    get_groundstate_block_indices,
+)
+from .propagator import get_propagator, propagate
+from .spectral import (
+    get_liouvillian_eigensystem,
+    get_spectral_amplitudes,
+    get_spectral_expect,
+    get_spectral_crossing_time,
+    get_decay_rates,
+)
+from .time_average import (
+    get_time_average_fourier,
+    get_spectral_time_average,
+    get_sparse_time_average,
+)
+from .krylov import get_krylov_dim, krylov_expmv, krylov_propagate
+from .ode import ode_propagate
+from .mcwf import run_mcwf
+from .trajectory import Trajectory
 
 __all__ = ["ME_Solver", "get_me_solver"]
 
@@ -58,6 +95,21 @@ class ME_Solver:
         Array of time points.
     t_unit : str
         Time unit.
+    solver_engine : str
+        Engine used to solve the master equation ('auto', 'qutip', 'scipy', 'unitary',
+        'propagator', 'spectral', 'krylov' or 'mcwf').
+    solver_method : str
+        Integration method of qutip and scipy ('auto', 'adams' or 'bdf').
+    options : dict
+        Tolerances and step limits of the qutip and scipy integrators.
+    use_symmetry : bool
+        Flag for the reduction to the reflection symmetry sectors.
+    sector_dims : list or None
+        Dimensions of the symmetry sectors of the Liouvillian (None if not reduced).
+    dtype : type
+        Data type of the Liouvillian, the states and the trajectories of the
+        Liouvillian engines (``np.complex128`` or, for single precision,
+        ``np.complex64``).
     tb_ham : TB_Ham
         The tight-binding Hamiltonian.
     tb_model : TB_Model
@@ -76,11 +128,39 @@ class ME_Solver:
         Dictionary to store population of states.
     coh : dict
         Dictionary to store coherence of states.
+    expect : dict
+        Dictionary to store expectation values of custom observables.
+    liouvillian : scipy.sparse.csr_matrix
+        The Liouvillian superoperator (calculated on demand).
+    mcwf_std_err : dict
+        Standard errors of the expectation values of the last quantum trajectory run.
+    trajectory : Trajectory
+        The states stored in a contiguous array (calculated on demand).
+    final_state : qutip.Qobj
+        The state at the end of the time grid (used to extend the results in time).
 
     Methods
     -------
-    get_init_matrix()
+    get_init_matrix(init_state)
         Generate the initial state matrix for the quantum system based on the Hamiltonian description.
+    get_liouvillian()
+        Calculate and return the Liouvillian superoperator.
+    get_spectrum(num_eigs)
+        Calculate and return the eigensystem of the Liouvillian.
+    get_decay_rates(num_rates, num_eigs)
+        Calculate the slowest decay rates of the Liouvillian.
+    observe(quantities, e_ops)
+        Calculate several observables with a single integration of the master equation.
+    get_pop_batch(init_states)
+        Calculate the populations for several initial states at once.
+    get_time_average(quantities, e_ops, continuous)
+        Calculate time-averaged expectation values without storing the trajectory.
+    get_event_time(e_op, threshold, direction, chunk_size, refine)
+        Calculate the time at which the expectation value of an observable crosses a threshold.
+    iter_result(e_ops, callback, chunk_size)
+        Yield the states or expectation values in time order without storing the trajectory.
+    get_trajectory(diagonal, dtype, filename)
+        Store the states in a contiguous array and return them as a Trajectory.
     get_result()
         Calculate and return the result of the master equation solver.
     get_result_particle(particle)
@@ -91,6 +171,8 @@ class ME_Solver:
         Calculate and return the coherence of the system.
     get_groundstate_pop()
         Calculate and return the ground state population.
+    extend(t_end)
+        Extend the time grid and continue the stored results from the final state.
     reset()
         Resets the solver's state by clearing results and initializing dictionaries for populations and coherences.
     """
@@ -116,6 +198,7 @@ class ME_Solver:
         self._t_end = int(self.me_kwargs.get("t_end"))
         self.times = np.linspace(0, self.t_end, self.t_steps)
         self.t_unit = self.me_kwargs.get("t_unit")
+        self.solver_engine = self.me_kwargs.get("solver_engine")
         assert self.t_steps / self.t_end > 1 / 2, (
             f"t_end {self.t_end} cannot be sufficiently resolved by t_steps {self.t_steps}. "
             "Please increase the number of steps or reduce the timespan. "
@@ -147,7 +230,38 @@ class ME_Solver:
         self.init_matrix = self.get_init_matrix()
 
         # set options for the solver
-        self.options = {}
+        self.solver_method = self.me_kwargs.get("solver_method")
+        self.options = {
+            "atol": self.me_kwargs.get("solver_atol"),
+            "rtol": self.me_kwargs.get("solver_rtol"),
+            "nsteps": int(self.me_kwargs.get("solver_nsteps")),
+            "max_step": self.me_kwargs.get("solver_max_step"),
+        }
+        self.liouvillian = None
+        self._propagator = None
+        self._spectrum = None
+        self._max_decay_rate = None
+        self.mcwf_std_err = {}
+
+        # the Liouvillian engines can drop the decoupled ground state coherences
+        self._vec_idx = None
+        if (
+            self.me_kwargs["reduce_groundstate"]
+            and self.tb_ham.description == "2P"
+            and self.tb_ham.relaxation
+        ):
+            self._vec_idx = get_groundstate_block_indices(self.tb_ham.matrix_dim)
+
+        # self-complementary sequences can be split into reflection symmetry sectors
+        self.use_symmetry = self.me_kwargs["use_symmetry"]
+        self._sector_basis = None
+        self.sector_dims = None
+
+        # the Liouvillian engines can propagate in single precision, whereas the
+        # Hamiltonian and the collapse operators are always built in double precision
+        self.dtype = (
+            np.complex64 if self.me_kwargs["precision"] == "single" else np.complex128
+        )
 
         # empty lists to store results
         self.reset()
@@ -194,10 +308,13 @@ class ME_Solver:
         old_t_steps = self._t_steps
         self._t_steps = new_t_steps
 
-        # update the time array and reset the results
+        # update the time array and subsample or reset the results
         if new_t_steps != old_t_steps:
             self.times = np.linspace(0, self._t_end, self._t_steps)
-            self.reset()
+            if new_t_steps > 1 and (old_t_steps - 1) % (new_t_steps - 1) == 0:
+                self._subsample((old_t_steps - 1) // (new_t_steps - 1))
+            else:
+                self.reset()
 
     # --------------------------------------------------------------------
 
@@ -210,17 +327,104 @@ class ME_Solver:
         .. note::
 
             - Clears the ``result`` list (for the full the all reduced density matrices).
-            - Initializes ``groundstate_pop``, ``pop``, and ``coh`` dictionaries.
+            - Initializes ``groundstate_pop``, ``pop``, ``coh``, and ``expect`` dictionaries.
         """
 
         self.result = []
+        self.trajectory = None
+        self.final_state = None
         self.groundstate_pop = {}
         self.pop = {}
         self.coh = {}
+        self.expect = {}
+        self._custom_e_ops = {}
         for particle in self.tb_ham.particles:
             vars(self)["result_" + particle] = []
 
-    def get_init_matrix(self):
+    def _subsample(self, factor):
+        """Keeps every ``factor``-th time point of the stored results. Used if the new
+        time grid is a subset of the old one."""
+
+        self.result = self.result[::factor]
+        self.trajectory = None
+        for quantity in ["pop", "coh", "groundstate_pop", "expect"]:
+            for key, value in vars(self)[quantity].items():
+                vars(self)[quantity][key] = np.asarray(value)[::factor]
+        for particle in self.tb_ham.particles:
+            vars(self)["result_" + particle] = []
+
+    def extend(self, t_end):
+        """Extend the time grid to ``t_end`` with the same time step. The stored results
+        are continued from the final state, such that only the new time interval is
+        integrated.
+
+        Parameters
+        ----------
+        t_end : float
+            The new end time. It is rounded up to the next point of the time grid.
+
+        Notes
+        -----
+        .. note::
+
+            If the final state is not available (e.g., for the 'mcwf' engine), the
+            stored results are reset and recalculated on demand.
+
+        Examples
+        --------
+        >>> me_solver = get_me_solver("GCG", "ELM", relax_rate=3)
+        >>> pop = me_solver.get_pop()
+        >>> me_solver.extend(2 * me_solver.t_end)
+        """
+
+        dt = self.times[1] - self.times[0]
+        num_steps = int(np.ceil((t_end - self.times[-1]) / dt - 1e-9))
+        if num_steps <= 0:
+            return
+        times = dt * np.arange(num_steps + 1)
+
+        quantities = [
+            quantity
+            for quantity in ["pop", "coh", "groundstate_pop"]
+            if vars(self)[quantity]
+        ]
+        final_state = self.final_state
+        if final_state is None and self.result:
+            final_state = self.result[-1]
+        if final_state is None:
+            self.reset()
+            quantities = []
+
+        # continue the stored states
+        if self.result:
+            self.result += self._solve({}, rho0=final_state, times=times)[1:]
+            self.final_state = self.result[-1]
+
+        # continue the stored expectation values
+        if quantities or self._custom_e_ops:
+            e_ops = {}
+            if "pop" in quantities:
+                e_ops.update(self._get_pop_ops())
+            if "coh" in quantities:
+                e_ops.update(self._get_coh_ops())
+            if "groundstate_pop" in quantities:
+                e_ops.update(self._get_groundstate_pop_ops())
+            e_ops.update(self._custom_e_ops)
+            expect = self._solve(
+                e_ops, rho0=final_state, times=times, store_final_state=True
+            )
+            self._store_observables(
+                expect, quantities, self._custom_e_ops, append=True
+            )
+
+        self.trajectory = None
+        for particle in self.tb_ham.particles:
+            vars(self)["result_" + particle] = []
+        self.times = np.r_[self.times, self.times[-1] + times[1:]]
+        self._t_end = self.times[-1]
+        self._t_steps = len(self.times)
+
+    def get_init_matrix(self, init_state=None):
         """Generate the initial state matrix for the quantum system based on the
         Hamiltonian description. The method supports two types of descriptions for the
         tight-binding Hamiltonian (tb_ham): "2P" (two- particle) and "1P" (one-
@@ -228,6 +432,13 @@ class ME_Solver:
         initial state matrix is constructed either as a delocalized state over all
         exciton states or as a localized state on a single exciton state.
 
+        Parameters
+        ----------
+        init_state : tuple or str, optional
+            Initial state localized on a single state, i.e., a tuple of electron and hole
+            state for the 2P description or a tight-binding site for the 1P description.
+            Defaults to ``init_state`` (or the delocalized state if ``deloc_init_state``).
+
         Returns
         -------
         qutip.Qobj
@@ -239,12 +450,15 @@ class ME_Solver:
             If the Hamiltonian description is not recognized.
         """
 
-        init_state = None
+        deloc_init_state = init_state is None and self.me_kwargs["deloc_init_state"]
+        if init_state is None:
+            init_state = self.init_state
+        init_matrix = None
 
         # 2P description
         if self.tb_ham.description == "2P":
             # new: initial state delocalized over all exciton states. This correspopnds to the initial state of the whole system.
-            if self.me_kwargs["deloc_init_state"]:
+            if deloc_init_state:
                 tb_basis = self.tb_ham.tb_basis
                 init_states = [
                     get_eh_observable(tb_basis, "exciton", state, state)
@@ -254,28 +468,31 @@ class ME_Solver:
                     init_states = [
                         add_groundstate(init_state) for init_state in init_states
                     ]
-                init_state = 1 / len(tb_basis) * q.Qobj(np.sum(init_states, axis=0))
+                init_matrix = 1 / len(tb_basis) * q.Qobj(np.sum(init_states, axis=0))
 
             # old: initial state localized on a single exciton state
             else:
-                init_state_idx = self.tb_ham.eh_basis.index(self.init_state)
+                init_state_idx = self.tb_ham.eh_basis.index(init_state)
                 if self.tb_ham.relaxation:
-                    init_state = q.fock_dm(self.tb_ham.matrix_dim, init_state_idx + 1)
+                    init_matrix = q.fock_dm(self.tb_ham.matrix_dim, init_state_idx + 1)
                 else:
-                    init_state = q.fock_dm(self.tb_ham.matrix_dim, init_state_idx)
+                    init_matrix = q.fock_dm(self.tb_ham.matrix_dim, init_state_idx)
 
         # 1P description
         elif self.tb_ham.description == "1P":
-            init_state_idx = self.tb_ham.tb_basis.index(self.init_state)
-            init_state = q.fock_dm(self.tb_ham.matrix_dim, init_state_idx)
+            init_state_idx = self.tb_ham.tb_basis.index(init_state)
+            init_matrix = q.fock_dm(self.tb_ham.matrix_dim, init_state_idx)
 
-        assert init_state is not None, "Initial state is not defined."
-        return init_state
+        assert init_matrix is not None, "Initial state is not defined."
+        return init_matrix
 
     def _run_mesolve(self, **kwargs):
         """
         Run the mesolve function with the given arguments.
 
+        The integration method and the options ``atol``, ``rtol``, ``nsteps`` and
+        ``max_step`` are passed to both qutip 4 and 5.
+
         Parameters
         ----------
         **kwargs : dict
@@ -284,10 +501,17 @@ class ME_Solver:
 
         Returns
         -------
-        list
-            List of states resulting from the mesolve function.
+        list or dict
+            List of states resulting from the mesolve function if no observables are
+            given, otherwise a dictionary with the expectation values of the observables.
         """
 
+        store_final_state = kwargs.pop("store_final_state", False)
+        options = {
+            **kwargs["options"],
+            "method": self._get_solver_method(),
+            "store_final_state": store_final_state,
+        }
         if self.qutip_version == "5":
             kwargs["H"] = kwargs["H"].to(data_type="CSR")
             kwargs["rho0"] = kwargs["rho0"].to(data_type="CSR")
@@ -295,15 +519,1151 @@ class ME_Solver:
             kwargs["e_ops"] = {
                 key: e_op.to(data_type="CSR") for key, e_op in kwargs["e_ops"].items()
             }
-            kwargs["options"]["normalize_output"] = False
-            kwargs["options"]["progress_bar"] = False
+            kwargs["options"] = {
+                **options,
+                "normalize_output": False,
+                "progress_bar": False,
+            }
 
         if self.qutip_version == "4":
-            kwargs["options"] = None
+            kwargs["options"] = q.Options(**options)
+
+        result = q.mesolve(**kwargs)
+        if kwargs["e_ops"] == {}:
+            return result.states
+        if store_final_state:
+            self.final_state = result.final_state
+
+        # the expectation values are stored differently in qutip 4 and 5
+        if self.qutip_version == "5":
+            return result.e_data
+        return result.expect
+
+    def _get_ham_eigensystem(self):
+        """Returns the eigensystem of the Hamiltonian matrix including the ground state
+        (if it is part of the Hamiltonian matrix)."""
+
+        if self.use_symmetry:
+            perm = self.tb_ham.get_symmetry_perm()
+            if perm is not None:
+                return get_sector_eigensystem(self.tb_ham.matrix, perm)
+
+        eigv, eigs = self.tb_ham.get_eigensystem()
+
+        # the ground state is decoupled and has zero energy
+        if self.tb_ham.description == "2P" and self.tb_ham.relaxation:
+            eigv = np.r_[0, eigv]
+            eigs = add_groundstate(eigs)
+            eigs[0, 0] = 1
+        return eigv, eigs
+
+    def _run_unitary(self, **kwargs):
+        """Propagate the initial state exactly with the eigensystem of the Hamiltonian.
+        Only valid if there are no collapse operators.
+
+        Parameters
+        ----------
+        **kwargs : dict
+            The same keyword arguments as for :meth:`_run_mesolve`.
+
+        Returns
+        -------
+        np.ndarray or dict
+            Array of density matrices if no observables are given, otherwise a
+            dictionary with the expectation values of the observables.
+        """
+
+        assert not kwargs["c_ops"], "the unitary engine requires empty c_ops"
+        eigv, eigs = self._get_ham_eigensystem()
+
+        init_dm = kwargs["rho0"].full()
+        if kwargs["e_ops"] == {}:
+            return get_dm_fourier(kwargs["tlist"], init_dm, eigv, eigs)
+
+        e_ops = np.array([e_op.full() for e_op in kwargs["e_ops"].values()])
+        values = get_expect_fourier(kwargs["tlist"], init_dm, eigv, eigs, e_ops)
+        if kwargs["store_final_state"]:
+            final_dm = get_dm_fourier(kwargs["tlist"][-1:], init_dm, eigv, eigs)[0]
+            self.final_state = q.Qobj(final_dm)
+
+        return _get_expect_dict(kwargs["e_ops"], values)
+
+    def get_liouvillian(self):
+        """Calculate and return the Liouvillian superoperator of the master equation
+        from the Hamiltonian matrix and the dissipator of the collapse operators. If
+        ``reduce_groundstate`` is set, the rows and columns of the coherences between
+        the ground state and the excited states are removed (also from the spectrum). If
+        ``use_symmetry`` is set and the Liouvillian is invariant under the reflection of
+        the sequence, it is returned in the basis of the symmetry sectors occupied by
+        the initial state (block-diagonal with the dimensions ``sector_dims``). The
+        Liouvillian is assembled in double precision and then cast to ``dtype``.
+
+        Returns
+        -------
+        scipy.sparse.csr_matrix
+            The Liouvillian acting on column-stacked density matrices.
+        """
+
+        if self.liouvillian is None:
+            # the (possibly sparse) Hamiltonian matrix is used directly, such that it
+            # is not densified by qutip
+            liouvillian = get_liouvillian(
+                self.tb_ham.matrix, dissipator=self.lindblad_diss.get_dissipator()
+            )
+            if self._vec_idx is not None:
+                liouvillian = liouvillian[self._vec_idx][:, self._vec_idx]
+            if self.use_symmetry:
+                self._set_sectors(liouvillian)
+            if self._sector_basis is not None:
+                basis = self._sector_basis
+                liouvillian = sp.csr_matrix(basis.T @ liouvillian @ basis)
+            self.liouvillian = liouvillian.astype(self.dtype)
+        return self.liouvillian
+
+    def _set_sectors(self, liouvillian):
+        """Sets the basis of the reflection symmetry sectors of the Liouvillian that are
+        occupied by the initial state. Nothing is set if the sequence is not symmetric
+        or the dissipator breaks the symmetry."""
+
+        perm = self.tb_ham.get_symmetry_perm()
+        if perm is None:
+            return
+        vec_perm = get_liouville_perm(perm)
+        if self._vec_idx is not None:
+            # the kept elements are mapped onto each other
+            position = np.zeros(len(vec_perm), dtype=int)
+            position[self._vec_idx] = np.arange(len(self._vec_idx))
+            vec_perm = position[vec_perm[self._vec_idx]]
+        if not is_perm_symmetric(liouvillian, vec_perm):
+            return
+
+        init_vec = vectorize_dm(self.init_matrix)
+        if self._vec_idx is not None:
+            init_vec = init_vec[self._vec_idx]
+        sector_bases = [
+            basis
+            for basis in get_sector_basis(vec_perm)
+            if basis.shape[1] and np.linalg.norm(basis.T @ init_vec) > 1e-12
+        ]
+        self._sector_basis = sp.hstack(sector_bases, format="csr")
+        self.sector_dims = [basis.shape[1] for basis in sector_bases]
+
+    def _get_sector_blocks(self, matrix):
+        """Returns the diagonal blocks of a matrix in the basis of the symmetry
+        sectors."""
+
+        bounds = np.cumsum([0] + self.sector_dims)
+        return [matrix[a:b, a:b] for a, b in zip(bounds[:-1], bounds[1:])]
+
+    def _vectorize(self, dm):
+        """Vectorizes a density matrix for the Liouvillian engines. If
+        ``reduce_groundstate`` is set, only the ground state population and the excited
+        block are kept. If ``use_symmetry`` is set, the vector is expressed in the basis
+        of the symmetry sectors."""
+
+        vec = vectorize_dm(dm)
+        if self._vec_idx is not None:
+            vec = vec[self._vec_idx]
+        self.get_liouvillian()
+        if self._sector_basis is not None:
+            sector_vec = self._sector_basis.T @ vec
+            assert np.allclose(
+                self._sector_basis @ sector_vec, vec
+            ), "the density matrix occupies a symmetry sector of no initial state"
+            vec = sector_vec
+        return vec.astype(self.dtype)
+
+    def _unvectorize(self, vec):
+        """Reshapes vectors of the Liouvillian engines into density matrices (inverse of
+        :meth:`_vectorize`, where the dropped ground state coherences are zero)."""
+
+        if self._sector_basis is not None:
+            vec = (self._sector_basis @ vec.T).T
+        if self._vec_idx is not None:
+            full_vec = np.zeros(
+                vec.shape[:-1] + (self.tb_ham.matrix_dim**2,), dtype=vec.dtype
+            )
+            full_vec[..., self._vec_idx] = vec
+            vec = full_vec
+        return unvectorize_dm(vec)
+
+    def _get_e_ops_matrix(self, e_ops):
+        """Stacks observables into a matrix that acts on the vectors of
+        :meth:`_vectorize`."""
+
+        e_ops_matrix = get_e_ops_matrix(e_ops)
+        if self._vec_idx is not None:
+            e_ops_matrix = e_ops_matrix[:, self._vec_idx]
+        self.get_liouvillian()
+        if self._sector_basis is not None:
+            e_ops_matrix = (self._sector_basis.T @ e_ops_matrix.T).T
+        return e_ops_matrix.astype(self.dtype)
+
+    def _get_propagator(self, dt):
+        """Returns the one-step propagator for the time step ``dt``. The propagator is
+        only recalculated if the time step changes (beyond rounding errors of the time
+        grid). The blocks of the symmetry sectors are exponentiated separately."""
+
+        if self._propagator is None or not np.isclose(
+            self._propagator[0], dt, rtol=1e-10, atol=0
+        ):
+            liouvillian = self.get_liouvillian()
+            if self.sector_dims is None:
+                propagator = get_propagator(liouvillian, dt)
+            else:
+                blocks = self._get_sector_blocks(liouvillian)
+                propagator = sp.block_diag(
+                    [sp.csr_matrix(get_propagator(block, dt)) for block in blocks],
+                    format="csr",
+                )
+            self._propagator = (dt, propagator)
+        return self._propagator[1]
+
+    def _run_propagator(self, **kwargs):
+        """Propagate the initial state on the uniform time grid with the precomputed
+        one-step propagator of the Liouvillian.
+
+        Parameters
+        ----------
+        **kwargs : dict
+            The same keyword arguments as for :meth:`_run_mesolve`.
+
+        Returns
+        -------
+        np.ndarray or dict
+            Array of density matrices if no observables are given, otherwise a
+            dictionary with the expectation values of the observables.
+        """
+
+        times = kwargs["tlist"]
+        dt = times[1] - times[0] if len(times) > 1 else 0.0
+        assert np.allclose(
+            np.diff(times), dt
+        ), "the propagator engine requires a uniform time grid"
+
+        propagator = self._get_propagator(dt)
+
+        init_vec = self._vectorize(kwargs["rho0"])
+        if kwargs["e_ops"] == {}:
+            vecs = propagate(propagator, init_vec, len(times))
+            return self._unvectorize(vecs)
+
+        e_ops_matrix = self._get_e_ops_matrix(kwargs["e_ops"].values())
+        values, final_vec = propagate(
+            propagator, init_vec, len(times), e_ops_matrix, return_final=True
+        )
+        if kwargs["store_final_state"]:
+            self.final_state = q.Qobj(self._unvectorize(final_vec))
+        return _get_expect_dict(kwargs["e_ops"], values)
+
+    def get_spectrum(self, num_eigs=None):
+        """Calculate and return the eigensystem of the Liouvillian.
+
+        Parameters
+        ----------
+        num_eigs : int, optional
+            Number of slowest modes calculated with a sparse eigensolver. Default is None,
+            i.e., the Liouvillian is fully diagonalized.
+
+        Returns
+        -------
+        tuple
+            Eigenvalues, right and left eigenvectors of the Liouvillian.
+        """
+
+        if self._spectrum is None or self._spectrum[0] != num_eigs:
+            liouvillian = self.get_liouvillian()
+            if self.sector_dims is None:
+                eigensystem = get_liouvillian_eigensystem(liouvillian, num_eigs)
+            else:
+                # the blocks of the symmetry sectors are diagonalized separately
+                eigensystems = [
+                    get_liouvillian_eigensystem(
+                        block,
+                        None if num_eigs is None else min(num_eigs, block.shape[0] - 2),
+                    )
+                    for block in self._get_sector_blocks(liouvillian)
+                ]
+                eigv, right, left = zip(*eigensystems)
+                eigensystem = (
+                    np.concatenate(eigv),
+                    scipy.linalg.block_diag(*right),
+                    scipy.linalg.block_diag(*left),
+                )
+            self._spectrum = (num_eigs, eigensystem)
+        return self._spectrum[1]
+
+    def get_decay_rates(self, num_rates=None, num_eigs=None):
+        """Calculate the slowest decay rates of the Liouvillian in units of ``1/t_unit``.
+
+        Parameters
+        ----------
+        num_rates : int, optional
+            Number of decay rates. Default is None, i.e., all decay rates.
+        num_eigs : int, optional
+            Number of slowest modes calculated with a sparse eigensolver. Default is None.
+
+        Returns
+        -------
+        np.ndarray
+            The decay rates in ascending order.
+        """
+
+        eigv, _, _ = self.get_spectrum(num_eigs)
+        return get_decay_rates(eigv, num_rates)
+
+    def _run_spectral(self, **kwargs):
+        """Evaluate the states or expectation values at the given times from the
+        eigensystem of the Liouvillian.
+
+        Parameters
+        ----------
+        **kwargs : dict
+            The same keyword arguments as for :meth:`_run_mesolve`.
+
+        Returns
+        -------
+        np.ndarray or dict
+            Array of density matrices if no observables are given, otherwise a
+            dictionary with the expectation values of the observables.
+        """
 
+        eigensystem = self.get_spectrum()
+        eigv, right, left = eigensystem
+        init_vec = self._vectorize(kwargs["rho0"])
         if kwargs["e_ops"] == {}:
-            return q.mesolve(**kwargs).states
-        return q.mesolve(**kwargs)
+            coeffs = left.conj().T @ init_vec
+            vecs = (right * coeffs) @ np.exp(np.outer(eigv, kwargs["tlist"]))
+            return self._unvectorize(vecs.T)
+
+        e_ops_matrix = self._get_e_ops_matrix(kwargs["e_ops"].values())
+        amplitudes = get_spectral_amplitudes(eigensystem, init_vec, e_ops_matrix)
+        values = get_spectral_expect(kwargs["tlist"], eigv, amplitudes)
+        if kwargs["store_final_state"]:
+            coeffs = left.conj().T @ init_vec
+            final_vec = right @ (coeffs * np.exp(eigv * kwargs["tlist"][-1]))
+            self.final_state = q.Qobj(self._unvectorize(final_vec))
+        return _get_expect_dict(kwargs["e_ops"], values)
+
+    def _run_krylov(self, **kwargs):
+        """Propagate the initial state with the action of the matrix exponential of the
+        sparse Liouvillian in a Krylov subspace. The tolerance, the dimension of the
+        Krylov subspace and the memory ceiling for the Krylov basis are set by the
+        ``krylov_tol``, ``krylov_dim`` and ``krylov_max_memory`` (in MB) keyword arguments.
+
+        Parameters
+        ----------
+        **kwargs : dict
+            The same keyword arguments as for :meth:`_run_mesolve`.
+
+        Returns
+        -------
+        np.ndarray or dict
+            Array of density matrices if no observables are given, otherwise a
+            dictionary with the expectation values of the observables.
+        """
+
+        liouvillian = self.get_liouvillian()
+        krylov_dim = get_krylov_dim(
+            liouvillian.shape[0],
+            int(self.me_kwargs["krylov_dim"]),
+            self.me_kwargs["krylov_max_memory"],
+        )
+        krylov_kwargs = {"tol": self.me_kwargs["krylov_tol"], "krylov_dim": krylov_dim}
+
+        init_vec = self._vectorize(kwargs["rho0"])
+        if kwargs["e_ops"] == {}:
+            vecs = krylov_propagate(
+                liouvillian, init_vec, kwargs["tlist"], **krylov_kwargs
+            )
+            return self._unvectorize(vecs)
+
+        e_ops_matrix = self._get_e_ops_matrix(kwargs["e_ops"].values())
+        values, final_vec = krylov_propagate(
+            liouvillian,
+            init_vec,
+            kwargs["tlist"],
+            e_ops_matrix,
+            return_final=True,
+            **krylov_kwargs,
+        )
+        if kwargs["store_final_state"]:
+            self.final_state = q.Qobj(self._unvectorize(final_vec))
+        return _get_expect_dict(kwargs["e_ops"], values)
+
+    def _run_scipy(self, **kwargs):
+        """Integrate the vectorized master equation with the sparse Liouvillian and the
+        ``zvode`` integrator of scipy. The integration method and the options are the
+        same as for :meth:`_run_mesolve`, but qutip is not used: the states and
+        expectation values are calculated from the state vectors and the states are
+        only wrapped into ``qutip.Qobj`` by :meth:`_solve` if they are stored (e.g., by
+        :meth:`get_result`). ``zvode`` always integrates in double precision.
+
+        Parameters
+        ----------
+        **kwargs : dict
+            The same keyword arguments as for :meth:`_run_mesolve`.
+
+        Returns
+        -------
+        np.ndarray or dict
+            Array of density matrices if no observables are given, otherwise a
+            dictionary with the expectation values of the observables.
+        """
+
+        ode_kwargs = {**kwargs["options"], "method": self._get_solver_method()}
+        liouvillian = self.get_liouvillian()
+
+        init_vec = self._vectorize(kwargs["rho0"])
+        if kwargs["e_ops"] == {}:
+            vecs = ode_propagate(liouvillian, init_vec, kwargs["tlist"], **ode_kwargs)
+            return self._unvectorize(vecs)
+
+        e_ops_matrix = self._get_e_ops_matrix(kwargs["e_ops"].values())
+        values, final_vec = ode_propagate(
+            liouvillian,
+            init_vec,
+            kwargs["tlist"],
+            e_ops_matrix,
+            return_final=True,
+            **ode_kwargs,
+        )
+        if kwargs["store_final_state"]:
+            self.final_state = q.Qobj(self._unvectorize(final_vec))
+        return _get_expect_dict(kwargs["e_ops"], values)
+
+    def _run_mcwf(self, **kwargs):
+        """Average the expectation values over quantum trajectories (Monte Carlo wave
+        function method). The number of trajectories, the seed and the number of
+        processes are set by the ``mcwf_num_traj``, ``mcwf_seed`` and ``mcwf_num_cpu``
+        keyword arguments. The standard errors are stored in ``mcwf_std_err``. The final
+        state is not available, such that results cannot be extended in time.
+
+        Parameters
+        ----------
+        **kwargs : dict
+            The same keyword arguments as for :meth:`_run_mesolve`.
+
+        Returns
+        -------
+        dict
+            Dictionary with the expectation values of the observables.
+        """
+
+        assert kwargs["e_ops"] != {}, "the mcwf engine only calculates expectation values"
+        num_cpu = int(self.me_kwargs["mcwf_num_cpu"])
+        if not num_cpu:
+            num_cpu = max(multiprocessing.cpu_count() - 1, 1)
+
+        values, std_err = run_mcwf(
+            kwargs["H"].full(),
+            [c_op.full() for c_op in kwargs["c_ops"]],
+            kwargs["rho0"].full(),
+            kwargs["tlist"],
+            np.array([e_op.full() for e_op in kwargs["e_ops"].values()]),
+            num_traj=int(self.me_kwargs["mcwf_num_traj"]),
+            seed=int(self.me_kwargs["mcwf_seed"]),
+            num_cpu=num_cpu,
+        )
+        self.mcwf_std_err = dict(zip(kwargs["e_ops"].keys(), std_err))
+        return _get_expect_dict(kwargs["e_ops"], values)
+
+    def _get_solver_method(self):
+        """Returns the integration method of qutip and scipy. In the 'auto' mode the stiff BDF
+        method is used if the fastest mode of the Liouvillian decays noticeably within
+        one time step, since the non-stiff Adams method has to resolve it."""
+
+        if self.solver_method == "auto":
+            if self._max_decay_rate is None:
+                self._max_decay_rate = get_max_decay_rate(self.lindblad_diss.c_ops)
+            dt = self.times[1] - self.times[0] if len(self.times) > 1 else self.t_end
+            return "bdf" if self._max_decay_rate * dt > 0.3 else "adams"
+        return self.solver_method
+
+    def _get_solver_engine(self):
+        """Returns the engine used to solve the master equation. In the 'auto' mode the
+        exact unitary propagation is used if the dissipator is empty."""
+
+        if self.solver_engine == "auto":
+            if not self.lindblad_diss.c_ops:
+                return "unitary"
+            return "qutip"
+        return self.solver_engine
+
+    def _solve(
+        self, e_ops, rho0=None, times=None, store_final_state=False, as_array=False
+    ):
+        """Solve the master equation once for the given observables.
+
+        Parameters
+        ----------
+        e_ops : dict
+            Dictionary of observables. If empty, the states are returned.
+        rho0 : qutip.Qobj, optional
+            Initial density matrix. Defaults to ``init_matrix``.
+        times : np.ndarray, optional
+            Time points starting at zero. Defaults to ``times``.
+        store_final_state : bool, optional
+            If True, the state at the last time point is stored in ``final_state`` (None
+            if the engine does not provide it). Default is False.
+        as_array : bool, optional
+            If True, the states are returned as an array of density matrices instead of
+            a list of ``qutip.Qobj``. Default is False.
+
+        Returns
+        -------
+        list, np.ndarray or dict
+            List or array of states or dictionary with the expectation values of the
+            observables.
+        """
+
+        if store_final_state:
+            self.final_state = None
+        kwargs = {
+            "H": self.ham_matrix,
+            "rho0": self.init_matrix if rho0 is None else rho0,
+            "tlist": self.times if times is None else times,
+            "c_ops": self.lindblad_diss.c_ops,
+            "e_ops": e_ops,
+            "options": self.options,
+            "store_final_state": store_final_state,
+        }
+        solver_engine = self._get_solver_engine()
+        if solver_engine == "unitary":
+            result = self._run_unitary(**kwargs)
+        elif solver_engine == "propagator":
+            result = self._run_propagator(**kwargs)
+        elif solver_engine == "spectral":
+            result = self._run_spectral(**kwargs)
+        elif solver_engine == "krylov":
+            result = self._run_krylov(**kwargs)
+        elif solver_engine == "scipy":
+            result = self._run_scipy(**kwargs)
+        elif solver_engine == "mcwf":
+            result = self._run_mcwf(**kwargs)
+        else:
+            result = self._run_mesolve(**kwargs)
+
+        # the Liouvillian engines return arrays of density matrices, which are only
+        # wrapped into qutip.Qobj if the states are stored
+        if e_ops == {}:
+            if isinstance(result, list) and as_array:
+                result = np.array([dm.full() for dm in result])
+            elif not isinstance(result, list) and not as_array:
+                result = [q.Qobj(dm) for dm in result]
+            if store_final_state:
+                self.final_state = q.Qobj(result[-1]) if as_array else result[-1]
+        return result
+
+    def _get_pop_ops(self):
+        """Returns the population operators for the Hamiltonian description."""
+
+        e_ops = None
+        if self.tb_ham.description == "2P":
+            e_ops = self.lindblad_diss.pop_ops
+        elif self.tb_ham.description == "1P":
+            keys = [
+                self.tb_ham.particles[0] + "_" + tb_site
+                for tb_site in self.tb_ham.tb_basis
+            ]
+            values = [
+                q.fock_dm(self.tb_ham.matrix_dim, i)
+                for i in range(self.tb_ham.matrix_dim)
+            ]
+            e_ops = dict(zip(keys, values))
+        assert e_ops is not None, "Population operators are not defined."
+        return e_ops
+
+    def _get_coh_ops(self):
+        """Returns the coherence operators for the Hamiltonian description."""
+
+        e_ops = None
+        if self.tb_ham.description == "2P":
+            e_ops = self.lindblad_diss.coh_ops
+        if self.tb_ham.description == "1P":
+            keys = [
+                self.tb_ham.particles[0] + "_" + tb_site1 + "_" + tb_site2
+                for tb_site1, tb_site2 in permutations(self.tb_ham.tb_basis, 2)
+            ]
+            values = [
+                q.basis(self.tb_ham.matrix_dim, i)
+                * q.basis(self.tb_ham.matrix_dim, j).dag()
+                for i, j in permutations(range(self.tb_ham.matrix_dim), 2)
+            ]
+            e_ops = dict(zip(keys, values))
+        assert e_ops is not None, "Coherence operators are not defined."
+        return e_ops
+
+    def _get_groundstate_pop_ops(self):
+        """Returns the ground state population operator."""
+
+        assert self.tb_ham.description == "2P", "only available for 2P description"
+        assert self.tb_ham.relaxation, "only defined if relaxation is True"
+        return self.lindblad_diss.groundstate_pop_ops
+
+    def _solve_batch(self, e_ops, init_matrices):
+        """Solve the master equation for several initial states that share the
+        Hamiltonian, the dissipator and the precomputed propagator or eigensystem. The
+        propagator engine applies the dense one-step propagator to the stacked columns
+        of all initial states and the scipy engine integrates them as one stacked ODE.
+        The krylov engine propagates the columns one after another with the shared
+        sparse Liouvillian, the other engines solve the initial states separately.
+
+        Parameters
+        ----------
+        e_ops : dict
+            Dictionary of observables.
+        init_matrices : list of qutip.Qobj
+            Initial density matrices.
+
+        Returns
+        -------
+        dict
+            Expectation values of shape (M, T) for each observable.
+        """
+
+        solver_engine = self._get_solver_engine()
+        if solver_engine not in ["propagator", "krylov", "scipy"]:
+            results = [self._solve(e_ops, rho0=rho0) for rho0 in init_matrices]
+            return {key: np.array([res[key] for res in results]) for key in e_ops}
+
+        # the initial states are vectorized as columns of one matrix
+        init_vecs = np.array([self._vectorize(rho0) for rho0 in init_matrices]).T
+        e_ops_matrix = self._get_e_ops_matrix(e_ops.values())
+        if solver_engine == "propagator":
+            dt = self.times[1] - self.times[0] if self.t_steps > 1 else 0.0
+            propagator = self._get_propagator(dt)
+            values = propagate(propagator, init_vecs, self.t_steps, e_ops_matrix)
+        elif solver_engine == "krylov":
+            liouvillian = self.get_liouvillian()
+            krylov_dim = get_krylov_dim(
+                liouvillian.shape[0],
+                int(self.me_kwargs["krylov_dim"]),
+                self.me_kwargs["krylov_max_memory"],
+            )
+            values = np.stack(
+                [
+                    krylov_propagate(
+                        liouvillian,
+                        init_vec,
+                        self.times,
+                        e_ops_matrix,
+                        tol=self.me_kwargs["krylov_tol"],
+                        krylov_dim=krylov_dim,
+                    )
+                    for init_vec in init_vecs.T
+                ],
+                axis=-1,
+            )
+        else:
+            # the columns are stacked into one vector of the block-diagonal system
+            num_states = init_vecs.shape[1]
+            identity = sp.identity(num_states, format="csr")
+            values = ode_propagate(
+                sp.kron(identity, self.get_liouvillian(), format="csr"),
+                init_vecs.ravel(order="F"),
+                self.times,
+                sp.kron(identity, e_ops_matrix, format="csr"),
+                **self.options,
+                method=self._get_solver_method(),
+            )
+            values = values.reshape(num_states, len(e_ops), -1).transpose(1, 2, 0)
+        values = np.transpose(values, (0, 2, 1))
+        return _get_expect_dict(e_ops, values)
+
+    def get_pop_batch(self, init_states):
+        """Calculate the populations for several initial states at once.
+
+        Parameters
+        ----------
+        init_states : list
+            List of initial states, i.e., tuples of electron and hole states for the 2P
+            description or tight-binding sites for the 1P description.
+
+        Returns
+        -------
+        dict
+            Population tensor of shape (M, T, N) indexed by [init_state, time, site] for
+            each particle, where the sites are ordered as in ``tb_basis``.
+
+        Examples
+        --------
+        >>> me_solver = get_me_solver("GCG", "ELM")
+        >>> init_states = [("(0, 0)", "(0, 0)"), ("(0, 1)", "(0, 1)")]
+        >>> me_solver.get_pop_batch(init_states)["electron"].shape
+        (2, 500, 6)
+        """
+
+        init_matrices = [self.get_init_matrix(init_state) for init_state in init_states]
+        expect = self._solve_batch(self._get_pop_ops(), init_matrices)
+
+        pop_batch = {}
+        for particle in self.tb_ham.particles:
+            pop_batch[particle] = np.stack(
+                [
+                    expect[particle + "_" + tb_site]
+                    for tb_site in self.tb_ham.tb_basis
+                ],
+                axis=-1,
+            )
+        return pop_batch
+
+    def observe(self, quantities="all", e_ops=None):
+        """Calculate several observables with a single integration of the master
+        equation. All requested quantities that are not cached yet are collected into
+        one dictionary of observables, the master equation is solved once and the
+        results are distributed to ``pop``, ``coh``, ``groundstate_pop`` and ``expect``.
+
+        Parameters
+        ----------
+        quantities : list of str or str, optional
+            List of quantities to calculate. Possible values are "pop", "coh" and
+            "groundstate_pop". If "all", all quantities available for the Hamiltonian
+            description are calculated. Default is "all".
+        e_ops : dict, optional
+            Dictionary of custom observables (``np.ndarray`` or ``qutip.Qobj``) whose
+            expectation values are stored in ``expect`` under the same keys.
+
+        Returns
+        -------
+        tuple
+            pop : dict
+                Population of each particle on each tight-binding site.
+            coh : dict
+                Coherence of each particle.
+            groundstate_pop : dict
+                Ground state population.
+            expect : dict
+                Expectation values of the custom observables.
+
+        Examples
+        --------
+        >>> me_solver = get_me_solver("GCG", "ELM", relax_rate=3)
+        >>> pop, coh, groundstate_pop, _ = me_solver.observe()
+        """
+
+        if quantities == "all":
+            quantities = ["pop", "coh"]
+            if self.tb_ham.description == "2P" and self.tb_ham.relaxation:
+                quantities.append("groundstate_pop")
+        if e_ops is None:
+            e_ops = {}
+
+        # collect all observables that are not calculated yet
+        all_e_ops = {}
+        if "pop" in quantities and not self.pop:
+            all_e_ops.update(self._get_pop_ops())
+        if "coh" in quantities and not self.coh:
+            all_e_ops.update(self._get_coh_ops())
+        if "groundstate_pop" in quantities and not self.groundstate_pop:
+            all_e_ops.update(self._get_groundstate_pop_ops())
+
+        custom_e_ops = {}
+        for key, e_op in e_ops.items():
+            assert key not in all_e_ops, f"custom observable {key} is already defined"
+            if key not in self.expect:
+                custom_e_ops[key] = e_op if isinstance(e_op, q.Qobj) else q.Qobj(e_op)
+
+        # solve the master equation once with all observables
+        if not all_e_ops and not custom_e_ops:
+            return self.pop, self.coh, self.groundstate_pop, self.expect
+        expect = self._solve({**all_e_ops, **custom_e_ops}, store_final_state=True)
+
+        quantities = [
+            quantity
+            for quantity in ["pop", "coh", "groundstate_pop"]
+            if quantity in quantities and not vars(self)[quantity]
+        ]
+        self._store_observables(expect, quantities, custom_e_ops)
+        return self.pop, self.coh, self.groundstate_pop, self.expect
+
+    def _store_observables(self, expect, quantities, custom_e_ops, append=False):
+        """Distributes the expectation values to ``pop``, ``coh``, ``groundstate_pop``
+        and ``expect``. If ``append`` is True, the values are appended to the stored
+        values (without the first time point, which is already stored)."""
+
+        values = {}
+
+        # store the population values
+        if "pop" in quantities:
+            for particle in self.tb_ham.particles:
+                for tb_site in self.tb_ham.tb_basis:
+                    key = particle + "_" + tb_site
+                    values[("pop", key)] = expect[key]
+
+        # store the coherence values
+        if "coh" in quantities:
+            for particle in self.tb_ham.particles:
+                values[("coh", particle)] = 0
+                for tb_site1, tb_site2 in permutations(self.tb_ham.tb_basis, 2):
+                    key = particle + "_" + tb_site1 + "_" + tb_site2
+                    values[("coh", particle)] += np.abs(expect[key])
+
+        # store the ground state population values
+        if "groundstate_pop" in quantities:
+            values[("groundstate_pop", "groundstate")] = expect["groundstate"]
+
+        # store the expectation values of the custom observables
+        for key, e_op in custom_e_ops.items():
+            self._custom_e_ops[key] = e_op
+            values[("expect", key)] = expect[key]
+
+        for (quantity, key), value in values.items():
+            if append:
+                value = np.r_[vars(self)[quantity][key], value[1:]]
+            vars(self)[quantity][key] = value
+
+    def get_time_average(self, quantities=None, e_ops=None, continuous=False):
+        """Calculate time-averaged expectation values without storing the trajectory.
+        Closed systems use the eigensystem of the Hamiltonian. For open systems, the
+        eigensystem of the Liouvillian is only used by the spectral engine. Otherwise,
+        the continuous time average is obtained from a sparse linear system of the
+        Liouvillian and the mean over ``times`` from the expectation values of the
+        selected engine.
+
+        Parameters
+        ----------
+        quantities : list of str, optional
+            List of linear quantities to average. Possible values are "pop" and
+            "groundstate_pop". Default is None.
+        e_ops : dict, optional
+            Dictionary of custom observables (``np.ndarray`` or ``qutip.Qobj``).
+        continuous : bool, optional
+            If True, the continuous time average over ``[0, t_end]`` is calculated.
+            Otherwise, the mean over ``times`` is calculated. Default is False.
+
+        Returns
+        -------
+        dict
+            Time-averaged expectation values of all requested observables.
+
+        Examples
+        --------
+        >>> me_solver = get_me_solver("GCG", "ELM")
+        >>> avg_pop = me_solver.get_time_average(quantities=["pop"])
+        """
+
+        all_e_ops = {}
+        if quantities is not None:
+            if "pop" in quantities:
+                all_e_ops.update(self._get_pop_ops())
+            if "groundstate_pop" in quantities:
+                all_e_ops.update(self._get_groundstate_pop_ops())
+        if e_ops is not None:
+            for key, e_op in e_ops.items():
+                assert key not in all_e_ops, f"custom observable {key} is already defined"
+                all_e_ops[key] = e_op if isinstance(e_op, q.Qobj) else q.Qobj(e_op)
+
+        if self._get_solver_engine() == "unitary":
+            eigv, eigs = self._get_ham_eigensystem()
+            e_ops_array = np.array([e_op.full() for e_op in all_e_ops.values()])
+            values = get_time_average_fourier(
+                self.times, self.init_matrix.full(), eigv, eigs, e_ops_array, continuous
+            )
+        elif self._get_solver_engine() == "spectral":
+            eigensystem = self.get_spectrum()
+            amplitudes = get_spectral_amplitudes(
+                eigensystem,
+                self._vectorize(self.init_matrix),
+                self._get_e_ops_matrix(all_e_ops.values()),
+            )
+            values = get_spectral_time_average(
+                self.times, eigensystem[0], amplitudes, continuous
+            )
+        else:
+            values = None
+            t_end = self.times[-1] - self.times[0]
+            if continuous:
+                liouvillian = self.get_liouvillian()
+                krylov_dim = get_krylov_dim(
+                    liouvillian.shape[0],
+                    int(self.me_kwargs["krylov_dim"]),
+                    self.me_kwargs["krylov_max_memory"],
+                )
+                trace_op = q.qeye(self.tb_ham.matrix_dim)
+                try:
+                    values = get_sparse_time_average(
+                        liouvillian,
+                        self._vectorize(self.init_matrix),
+                        self._get_e_ops_matrix(all_e_ops.values()),
+                        t_end,
+                        self._get_e_ops_matrix([trace_op])[0],
+                        tol=self.me_kwargs["krylov_tol"],
+                        krylov_dim=krylov_dim,
+                    )
+                except np.linalg.LinAlgError:
+                    pass
+
+            # fall back to the trajectory of the expectation values
+            if values is None:
+                expect = self._solve(all_e_ops)
+                values = np.array([expect[key] for key in all_e_ops])
+                if continuous:
+                    values = scipy.integrate.trapezoid(values, self.times) / t_end
+                else:
+                    values = np.mean(values, axis=-1)
+        return _get_expect_dict(all_e_ops, values)
+
+    def get_event_time(
+        self,
+        e_op,
+        threshold,
+        direction=1,
+        chunk_size=None,
+        refine=True,
+        max_t_end=None,
+    ):
+        """Integrate the master equation chunk by chunk and stop as soon as the
+        expectation value of an observable crosses a threshold.
+
+        Parameters
+        ----------
+        e_op : qutip.Qobj or np.ndarray
+            The observable.
+        threshold : float
+            The threshold for the expectation value.
+        direction : int, optional
+            1 for an upward crossing (value >= threshold), -1 for a downward crossing
+            (value <= threshold). Default is 1.
+        chunk_size : int, optional
+            Number of time steps integrated at once. Defaults to a tenth of the time grid.
+        refine : bool, optional
+            If True, the crossing time is refined between the grid points by root finding
+            with the Krylov action of the Liouvillian on the state before the crossing.
+            Otherwise, the first grid point beyond the threshold is returned. Default is True.
+        max_t_end : float, optional
+            If given, the time window is doubled with :meth:`extend` until the threshold
+            is crossed or ``max_t_end`` is reached. Each extension only integrates the
+            new time interval. Default is None.
+
+        Returns
+        -------
+        float or None
+            The crossing time in units of ``t_unit`` or None if the threshold is not
+            crossed within ``times``.
+
+        Examples
+        --------
+        >>> me_solver = get_me_solver("GCG", "ELM", relax_rate=3, unit="rad/ps")
+        >>> gs_op = me_solver.lindblad_diss.groundstate_pop_ops["groundstate"]
+        >>> me_solver.get_event_time(gs_op, 1 - 1 / np.e)
+        0.7700979385918653
+        """
+
+        assert direction in [1, -1], "direction must be 1 or -1"
+        assert (
+            self._get_solver_engine() != "mcwf"
+        ), "the mcwf engine does not provide the states needed to detect the crossing"
+        e_op_matrix = q.Qobj(e_op).full()
+        if chunk_size is None:
+            chunk_size = max(self.t_steps // 10, 1)
+
+        def distance(dm):
+            if isinstance(dm, q.Qobj):
+                dm = dm.full()
+            value = np.trace(e_op_matrix @ dm).real
+            return direction * (value - threshold)
+
+        def extend_window():
+            if max_t_end is None or self.t_end >= max_t_end:
+                return False
+            self.extend(min(2 * self.t_end, max_t_end))
+            return True
+
+        # the spectral engine evaluates the crossing without time stepping
+        if self._get_solver_engine() == "spectral" and refine:
+            if distance(self.init_matrix) >= 0:
+                return self.times[0]
+            eigensystem = self.get_spectrum()
+            amplitudes = get_spectral_amplitudes(
+                eigensystem,
+                self._vectorize(self.init_matrix),
+                self._get_e_ops_matrix([e_op_matrix]),
+            )[0]
+            start = 0
+            while True:
+                crossing_time = get_spectral_crossing_time(
+                    self.times[start:], eigensystem[0], amplitudes, threshold, direction
+                )
+                if crossing_time is not None:
+                    return crossing_time
+                start = self.t_steps - 1
+                if not extend_window():
+                    return None
+
+        prev_t, prev_dm, prev_value = None, None, None
+        stream = self._iter_dms(chunk_size)
+        while True:
+            for t, dm in stream:
+                value = distance(dm)
+                if value < 0:
+                    prev_t, prev_dm, prev_value = t, dm, value
+                    continue
+                if prev_t is None or not refine:
+                    return t
+
+                # root finding between the grid points enclosing the crossing, the
+                # states in between are obtained with the Krylov action of the
+                # Liouvillian (the propagator of the time grid is left untouched)
+                t_step = t - prev_t
+                liouvillian = self.get_liouvillian()
+                prev_vec = self._vectorize(prev_dm)
+                e_op_vec = self._get_e_ops_matrix([e_op_matrix])[0]
+                krylov_kwargs = {
+                    "tol": self.me_kwargs["krylov_tol"],
+                    "krylov_dim": get_krylov_dim(
+                        liouvillian.shape[0],
+                        int(self.me_kwargs["krylov_dim"]),
+                        self.me_kwargs["krylov_max_memory"],
+                    ),
+                }
+
+                def func(tau, t_step=t_step, prev_vec=prev_vec, value=value):
+                    if tau in [0, t_step]:
+                        return prev_value if tau == 0 else value
+                    vec = krylov_expmv(liouvillian, prev_vec, tau, **krylov_kwargs)
+                    return direction * ((e_op_vec @ vec).real - threshold)
+
+                return prev_t + brentq(func, 0, t_step, xtol=1e-8 * t_step)
+
+            # continue the integration from the last state in the extended window
+            start = self.t_steps - 1
+            if not extend_window():
+                return None
+            if self.result:
+                stream = (
+                    (t, dm.full())
+                    for t, dm in zip(self.times[start + 1 :], self.result[start + 1 :])
+                )
+            else:
+                stream = islice(
+                    self._iter_states(prev_dm, self.times[start:], chunk_size), 1, None
+                )
+
+    def iter_result(self, e_ops=None, callback=None, chunk_size=None):
+        """Generator that integrates the master equation chunk by chunk and yields the
+        states (or the expectation values of observables) in time order. Only the states
+        of one chunk are held in memory at a time.
+
+        Parameters
+        ----------
+        e_ops : dict, optional
+            Dictionary of observables (``np.ndarray`` or ``qutip.Qobj``). If given, the
+            expectation values are yielded instead of the states.
+        callback : callable, optional
+            Function ``callback(t, item)`` called for each time step. The stream stops
+            if it returns True.
+        chunk_size : int, optional
+            Number of time steps integrated at once. Defaults to a tenth of the time grid.
+
+        Yields
+        ------
+        tuple
+            The time and the state (``qutip.Qobj``) or a dictionary with the expectation
+            values of the observables.
+
+        Examples
+        --------
+        >>> me_solver = get_me_solver("GCG", "ELM")
+        >>> max_pop = max(dm[1, 1].real for _, dm in me_solver.iter_result())
+        """
+
+        if chunk_size is None:
+            chunk_size = max(self.t_steps // 10, 1)
+        if e_ops is not None:
+            e_ops = {
+                key: e_op if isinstance(e_op, q.Qobj) else q.Qobj(e_op)
+                for key, e_op in e_ops.items()
+            }
+            e_ops_full = [e_op.full() for e_op in e_ops.values()]
+
+        def get_item(dm):
+            if e_ops is None:
+                return q.Qobj(dm)
+            values = [np.trace(e_op @ dm) for e_op in e_ops_full]
+            return _get_expect_dict(e_ops, values)
+
+        for t, dm in self._iter_dms(chunk_size):
+            item = get_item(dm)
+            yield t, item
+            if callback is not None and callback(t, item):
+                return
+
+    def _iter_dms(self, chunk_size):
+        """Generator that yields the times and density matrices (``np.ndarray``) of the
+        time grid. The stored states are reused if the result is already calculated."""
+
+        if self.result:
+            for t, dm in zip(self.times, self.result):
+                yield t, dm.full()
+            return
+        yield from self._iter_states(self.init_matrix, self.times, chunk_size)
+
+    def _iter_states(self, rho, times, chunk_size):
+        """Generator that integrates the master equation chunk by chunk starting from
+        the state ``rho`` at ``times[0]`` and yields the times and density matrices
+        (``np.ndarray``)."""
+
+        for start in range(0, max(len(times) - 1, 1), chunk_size):
+            chunk_times = times[start : start + chunk_size + 1]
+            if not isinstance(rho, q.Qobj):
+                rho = q.Qobj(rho)
+            dms = self._solve(
+                {}, rho0=rho, times=chunk_times - chunk_times[0], as_array=True
+            )
+
+            # the first state of a chunk is the last state of the previous chunk
+            first = 0 if start == 0 else 1
+            yield from zip(chunk_times[first:], dms[first:])
+            rho = dms[-1]
+
+    def get_trajectory(self, diagonal=False, dtype=None, filename=None):
+        """Stores the states in a single contiguous array and returns them as a
+        Trajectory. The states are streamed into the preallocated array, such that the
+        list of ``qutip.Qobj`` is never built.
+
+        Parameters
+        ----------
+        diagonal : bool, optional
+            If True, only the populations are stored. Default is False.
+        dtype : type, optional
+            Data type of the stored elements (``np.complex128`` or ``np.complex64``).
+            Default is None, i.e., the ``dtype`` of the solver.
+        filename : str, optional
+            If given, the array is spilled to a memory-mapped file. Default is None.
+
+        Returns
+        -------
+        Trajectory
+            The trajectory of the states.
+
+        Examples
+        --------
+        >>> me_solver = get_me_solver("GCG", "ELM")
+        >>> pops = me_solver.get_trajectory(diagonal=True).get_pops()
+        """
+
+        if dtype is None:
+            dtype = self.dtype
+        trajectory = self.trajectory
+        if (
+            trajectory is None
+            or trajectory.data.dtype != dtype
+            or (trajectory.diagonal and not diagonal)
+            or filename is not None
+        ):
+            trajectory = Trajectory(
+                self.times,
+                self.init_matrix.shape[0],
+                diagonal=diagonal,
+                dtype=dtype,
+                filename=filename,
+            )
+            chunk_size = max(self.t_steps // 10, 1)
+            for idx, (_, dm) in enumerate(self._iter_dms(chunk_size)):
+                trajectory[idx] = dm
+            self.trajectory = trajectory
+        return trajectory
 
     def get_result(self):
         """Calculate and return the result of the master equation solver. This method
@@ -320,21 +1680,8 @@ class ME_Solver:
 
         # check if the result is already calculated
         if not self.result:
-            # observables
-            e_ops = {}
-            kwargs = {
-                "H": self.ham_matrix,
-                "rho0": self.init_matrix,
-                "tlist": self.times,
-                "c_ops": self.lindblad_diss.c_ops,
-                "e_ops": e_ops,
-                "options": self.options,
-            }
-
             # store the result
-            self.result = self._run_mesolve(
-                **kwargs
-            )  # pylint: disable=attribute-defined-outside-init
+            self.result = self._solve({}, store_final_state=True)
         return self.result
 
     def get_result_particle(self, particle):
@@ -361,11 +1708,9 @@ class ME_Solver:
 
         # check if the result is already calculated
         if not vars(self)["result_" + particle]:
-            # calculate the reduced density matrix for the specified particle
-            reduced_dms = [
-                get_reduced_dm(dm, particle, self.tb_model.tb_basis)
-                for dm in self.result
-            ]
+            # calculate the reduced density matrices for all time steps at once
+            dms = np.array([dm.full() for dm in self.result])
+            reduced_dms = list(get_reduced_dm(dms, particle, self.tb_model.tb_basis))
 
             # store the reduced density matrix
             vars(self)["result_" + particle] = reduced_dms
@@ -391,48 +1736,10 @@ class ME_Solver:
             - The method supports two types of Hamiltonian descriptions: "2P" and "1P".
             - For "2P" description, it uses the population operators from ``self.lindblad_diss.pop_ops``.
             - For "1P" description, it constructs the population operators based on the tight-binding basis ``self.tb_ham.tb_basis``.
-            - The master equation is solved using ``qutip.mesolve`` with the Hamiltonian matrix, initial state, time points, collapse operators, and population operators.
+            - Use :meth:`observe` to calculate populations, coherences and ground state populations in a single integration.
         """
 
-        # check if the population is already calculated
-        if not self.pop:
-            # observables for the population
-            e_ops = None
-            if self.tb_ham.description == "2P":
-                e_ops = self.lindblad_diss.pop_ops
-            elif self.tb_ham.description == "1P":
-                keys = [
-                    self.tb_ham.particles[0] + "_" + tb_site
-                    for tb_site in self.tb_ham.tb_basis
-                ]
-                values = [
-                    q.fock_dm(self.tb_ham.matrix_dim, i)
-                    for i in range(self.tb_ham.matrix_dim)
-                ]
-                e_ops = dict(zip(keys, values))
-            assert e_ops is not None, "Population operators are not defined."
-
-            # solve the master equation with observables
-            kwargs = {
-                "H": self.ham_matrix,
-                "rho0": self.init_matrix,
-                "tlist": self.times,
-                "c_ops": self.lindblad_diss.c_ops,
-                "e_ops": e_ops,
-                "options": self.options,
-            }
-            result = self._run_mesolve(**kwargs)
-
-            # store the population values
-            for particle in self.tb_ham.particles:
-                for tb_site in self.tb_ham.tb_basis:
-                    value = 0
-                    if self.qutip_version == "5":
-                        value = result.e_data[particle + "_" + tb_site]
-                    if self.qutip_version == "4":
-                        value = result.expect[particle + "_" + tb_site]
-                    self.pop[particle + "_" + tb_site] = value
-        return self.pop
+        return self.observe(["pop"])[0]
 
     def get_coh(self):
         """Calculate and return the coherence of the system.
@@ -453,52 +1760,7 @@ class ME_Solver:
             the computed coherence values.
         """
 
-        # check if the coherence is already calculated
-        if not self.coh:
-            # observables for the coherence
-            e_ops = None
-            if self.tb_ham.description == "2P":
-                e_ops = self.lindblad_diss.coh_ops
-            if self.tb_ham.description == "1P":
-                keys = [
-                    self.tb_ham.particles[0] + "_" + tb_site1 + "_" + tb_site2
-                    for tb_site1, tb_site2 in permutations(self.tb_ham.tb_basis, 2)
-                ]
-                values = [
-                    q.basis(self.tb_ham.matrix_dim, i)
-                    * q.basis(self.tb_ham.matrix_dim, j).dag()
-                    for i, j in permutations(self.tb_ham.matrix_dim, 2)
-                ]
-                e_ops = dict(zip(keys, values))
-            assert e_ops is not None, "Coherence operators are not defined."
-
-            # solve the master equation with observables
-            kwargs = {
-                "H": self.ham_matrix,
-                "rho0": self.init_matrix,
-                "tlist": self.times,
-                "c_ops": self.lindblad_diss.c_ops,
-                "e_ops": e_ops,
-                "options": self.options,
-            }
-            result = self._run_mesolve(**kwargs)
-
-            # store the coherence values
-            for particle in self.tb_ham.particles:
-                self.coh[particle] = 0
-                for tb_site1, tb_site2 in permutations(self.tb_ham.tb_basis, 2):
-                    value = 0
-                    if self.qutip_version == "5":
-                        value = result.e_data[
-                            particle + "_" + tb_site1 + "_" + tb_site2
-                        ]
-                    if self.qutip_version == "4":
-                        value = result.expect[
-                            particle + "_" + tb_site1 + "_" + tb_site2
-                        ]
-                    self.coh[particle] += np.abs(value)
-
-        return self.coh
+        return self.observe(["coh"])[1]
 
     def get_groundstate_pop(self):
         """Calculate and return the ground state population. This function computes the
@@ -520,37 +1782,20 @@ class ME_Solver:
             If relaxation is not enabled in the Hamiltonian.
         """
 
-        assert self.tb_ham.description == "2P", "only available for 2P description"
-        assert self.tb_ham.relaxation, "only defined if relaxation is True"
-
-        # check if the ground state population is already calculated
-        if not self.groundstate_pop:
+        return self.observe(["groundstate_pop"])[2]
 
-            # observables for the ground state population
-            e_ops = self.lindblad_diss.groundstate_pop_ops
 
-            # solve the master equation with observables
-            kwargs = {
-                "H": self.ham_matrix,
-                "rho0": self.init_matrix,
-                "tlist": self.times,
-                "c_ops": self.lindblad_diss.c_ops,
-                "e_ops": e_ops,
-                "options": self.options,
-            }
-            result = self._run_mesolve(**kwargs)
+# --------------------------------------------------------------------------------------
 
-            # store the ground state population values
-            value = 0
-            if self.qutip_version == "5":
-                value = result.e_data["groundstate"]
-            if self.qutip_version == "4":
-                value = result.expect["groundstate"]
-            self.groundstate_pop["groundstate"] = value
-        return self.groundstate_pop
 
+def _get_expect_dict(e_ops, values):
+    """Assigns the expectation values to the keys of the observables. As in qutip, the
+    expectation values of hermitian observables are real."""
 
-# --------------------------------------------------------------------------------------
+    expect = {}
+    for (key, e_op), value in zip(e_ops.items(), values):
+        expect[key] = value.real if e_op.isherm else value
+    return expect
 
 
 def get_me_solver(upper_strand, tb_model_name, **kwargs):
@@ -0,0 +1,198 @@
+"""Module for solving the Lindblad master equation by an eigendecomposition of the
+Liouvillian. Since the dynamics are linear, expectation values are sums of exponentials
+
+.. math::
+    \\langle O \\rangle(t) = \\sum_m a_m e^{\\lambda_m t},
+
+which can be evaluated at arbitrary times without time stepping.
+
+Shortcuts
+---------
+- eigv: eigenvalues
+- vec: vectorized
+"""
+
+import numpy as np
+import scipy.linalg
+import scipy.sparse as sp
+import scipy.sparse.linalg
+from scipy.optimize import brentq
+
+__all__ = [
+    "get_liouvillian_eigensystem",
+    "get_spectral_amplitudes",
+    "get_spectral_expect",
+    "get_spectral_crossing_time",
+    "get_decay_rates",
+]
+
+# ------------------------------------------------
+
+
+def get_liouvillian_eigensystem(liouvillian, num_eigs=None):
+    """Diagonalizes the Liouvillian.
+
+    Parameters
+    ----------
+    liouvillian : scipy.sparse.spmatrix or np.ndarray
+        The Liouvillian superoperator.
+    num_eigs : int, optional
+        If given, only the ``num_eigs`` slowest modes (eigenvalues with the largest real
+        part) are calculated with a sparse eigensolver. Otherwise, the Liouvillian is fully
+        diagonalized. Default is None.
+
+    Returns
+    -------
+    tuple
+        Eigenvalues of shape (M,), right eigenvectors and left eigenvectors of shape
+        (D^2, M). The left eigenvectors are normalized such that
+        ``left.conj().T @ right`` is the identity.
+
+    Notes
+    -----
+    .. note::
+
+        A partial eigensystem only describes the dynamics once the fast modes have
+        decayed. Eigenvectors of degenerate eigenvalues are matched by their eigenvalues,
+        which might fail for strongly degenerate spectra.
+    """
+
+    if num_eigs is None:
+        if sp.issparse(liouvillian):
+            liouvillian = liouvillian.toarray()
+        eigv, right = scipy.linalg.eig(liouvillian)
+        left = scipy.linalg.inv(right).conj().T
+        return eigv, right, left
+
+    liouvillian = sp.csr_matrix(liouvillian)
+    eigv, right = scipy.sparse.linalg.eigs(liouvillian, k=num_eigs, which="LR")
+    eigv_left, left = scipy.sparse.linalg.eigs(
+        liouvillian.conj().T, k=num_eigs, which="LR"
+    )
+    order = [np.argmin(np.abs(eigv_left.conj() - value)) for value in eigv]
+    left = left[:, order]
+    left /= np.sum(left.conj() * right, axis=0).conj()
+    return eigv, right, left
+
+
+def get_spectral_amplitudes(eigensystem, init_vec, e_ops_matrix):
+    """Calculates the amplitudes of the modes of the Liouvillian in the expectation
+    values of the observables.
+
+    Parameters
+    ----------
+    eigensystem : tuple
+        Eigenvalues, right and left eigenvectors as returned by ``get_liouvillian_eigensystem``.
+    init_vec : np.ndarray
+        The vectorized initial density matrix.
+    e_ops_matrix : np.ndarray
+        Observables as returned by ``get_e_ops_matrix`` of shape (K, D^2).
+
+    Returns
+    -------
+    np.ndarray
+        The amplitudes of shape (K, M).
+    """
+
+    _, right, left = eigensystem
+    coeffs = left.conj().T @ init_vec
+    return (e_ops_matrix @ right) * coeffs
+
+
+def get_spectral_expect(times, eigv, amplitudes):
+    """Evaluates the expectation values from the spectral amplitudes.
+
+    Parameters
+    ----------
+    times : np.ndarray
+        Time points of shape (T,).
+    eigv : np.ndarray
+        Eigenvalues of the Liouvillian of shape (M,).
+    amplitudes : np.ndarray
+        Amplitudes of shape (K, M) as returned by ``get_spectral_amplitudes``.
+
+    Returns
+    -------
+    np.ndarray
+        The expectation values of shape (K, T).
+
+    Examples
+    --------
+    >>> get_spectral_expect(np.array([0, 1]), np.array([0, -1]), np.array([[1, -1]]))
+    array([[0.        , 0.63212056]])
+    """
+
+    return amplitudes @ np.exp(np.outer(eigv, times))
+
+
+def get_spectral_crossing_time(times, eigv, amplitudes, threshold, direction=1):
+    """Calculates the first time at which an expectation value crosses a threshold. The
+    crossing is bracketed on the time grid and refined by root finding.
+
+    Parameters
+    ----------
+    times : np.ndarray
+        Time grid used to bracket the crossing.
+    eigv : np.ndarray
+        Eigenvalues of the Liouvillian of shape (M,).
+    amplitudes : np.ndarray
+        Amplitudes of a single observable of shape (M,).
+    threshold : float
+        The threshold for the expectation value.
+    direction : int, optional
+        1 for an upward crossing, -1 for a downward crossing. Default is 1.
+
+    Returns
+    -------
+    float or None
+        The crossing time or None if the threshold is not crossed within ``times``.
+
+    Examples
+    --------
+    >>> times = np.linspace(0, 5, 11)
+    >>> get_spectral_crossing_time(times, np.array([0, -1]), np.array([1, -1]), 0.5)
+    0.6931471805599645
+    """
+
+    def func(t):
+        return direction * (np.real(amplitudes @ np.exp(eigv * t)) - threshold)
+
+    values = direction * (
+        get_spectral_expect(times, eigv, amplitudes[np.newaxis])[0].real - threshold
+    )
+    crossed = np.nonzero(values >= 0)[0]
+    if crossed.size == 0:
+        return None
+    idx = crossed[0]
+    if idx == 0:
+        return times[0]
+    return brentq(func, times[idx - 1], times[idx], xtol=1e-8 * (times[1] - times[0]))
+
+
+def get_decay_rates(eigv, num_rates=None, tol=1e-10):
+    """Returns the slowest decay rates of the Liouvillian, i.e., the negative real parts
+    of its eigenvalues sorted in ascending order. Stationary modes are excluded.
+
+    Parameters
+    ----------
+    eigv : np.ndarray
+        Eigenvalues of the Liouvillian.
+    num_rates : int, optional
+        Number of decay rates to return. Default is None, i.e., all decay rates.
+    tol : float, optional
+        Decay rates below this tolerance are considered stationary. Default is 1e-10.
+
+    Returns
+    -------
+    np.ndarray
+        The decay rates.
+
+    Examples
+    --------
+    >>> get_decay_rates(np.array([0, -2 + 1j, -2 - 1j, -0.5]))
+    array([0.5, 2. , 2. ])
+    """
+
+    rates = np.sort(-np.real(eigv))
+    rates = rates[rates > tol]
+    return rates[:num_rates]
@@ -0,0 +1,215 @@
+"""Module for calculating time-averaged expectation values without integrating the
+trajectory. Each mode of the dynamics evolves as :math:`e^{\\lambda t}`, such that its
+average over the uniform time grid is a geometric series (or an integral for the
+continuous time average) that is summed analytically. For large open systems the
+continuous time average is obtained from a sparse linear system of the Liouvillian
+instead of its eigensystem.
+
+Shortcuts
+---------
+- eigs: eigenvectors
+- eigv: eigenvalues
+- dm: density matrix
+"""
+
+import numpy as np
+import scipy.sparse as sp
+from scipy.sparse.linalg import splu
+
+from .krylov import krylov_expmv
+
+__all__ = [
+    "get_average_factors",
+    "get_time_average_fourier",
+    "get_spectral_time_average",
+    "get_sparse_time_average",
+]
+
+# ------------------------------------------------
+
+
+def get_average_factors(exponents, times, continuous=False):
+    r"""Calculates the time averages of :math:`e^{\lambda t}` for the given exponents.
+
+    Parameters
+    ----------
+    exponents : np.ndarray
+        Complex exponents :math:`\lambda`.
+    times : np.ndarray
+        Uniform time grid.
+    continuous : bool, optional
+        If True, the continuous time average :math:`\frac{1}{T} \int_0^T e^{\lambda t} dt`
+        is calculated. Otherwise, the mean over the time grid is calculated.
+        Default is False.
+
+    Returns
+    -------
+    np.ndarray
+        The average factors with the same shape as ``exponents``.
+
+    Notes
+    -----
+    .. note::
+
+        The mean over the grid :math:`t_k = t_0 + k \Delta t` with :math:`N` time points
+        is the geometric series
+
+        .. math::
+            \frac{1}{N} \sum_{k=0}^{N-1} e^{\lambda t_k}
+            = \frac{e^{\lambda t_0}}{N} \frac{e^{\lambda N \Delta t} - 1}{e^{\lambda \Delta t} - 1}.
+
+    Examples
+    --------
+    >>> get_average_factors(np.array([0, np.log(2)]), np.array([0, 1, 2]))
+    array([1.        +0.j, 2.33333333+0.j])
+    """
+
+    exponents = np.asarray(exponents, dtype=complex)
+    num_steps = len(times)
+    if num_steps == 1:
+        return np.exp(exponents * times[0])
+
+    dt = times[1] - times[0]
+    assert np.allclose(np.diff(times), dt), "the time grid must be uniform"
+
+    if continuous:
+        numerator = np.expm1(exponents * (times[-1] - times[0]))
+        denominator = exponents * (times[-1] - times[0])
+    else:
+        numerator = np.expm1(exponents * dt * num_steps)
+        denominator = np.expm1(exponents * dt) * num_steps
+
+    # modes without decay and oscillation on the grid do not average out
+    stationary = np.abs(denominator) < 1e-12 * max(1, num_steps)
+    factors = np.ones_like(exponents)
+    np.divide(numerator, denominator, out=factors, where=~stationary)
+    return factors * np.exp(exponents * times[0])
+
+
+def get_time_average_fourier(times, init_dm, eigv, eigs, e_ops, continuous=False):
+    """Calculates the time-averaged expectation values of observables of a closed system
+    from the eigensystem of the Hamiltonian.
+
+    Parameters
+    ----------
+    times : np.ndarray
+        Uniform time grid.
+    init_dm : np.ndarray
+        Initial density matrix.
+    eigv : np.ndarray
+        Eigenvalue vector.
+    eigs : np.ndarray
+        Eigenvector matrix.
+    e_ops : np.ndarray
+        Observables of shape (K, D, D).
+    continuous : bool, optional
+        If True, the continuous time average is calculated. Default is False.
+
+    Returns
+    -------
+    np.ndarray
+        Complex time-averaged expectation values of shape (K,).
+    """
+
+    glob_init_dm = eigs.conj().T @ init_dm @ eigs
+    glob_e_ops = eigs.conj().T @ e_ops @ eigs
+
+    # Tr(O rho(t)) = sum_mn O_nm rho_mn(0) exp(-i (E_m - E_n) t)
+    dim = len(eigv)
+    coeffs = (np.transpose(glob_e_ops, (0, 2, 1)) * glob_init_dm).reshape(-1, dim**2)
+    exponents = -1j * np.subtract.outer(eigv, eigv).ravel()
+    return coeffs @ get_average_factors(exponents, times, continuous)
+
+
+def get_spectral_time_average(times, eigv, amplitudes, continuous=False):
+    """Calculates time-averaged expectation values from the eigenvalues of the
+    Liouvillian and the spectral amplitudes of the observables.
+
+    Parameters
+    ----------
+    times : np.ndarray
+        Uniform time grid.
+    eigv : np.ndarray
+        Eigenvalues of the Liouvillian of shape (M,).
+    amplitudes : np.ndarray
+        Amplitudes of shape (K, M) as returned by ``get_spectral_amplitudes``.
+    continuous : bool, optional
+        If True, the continuous time average is calculated. Default is False.
+
+    Returns
+    -------
+    np.ndarray
+        Complex time-averaged expectation values of shape (K,).
+    """
+
+    return amplitudes @ get_average_factors(eigv, times, continuous)
+
+
+def get_sparse_time_average(
+    liouvillian, init_vec, e_ops_matrix, t_end, trace_vec, tol=1e-8, krylov_dim=30
+):
+    r"""Calculates the continuous time-averaged expectation values of an open system
+    from a sparse linear system of the Liouvillian.
+
+    Parameters
+    ----------
+    liouvillian : scipy.sparse.spmatrix
+        The Liouvillian superoperator.
+    init_vec : np.ndarray
+        The vectorized initial density matrix.
+    e_ops_matrix : np.ndarray
+        Observables as returned by ``get_e_ops_matrix`` of shape (K, D^2).
+    t_end : float
+        End of the time interval :math:`[0, T]`.
+    trace_vec : np.ndarray
+        Vector that returns the trace of a vectorized density matrix.
+    tol : float, optional
+        Tolerance of the Krylov approximation of :math:`e^{\mathcal{L} T} \rho_0`.
+        Default is 1e-8.
+    krylov_dim : int, optional
+        Dimension of the Krylov subspace. Default is 30.
+
+    Returns
+    -------
+    np.ndarray
+        Complex time-averaged expectation values of shape (K,).
+
+    Raises
+    ------
+    np.linalg.LinAlgError
+        If the linear system is singular, i.e., the steady state is not unique.
+
+    Notes
+    -----
+    .. note::
+
+        The integral :math:`x = \int_0^T \rho(t) dt` solves
+
+        .. math::
+            \mathcal{L} x = (e^{\mathcal{L} T} - 1) \rho_0.
+
+        Since the Liouvillian preserves the trace, one of its rows is linearly
+        dependent on the others and is replaced by the trace condition
+        :math:`\mathrm{Tr}(x) = T \, \mathrm{Tr}(\rho_0)`.
+    """
+
+    liouvillian = sp.csr_matrix(liouvillian, dtype=complex)
+    init_vec = np.asarray(init_vec, dtype=complex)
+    rhs = krylov_expmv(liouvillian, init_vec, t_end, tol, krylov_dim) - init_vec
+
+    # replace the row with the largest trace weight by the trace condition
+    row = np.argmax(np.abs(trace_vec))
+    matrix = sp.lil_matrix(liouvillian)
+    matrix[row] = trace_vec
+    rhs[row] = t_end * (trace_vec @ init_vec)
+
+    # vanishing pivots of the LU factorization indicate several steady states
+    try:
+        factorization = splu(sp.csc_matrix(matrix))
+    except RuntimeError as err:
+        raise np.linalg.LinAlgError("the steady state is not unique") from err
+    pivots = np.abs(factorization.U.diagonal())
+    if pivots.min() < 1e-12 * pivots.max():
+        raise np.linalg.LinAlgError("the steady state is not unique")
+    integral = factorization.solve(rhs)
+    return e_ops_matrix @ integral / t_end
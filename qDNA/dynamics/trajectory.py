@@ -0,0 +1,196 @@
+"""Module for storing the time evolution of density matrices in a single contiguous
+array."""
+
+import numpy as np
+
+from .reduced_dm import get_reduced_dm
+
+__all__ = ["Trajectory"]
+
+# ------------------------------------------------
+
+
+class Trajectory:
+    """Stores the density matrices of a time evolution in a contiguous array of shape
+    (T, D, D) or, if only the diagonals are stored, (T, D). The array can be stored in
+    single precision and spilled to disk with ``np.memmap``.
+
+    Parameters
+    ----------
+    times : np.ndarray
+        Array of time points.
+    dim : int
+        Dimension of the density matrices.
+    diagonal : bool, optional
+        If True, only the diagonals (populations) are stored. Default is False.
+    dtype : type, optional
+        Data type of the stored elements (``np.complex128`` or ``np.complex64``).
+        Default is ``np.complex128``.
+    filename : str, optional
+        If given, the array is stored in a memory-mapped file. Default is None.
+
+    Attributes
+    ----------
+    times : np.ndarray
+        Array of time points.
+    dim : int
+        Dimension of the density matrices.
+    diagonal : bool
+        Flag for storing only the diagonals.
+    data : np.ndarray or np.memmap
+        The stored density matrices (or diagonals).
+
+    Examples
+    --------
+    >>> me_solver = get_me_solver("GCG", "ELM")
+    >>> trajectory = me_solver.get_trajectory(diagonal=True)
+    >>> trajectory.get_pops().shape
+    (500, 10)
+    """
+
+    def __init__(
+        self, times, dim, diagonal=False, dtype=np.complex128, filename=None
+    ):
+        assert dtype in [
+            np.complex128,
+            np.complex64,
+        ], "dtype must be np.complex128 or np.complex64"
+        self.times = np.asarray(times)
+        self.dim = dim
+        self.diagonal = diagonal
+
+        shape = (len(self.times), dim) if diagonal else (len(self.times), dim, dim)
+        if filename is None:
+            self.data = np.zeros(shape, dtype=dtype)
+        else:
+            self.data = np.memmap(filename, dtype=dtype, mode="w+", shape=shape)
+
+    def __repr__(self):
+        """Returns a string representation of the Trajectory instance."""
+        return f"Trajectory({len(self)}, {self.dim}, {self.diagonal}, {self.data.dtype})"
+
+    def __len__(self):
+        """Returns the number of time points."""
+        return len(self.times)
+
+    def __getitem__(self, idx):
+        """Returns the density matrix (or diagonal) at the given time index."""
+        return self.data[idx]
+
+    def __setitem__(self, idx, dm):
+        """Stores a density matrix (``np.ndarray`` or ``qutip.Qobj``) at the given time
+        index."""
+
+        if hasattr(dm, "full"):
+            dm = dm.full()
+        dm = np.asarray(dm)
+        if self.diagonal and dm.ndim >= 2:
+            dm = np.diagonal(dm, axis1=-2, axis2=-1)
+        self.data[idx] = dm
+
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def from_states(cls, times, states, **kwargs):
+        """Creates a trajectory from an iterable of density matrices without
+        materializing them as a list.
+
+        Parameters
+        ----------
+        times : np.ndarray
+            Array of time points.
+        states : iterable
+            Density matrices (``np.ndarray`` or ``qutip.Qobj``) in time order.
+        kwargs : dict
+            Additional keyword arguments for the Trajectory instance.
+
+        Returns
+        -------
+        Trajectory
+            The trajectory.
+        """
+
+        trajectory = None
+        for idx, dm in enumerate(states):
+            if trajectory is None:
+                trajectory = cls(times, dm.shape[0], **kwargs)
+            trajectory[idx] = dm
+        return trajectory
+
+    @property
+    def nbytes(self):
+        """Returns the memory occupied by the stored array in bytes."""
+        return self.data.nbytes
+
+    def get_pops(self):
+        """Returns the populations (diagonals) of all density matrices.
+
+        Returns
+        -------
+        np.ndarray
+            Populations of shape (T, D).
+        """
+
+        if self.diagonal:
+            return self.data.real
+        return np.diagonal(self.data, axis1=1, axis2=2).real
+
+    def get_coherence(self):
+        """Returns the coherence (absolute sum of the off-diagonals) of all density
+        matrices.
+
+        Returns
+        -------
+        np.ndarray
+            Coherences of shape (T,).
+        """
+
+        assert not self.diagonal, "coherences require the full density matrices"
+        return np.sum(np.abs(self.data), axis=(1, 2)) - np.sum(self.get_pops(), axis=1)
+
+    def expect(self, e_op):
+        """Returns the expectation values of an observable for all density matrices.
+
+        Parameters
+        ----------
+        e_op : np.ndarray or qutip.Qobj
+            The observable.
+
+        Returns
+        -------
+        np.ndarray
+            Complex expectation values of shape (T,).
+
+        Raises
+        ------
+        AssertionError
+            If only the populations are stored and the observable is not diagonal.
+        """
+
+        if hasattr(e_op, "full"):
+            e_op = e_op.full()
+        if self.diagonal:
+            assert (
+                np.count_nonzero(e_op - np.diag(np.diag(e_op))) == 0
+            ), "observables with off-diagonal elements require the full density matrices"
+            return self.data @ np.diag(e_op)
+        return np.einsum("ij,tji->t", e_op, self.data)
+
+    def get_reduced(self, particle, tb_basis):
+        """Returns the reduced density matrices of a particle for all time points.
+
+        Parameters
+        ----------
+        particle : str
+            The particle ('electron', 'hole' or 'exciton').
+        tb_basis : List[str]
+            The tight-binding basis.
+
+        Returns
+        -------
+        np.ndarray
+            Reduced density matrices of shape (T, N, N).
+        """
+
+        assert not self.diagonal, "reductions require the full density matrices"
+        return get_reduced_dm(self.data, particle, tb_basis)
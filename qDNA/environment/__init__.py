@@ -4,5 +4,6 @@ from .therm_rates import *
 from .relax_ops import *
 from .therm_ops import *
 from .deph_ops import *
+from .dissipator import *
 
 from .lindblad import *
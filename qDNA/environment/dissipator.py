@@ -0,0 +1,201 @@
+"""This module provides functions to construct the Lindblad dissipator as a sparse
+superoperator acting on column-stacked density matrices. Besides the general
+construction from a list of collapse operators, the dissipator is assembled directly
+from index lists and rates for the structured operators of the quantum DNA models
+(single-entry jumps, diagonal and eigenbasis projectors), which avoids creating and
+multiplying one operator per rate.
+
+Shortcuts
+---------
+diss: dissipator
+diag: diagonal
+eigs: eigensystem
+dim: dimension
+"""
+
+import numpy as np
+import scipy.sparse as sp
+
+__all__ = [
+    "get_dissipator",
+    "get_jump_dissipator",
+    "get_diag_dissipator",
+    "get_eigenbasis_dissipator",
+]
+
+# number of collapse operators that are densified at once in get_dissipator
+_CHUNK_SIZE = 256
+
+# ----------------------------------------------------
+
+
+def get_dissipator(c_ops):
+    r"""Constructs the Lindblad dissipator of a list of collapse operators.
+
+    Parameters
+    ----------
+    c_ops : list
+        List of collapse operators (``np.ndarray`` or ``qutip.Qobj``) of dimension
+        :math:`D`.
+
+    Returns
+    -------
+    scipy.sparse.csr_matrix or None
+        The dissipator of dimension :math:`D^2` or None if there are no collapse
+        operators.
+
+    Notes
+    -----
+    .. note::
+
+        For column-stacked density matrices the dissipator reads
+
+        .. math::
+            \mathcal{D} = \sum_k \bar{c}_k \otimes c_k
+            - \frac{1}{2} I \otimes C - \frac{1}{2} C^T \otimes I,
+
+        with :math:`C = \sum_k c_k^\dagger c_k`.
+    """
+
+    if not c_ops:
+        return None
+    c_ops = [
+        sp.csr_matrix(c_op.full() if hasattr(c_op, "full") else c_op) for c_op in c_ops
+    ]
+    dim = c_ops[0].shape[0]
+    identity = sp.identity(dim, format="csr")
+
+    # many (typically dense) operators, e.g., thermalizing operators, are summed as
+    # outer products of their vectorizations in chunks instead of one by one
+    if len(c_ops) > dim:
+        jumps = np.zeros((dim**2, dim**2), dtype=complex)
+        c_sum = np.zeros((dim, dim), dtype=complex)
+        for start in range(0, len(c_ops), _CHUNK_SIZE):
+            chunk = [c_op.toarray() for c_op in c_ops[start : start + _CHUNK_SIZE]]
+            chunk = np.array(chunk)
+            c_sum += np.einsum("kji,kjl->il", chunk.conj(), chunk)
+            chunk = chunk.reshape(len(chunk), dim**2)
+            jumps += chunk.conj().T @ chunk
+        # reorder the indices (i, j), (k, l) of conj(c)_ij c_kl to (i, k), (j, l)
+        jumps = jumps.reshape((dim,) * 4).transpose(0, 2, 1, 3)
+        dissipator = sp.csr_matrix(jumps.reshape(dim**2, dim**2))
+        c_sum = sp.csr_matrix(c_sum)
+    else:
+        c_sum = sum(c_op.conj().T @ c_op for c_op in c_ops)
+        dissipator = sum(sp.kron(c_op.conj(), c_op) for c_op in c_ops)
+    dissipator -= 0.5 * (sp.kron(identity, c_sum) + sp.kron(c_sum.T, identity))
+    return sp.csr_matrix(dissipator, dtype=complex)
+
+
+def get_jump_dissipator(dim, rows, cols, rates):
+    r"""Constructs the dissipator of single-entry collapse operators
+    :math:`c_k = \sqrt{\gamma_k} |r_k\rangle \langle c_k|`, e.g., the relaxation to the
+    ground state.
+
+    Parameters
+    ----------
+    dim : int
+        Dimension :math:`D` of the density matrix.
+    rows : array_like
+        Row indices :math:`r_k` (final states).
+    cols : array_like
+        Column indices :math:`c_k` (initial states).
+    rates : array_like
+        Rates :math:`\gamma_k`.
+
+    Returns
+    -------
+    scipy.sparse.csr_matrix
+        The dissipator of dimension :math:`D^2`.
+
+    Examples
+    --------
+    >>> get_jump_dissipator(2, [0], [1], [1.]).toarray().real
+    array([[ 0. ,  0. ,  0. ,  1. ],
+           [ 0. , -0.5,  0. ,  0. ],
+           [ 0. ,  0. , -0.5,  0. ],
+           [ 0. ,  0. ,  0. , -1. ]])
+    """
+
+    rows, cols = np.asarray(rows, dtype=int), np.asarray(cols, dtype=int)
+    rates = np.asarray(rates, dtype=float)
+
+    # population transfer rho_cc -> rho_rr
+    dissipator = sp.coo_matrix(
+        (rates, (rows * (dim + 1), cols * (dim + 1))), shape=(dim**2, dim**2)
+    )
+    # decay of all elements rho_ij involving a decaying state
+    decay_rates = np.bincount(cols, weights=rates, minlength=dim)
+    diagonal = -0.5 * (decay_rates[:, None] + decay_rates[None, :])
+    dissipator += sp.diags(diagonal.ravel(order="F"))
+    return sp.csr_matrix(dissipator, dtype=complex)
+
+
+def _get_diag_factors(amplitudes):
+    r"""Returns the factors :math:`\sum_k a_{ki} \bar{a}_{kj} - \frac{1}{2} |a_{ki}|^2 -
+    \frac{1}{2} |a_{kj}|^2` by which the dissipator of the diagonal collapse operators
+    :math:`c_k = \mathrm{diag}(a_k)` multiplies the density matrix elements."""
+
+    amplitudes = np.atleast_2d(amplitudes)
+    norms = np.sum(np.abs(amplitudes) ** 2, axis=0)
+    return amplitudes.T @ amplitudes.conj() - 0.5 * (norms[:, None] + norms[None, :])
+
+
+def get_diag_dissipator(amplitudes):
+    r"""Constructs the dissipator of diagonal collapse operators
+    :math:`c_k = \mathrm{diag}(a_k)`, e.g., the local dephasing. The dissipator is
+    diagonal and multiplies each density matrix element :math:`\rho_{ij}` by
+    :math:`\sum_k a_{ki} \bar{a}_{kj} - \frac{1}{2} (|a_{ki}|^2 + |a_{kj}|^2)`.
+
+    Parameters
+    ----------
+    amplitudes : np.ndarray
+        Diagonals of the collapse operators (including the square root of the rates) of
+        shape (K, D).
+
+    Returns
+    -------
+    scipy.sparse.csr_matrix
+        The dissipator of dimension :math:`D^2`.
+
+    Examples
+    --------
+    >>> get_diag_dissipator(np.eye(2)).diagonal().real
+    array([ 0., -1., -1.,  0.])
+    """
+
+    factors = _get_diag_factors(amplitudes)
+    return sp.diags(factors.ravel(order="F"), format="csr", dtype=complex)
+
+
+def get_eigenbasis_dissipator(eigs, amplitudes):
+    r"""Constructs the dissipator of collapse operators that are diagonal in the
+    eigenbasis, :math:`c_k = V \mathrm{diag}(a_k) V^\dagger`, e.g., the global dephasing.
+    The dissipator is diagonal in the eigenbasis and is transformed with a single basis
+    change :math:`\bar{V} \otimes V`.
+
+    Parameters
+    ----------
+    eigs : np.ndarray
+        Eigenvectors :math:`V` as columns of shape (D, D).
+    amplitudes : np.ndarray
+        Diagonals of the collapse operators in the eigenbasis (including the square root
+        of the rates) of shape (K, D).
+
+    Returns
+    -------
+    scipy.sparse.csr_matrix
+        The dissipator of dimension :math:`D^2`.
+    """
+
+    eigs = np.asarray(eigs, dtype=complex)
+    dim = eigs.shape[0]
+    factors = _get_diag_factors(amplitudes)
+
+    # D_(ij),(kl) = sum_mn V_im conj(V_jn) factors_mn conj(V_km) V_ln, where the
+    # column-stacked index (ij) corresponds to the C-ordered index (j, i)
+    left = np.einsum("im,km->ikm", eigs, eigs.conj()).reshape(dim**2, dim)
+    right = np.einsum("jn,ln->njl", eigs.conj(), eigs).reshape(dim, dim**2)
+    dissipator = (left @ factors @ right).reshape((dim,) * 4)
+    dissipator = dissipator.transpose(2, 0, 3, 1).reshape(dim**2, dim**2)
+    return sp.csr_matrix(dissipator)
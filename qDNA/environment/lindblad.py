@@ -19,6 +19,7 @@ import copy
 
 import numpy as np
 import qutip as q
+import scipy.sparse as sp
 
 from ..tools import DEFAULTS, UNITS, check_diss_kwargs
 from ..utils import get_conversion
@@ -33,6 +34,12 @@ from .deph_ops import (
 )
 from .therm_ops import get_loc_therm_ops, get_glob_therm_ops
 from .observables import get_eh_observable
+from .dissipator import (
+    get_dissipator,
+    get_jump_dissipator,
+    get_diag_dissipator,
+    get_eigenbasis_dissipator,
+)
 
 __all__ = ["Lindblad_Diss"]
 
@@ -159,6 +166,11 @@ class Lindblad_Diss:
         self._c_ops = self.relax_ops + self.deph_ops + self.therm_ops
         self.num_c_ops = len(self.c_ops)
 
+        # Dissipator superoperator (assembled on demand)
+        self._dissipator = None
+        self._structured = True
+        self._rate_scale = 1.0
+
         # Observables: population, coherence, and ground state population operators
         if tb_ham.description == "2P":
             self.e_ops = self._get_e_ops()
@@ -194,6 +206,9 @@ class Lindblad_Diss:
         # Update the number of collapse operators
         if new_c_ops != old_c_ops:
             self.num_c_ops = len(self.c_ops)
+            # arbitrary collapse operators are only described by the general dissipator
+            self._structured = False
+            self._dissipator = None
 
     @property
     def unit(self):  # pylint: disable=missing-function-docstring
@@ -208,10 +223,13 @@ class Lindblad_Diss:
 
         # Update the collapse operators
         if new_unit != old_unit:
+            structured = self._structured
             self.c_ops = [
                 c_op * np.sqrt(get_conversion(old_unit, new_unit))
                 for c_op in self.c_ops
             ]
+            self._structured = structured
+            self._rate_scale *= get_conversion(old_unit, new_unit)
 
     # -------------------------------------------------------------------
 
@@ -354,6 +372,94 @@ class Lindblad_Diss:
 
         return therm_ops
 
+    def get_dissipator(self):
+        """Returns the dissipator superoperator of the collapse operators acting on
+        column-stacked density matrices. The relaxation and dephasing parts are
+        assembled directly from the site indices and rates instead of summing over the
+        individual collapse operators.
+
+        Returns
+        -------
+        scipy.sparse.csr_matrix or None
+            The dissipator or None if there are no collapse operators.
+        """
+
+        if self._dissipator is None and self.c_ops:
+            if not self._structured:
+                self._dissipator = get_dissipator(self.c_ops)
+            else:
+                dim = self.tb_ham.matrix_dim
+                dissipator = sp.csr_matrix((dim**2, dim**2), dtype=complex)
+                for part in [
+                    self._get_relax_dissipator(),
+                    self._get_deph_dissipator(),
+                    get_dissipator(self.c_ops[self.num_c_ops - len(self.therm_ops) :]),
+                ]:
+                    if part is not None:
+                        dissipator += part
+                self._dissipator = dissipator
+        return self._dissipator
+
+    def _get_relax_dissipator(self):
+        """Dissipator of the relaxation from the exciton states :math:`(i, i)` to the
+        ground state (index 0)."""
+
+        if not self.relax_ops:
+            return None
+
+        num_sites = len(self.tb_ham.tb_basis)
+        rates = np.array(
+            [
+                self.relax_rates[self.tb_ham.tb_basis_sites_dict[tb_site]]
+                for tb_site in self.tb_ham.tb_basis
+            ]
+        )
+        # the exciton state (i, i) has the index 1 + i * (N + 1) after the ground state
+        cols = 1 + np.arange(num_sites) * (num_sites + 1)
+        mask = rates != 0
+        return get_jump_dissipator(
+            self.tb_ham.matrix_dim,
+            np.zeros(np.sum(mask), dtype=int),
+            cols[mask],
+            self._rate_scale * rates[mask],
+        )
+
+    def _get_deph_dissipator(self):
+        """Dissipator of the local (diagonal in the site basis) or global (diagonal in
+        the eigenbasis) dephasing with the same priority as in :meth:`_get_deph_ops`."""
+
+        if not self.deph_ops:
+            return None
+
+        num_sites = len(self.tb_ham.tb_basis)
+        if self.glob_deph_rate:
+            deph_rate = self._rate_scale * self.glob_deph_rate
+        else:
+            deph_rate = self._rate_scale * self.loc_deph_rate
+
+        # one projector per site (1P), per particle and site (local 2P) or per eigenstate
+        if self.tb_ham.description == "1P":
+            amplitudes = np.eye(num_sites)
+        elif self.glob_deph_rate:
+            amplitudes = np.eye(num_sites**2)
+        else:
+            identity, ones = np.eye(num_sites), np.ones((num_sites, 1))
+            amplitudes = np.empty((2 * num_sites, num_sites**2))
+            amplitudes[0::2] = np.kron(identity, ones.T)
+            amplitudes[1::2] = np.kron(ones.T, identity)
+        amplitudes = np.sqrt(deph_rate) * amplitudes
+
+        if self.tb_ham.description == "2P" and self.tb_ham.relaxation:
+            amplitudes = np.c_[np.zeros(len(amplitudes)), amplitudes]
+        if not self.glob_deph_rate:
+            return get_diag_dissipator(amplitudes)
+
+        _, eigs = self.tb_ham.get_eigensystem()
+        if self.tb_ham.description == "2P" and self.tb_ham.relaxation:
+            eigs = add_groundstate(eigs)
+            eigs[0, 0] = 1
+        return get_eigenbasis_dissipator(eigs, amplitudes)
+
     def _get_e_ops(self):
         """Generates the expectation value operators (e_ops) for the Lindblad master
         equation. This method constructs dictionaries of population and coherence
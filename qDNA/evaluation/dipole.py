@@ -7,9 +7,10 @@ from functools import partial
 import numpy as np
 from tqdm import tqdm
 
-from ..dynamics import get_me_solver
-from ..model import get_eh_distance
-from ..tools import load_json, save_json
+from .. import DNA_Seq
+from ..dynamics import get_me_solver, calc_observables
+from ..model import get_eh_basis, get_eh_distance
+from ..tools import DEFAULTS, load_json, save_json
 from ..utils import convert_to_debye
 
 __all__ = [
@@ -23,7 +24,7 @@ __all__ = [
 # ------------------------------------------------
 
 
-def calc_dipole(upper_strand, tb_model_name, average=True, **kwargs):
+def calc_dipole(upper_strand, tb_model_name, average=True, use_cache=False, **kwargs):
     """Calculates the average charge separation.
 
     Parameters
@@ -34,6 +35,9 @@ def calc_dipole(upper_strand, tb_model_name, average=True, **kwargs):
         The name of the tight-binding model.
     average : bool
         Indicates if the charge separation should be time-averaged.
+    use_cache : bool, optional
+        If True, the trajectory of the charge separation is loaded from and saved to
+        the on-disk cache. Default is False.
     kwargs : dict
         Additional keyword arguments for the master equation solver.
 
@@ -49,16 +53,38 @@ def calc_dipole(upper_strand, tb_model_name, average=True, **kwargs):
     """
 
     kwargs["relax_rate"] = 0
+    tb_dims = DNA_Seq(upper_strand, tb_model_name).tb_dims
+    distance_list = 3.4 * get_eh_distance(get_eh_basis(tb_dims))
+    # the ground state is the first basis state if relaxation is enabled
+    relaxation = {**DEFAULTS["ham_kwargs_default"], **kwargs}["relaxation"]
+    distance_op = np.diag(np.r_[np.zeros(int(relaxation)), distance_list])
+
+    if use_cache:
+        _, _, _, expect = calc_observables(
+            upper_strand,
+            tb_model_name,
+            quantities=[],
+            e_ops={"dipole": distance_op},
+            **kwargs,
+        )
+        distances = np.real(expect["dipole"])
+        if average:
+            return float(np.mean(distances))
+        return distances.tolist()
+
     me_solver = get_me_solver(upper_strand, tb_model_name, **kwargs)
-    distance_list = 3.4 * get_eh_distance(me_solver.tb_ham.eh_basis)
-    distances = [distance_list @ dm.diag()[1:] for dm in me_solver.get_result()]
     if average:
-        return np.mean(distances).real
+        # the time average is calculated without storing the trajectory
+        dipole = me_solver.get_time_average(e_ops={"dipole": distance_op})["dipole"]
+        return float(dipole)
 
-    return distances
+    # only the populations of the trajectory are stored
+    pops = me_solver.get_trajectory(diagonal=True).get_pops()
+    distances = pops[:, 1:] @ distance_list
+    return distances.tolist()
 
 
-def calc_dipole_moment(upper_strand, tb_model_name, **kwargs):
+def calc_dipole_moment(upper_strand, tb_model_name, use_cache=False, **kwargs):
     """Calculates the dipole moment.
 
     Parameters
@@ -67,6 +93,9 @@ def calc_dipole_moment(upper_strand, tb_model_name, **kwargs):
         The upper strand of DNA sequence.
     tb_model_name : str
         The name of the tight-binding model.
+    use_cache : bool, optional
+        If True, the trajectory of the charge separation is loaded from and saved to
+        the on-disk cache. Default is False.
     kwargs : dict
         Additional keyword arguments for the master equation solver.
 
@@ -81,7 +110,9 @@ def calc_dipole_moment(upper_strand, tb_model_name, **kwargs):
     14.177784530660903
     """
     return convert_to_debye(
-        calc_dipole(upper_strand, tb_model_name, average=True, **kwargs)
+        calc_dipole(
+            upper_strand, tb_model_name, average=True, use_cache=use_cache, **kwargs
+        )
     )
 
 
@@ -110,7 +141,9 @@ def calc_dipole_wrapper(upper_strand, tb_model_name, lifetime_dict, **kwargs):
     return calc_dipole(upper_strand, tb_model_name, **kwargs)
 
 
-def calc_dipole_dict(tb_model_name, filename, directory, num_cpu=None):
+def calc_dipole_dict(
+    tb_model_name, filename, directory, num_cpu=None, use_cache=False
+):
     """Calculates the average charge separation for multiple upper strands using
     multiprocessing.
 
@@ -124,6 +157,9 @@ def calc_dipole_dict(tb_model_name, filename, directory, num_cpu=None):
         The directory where the lifetime dictionary is located.
     num_cpu : int, optional
         The number of CPU cores to use. Defaults to the total number of CPUs minus one.
+    use_cache : bool, optional
+        If True, the trajectories are loaded from and saved to the on-disk cache.
+        Default is False.
 
     Returns
     -------
@@ -146,6 +182,7 @@ def calc_dipole_dict(tb_model_name, filename, directory, num_cpu=None):
         calc_dipole_wrapper,
         tb_model_name=tb_model_name,
         lifetime_dict=lifetime_dict,
+        use_cache=use_cache,
         **kwargs,
     )
     with multiprocessing.Pool(processes=num_cpu) as pool:
@@ -167,7 +204,9 @@ def calc_dipole_dict(tb_model_name, filename, directory, num_cpu=None):
     return dipole_dict
 
 
-def calc_dipole_moment_dict(tb_model_name, filename, directory, num_cpu=None):
+def calc_dipole_moment_dict(
+    tb_model_name, filename, directory, num_cpu=None, use_cache=False
+):
     """Calculates the dipole moment for multiple upper strands using multiprocessing.
 
     Parameters
@@ -180,6 +219,9 @@ def calc_dipole_moment_dict(tb_model_name, filename, directory, num_cpu=None):
         The directory where the lifetime dictionary is located.
     num_cpu : int, optional
         The number of CPU cores to use. Defaults to the total number of CPUs minus one.
+    use_cache : bool, optional
+        If True, the trajectories are loaded from and saved to the on-disk cache.
+        Default is False.
 
     Returns
     -------
@@ -212,6 +254,7 @@ def calc_dipole_moment_dict(tb_model_name, filename, directory, num_cpu=None):
             calc_dipole_wrapper,
             tb_model_name=tb_model_name,
             lifetime_dict=lifetime_dict,
+            use_cache=use_cache,
             **kwargs,
         )
         with multiprocessing.Pool(processes=num_cpu) as pool:
@@ -7,7 +7,8 @@ from functools import partial
 import numpy as np
 from tqdm import tqdm
 
-from ..dynamics import get_me_solver
+from .. import DNA_Seq
+from ..dynamics import get_me_solver, calc_observables
 from ..tools import load_json, save_json
 
 __all__ = [
@@ -41,18 +42,37 @@ def calc_average_transfer(tb_sites, me_solver, average=True):
     average_pop = dict(
         zip(me_solver.tb_ham.particles, [0] * len(me_solver.tb_ham.particles))
     )
+    if average:
+        # the time average is calculated without storing the trajectory
+        avg_pop = me_solver.get_time_average(quantities=["pop"])
+        for particle in me_solver.tb_ham.particles:
+            average_pop[particle] = sum(
+                avg_pop[particle + "_" + tb_site] for tb_site in tb_sites
+            )
+        return average_pop
+
     for particle in me_solver.tb_ham.particles:
         avg_pop = np.sum(
             [me_solver.get_pop()[particle + "_" + tb_site] for tb_site in tb_sites],
             axis=0,
         )
-        if average:
-            avg_pop = np.mean(avg_pop)
         average_pop[particle] = avg_pop
     return average_pop
 
 
-def calc_backbone_transfer(upper_strand, tb_model_name, **kwargs):
+def _calc_cached_transfer(tb_sites, pop, average=True):
+    """Sums the (time-averaged) populations of the given TB sites from a dictionary of
+    population trajectories, e.g., loaded from the on-disk cache."""
+
+    particles = dict.fromkeys(key.split("_", maxsplit=1)[0] for key in pop)
+    transfer = {}
+    for particle in particles:
+        values = np.sum([pop[particle + "_" + tb_site] for tb_site in tb_sites], axis=0)
+        transfer[particle] = float(np.mean(values)) if average else np.real(values)
+    return transfer
+
+
+def calc_backbone_transfer(upper_strand, tb_model_name, use_cache=False, **kwargs):
     """Calculates the average population of the backbone sites in a given time period.
 
     Parameters
@@ -61,6 +81,9 @@ def calc_backbone_transfer(upper_strand, tb_model_name, **kwargs):
         The upper strand of DNA sequence.
     tb_model_name : str
         The name of the tight-binding model.
+    use_cache : bool, optional
+        If True, the populations are loaded from and saved to the on-disk cache.
+        Default is False.
     kwargs : dict
         Additional keyword arguments for the master equation solver.
 
@@ -69,23 +92,31 @@ def calc_backbone_transfer(upper_strand, tb_model_name, **kwargs):
     dict
         The average backbone population for each particle.
     """
-    me_solver = get_me_solver(upper_strand, tb_model_name, **kwargs)
-    tb_model = me_solver.tb_ham.tb_model
     assert (
-        tb_model.tb_model_name[0] == "F"
+        tb_model_name[0] == "F"
     ), "Backbone population can only be calculated for Fishbone models"
+    dna_seq = DNA_Seq(upper_strand, tb_model_name)
     upper_backbone_sites = [
-        f"(0, {site})" for site in range(tb_model.num_sites_per_strand)
+        f"(0, {site})" for site in range(dna_seq.num_sites_per_strand)
     ]
     lower_backbone_sites = [
-        f"({tb_model.num_strands-1}, {site})"
-        for site in range(tb_model.num_sites_per_strand)
+        f"({dna_seq.num_strands-1}, {site})"
+        for site in range(dna_seq.num_sites_per_strand)
     ]
     backbone_sites = upper_backbone_sites + lower_backbone_sites
+
+    if use_cache:
+        pop, _, _, _ = calc_observables(
+            upper_strand, tb_model_name, quantities=["pop"], **kwargs
+        )
+        return _calc_cached_transfer(backbone_sites, pop)
+    me_solver = get_me_solver(upper_strand, tb_model_name, **kwargs)
     return calc_average_transfer(backbone_sites, me_solver)
 
 
-def calc_exciton_transfer(upper_strand, tb_model_name, average=True, **kwargs):
+def calc_exciton_transfer(
+    upper_strand, tb_model_name, average=True, use_cache=False, **kwargs
+):
     """Calculates the average exciton population on the upper and lower strand.
 
     Parameters
@@ -96,6 +127,9 @@ def calc_exciton_transfer(upper_strand, tb_model_name, average=True, **kwargs):
         The name of the tight-binding model.
     average : bool
         Indicates if the exciton_population should be time-averaged.
+    use_cache : bool, optional
+        If True, the populations are loaded from and saved to the on-disk cache.
+        Default is False.
     kwargs : dict
         Additional keyword arguments for the master equation solver.
 
@@ -114,17 +148,21 @@ def calc_exciton_transfer(upper_strand, tb_model_name, average=True, **kwargs):
     'hole': 0.005618673591287626,
     'exciton': 0.0001960836601784245})
     """
-    me_solver = get_me_solver(upper_strand, tb_model_name, **kwargs)
-    tb_model = me_solver.tb_ham.tb_model
-    assert tb_model.tb_model_name[0] != "F", "Not definded for Fishbone models"
-    assert tb_model.tb_model_name[0] != "W", "Not definded for Wire models"
+    assert tb_model_name[0] != "F", "Not definded for Fishbone models"
+    assert tb_model_name[0] != "W", "Not definded for Wire models"
+    num_sites_per_strand = len(upper_strand)
+    upper_strand_sites = [f"(0, {j})" for j in range(num_sites_per_strand)]
+    lower_strand_sites = [f"(1, {j})" for j in range(num_sites_per_strand)]
+
+    if use_cache:
+        pop, _, _, _ = calc_observables(
+            upper_strand, tb_model_name, quantities=["pop"], **kwargs
+        )
+        upper_strand_pop = _calc_cached_transfer(upper_strand_sites, pop, average)
+        lower_strand_pop = _calc_cached_transfer(lower_strand_sites, pop, average)
+        return upper_strand_pop, lower_strand_pop
 
-    upper_strand_sites = [
-        f"(0, {j})" for j in range(me_solver.tb_model.num_sites_per_strand)
-    ]
-    lower_strand_sites = [
-        f"(1, {j})" for j in range(me_solver.tb_model.num_sites_per_strand)
-    ]
+    me_solver = get_me_solver(upper_strand, tb_model_name, **kwargs)
     upper_strand_pop = calc_average_transfer(
         upper_strand_sites, me_solver, average=average
     )
@@ -186,7 +224,9 @@ def calc_exciton_transfer_wrapper(upper_strand, tb_model_name, lifetime_dict, **
     return calc_exciton_transfer(upper_strand, tb_model_name, **kwargs)
 
 
-def calc_exciton_transfer_dict(tb_model_name, filename, directory, num_cpu=None):
+def calc_exciton_transfer_dict(
+    tb_model_name, filename, directory, num_cpu=None, use_cache=False
+):
     """Calculates the average exciton population for multiple upper strands using
     multiprocessing.
 
@@ -200,6 +240,9 @@ def calc_exciton_transfer_dict(tb_model_name, filename, directory, num_cpu=None)
         The directory where the lifetime dictionary is located.
     num_cpu : int, optional
         The number of CPU cores to use. Defaults to the total number of CPUs minus one.
+    use_cache : bool, optional
+        If True, the populations are loaded from and saved to the on-disk cache.
+        Default is False.
 
     Returns
     -------
@@ -222,6 +265,7 @@ def calc_exciton_transfer_dict(tb_model_name, filename, directory, num_cpu=None)
         calc_exciton_transfer_wrapper,
         tb_model_name=tb_model_name,
         lifetime_dict=lifetime_dict,
+        use_cache=use_cache,
         **kwargs,
     )
     with multiprocessing.Pool(processes=num_cpu) as pool:
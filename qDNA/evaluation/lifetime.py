@@ -8,7 +8,7 @@ from functools import partial
 import numpy as np
 from tqdm import tqdm
 
-from ..dynamics import get_me_solver
+from ..dynamics import get_me_solver, calc_observables
 from ..tools import DEFAULTS, save_json
 
 __all__ = ["calc_lifetime", "calc_lifetime_dict"]
@@ -16,7 +16,14 @@ __all__ = ["calc_lifetime", "calc_lifetime_dict"]
 # ---------------------------------------------------------------
 
 
-def calc_lifetime(upper_strand, tb_model_name, **kwargs):
+def calc_lifetime(
+    upper_strand,
+    tb_model_name,
+    method="event",
+    use_cache=False,
+    max_t_end=None,
+    **kwargs,
+):
     """Calculates the exciton lifetime in femtoseconds (fs).
 
     Parameters
@@ -25,6 +32,21 @@ def calc_lifetime(upper_strand, tb_model_name, **kwargs):
         The upper strand of DNA sequence.
     tb_model_name : str
         The name of the tight-binding model.
+    method : str, optional
+        'event' stops the integration once the ground state population reaches 1-1/e and
+        refines the crossing time between the grid points. 'spectral' calculates the
+        crossing time from the eigendecomposition of the Liouvillian without time stepping.
+        'grid' integrates the whole time grid and returns the first grid point beyond the
+        threshold. Default is 'event'. The mcwf engine only provides expectation values,
+        such that the 'grid' method is used instead of the 'event' method.
+    use_cache : bool, optional
+        If True, the ground state population of the 'grid' method is loaded from and
+        saved to the on-disk cache. The 'event' and 'spectral' methods do not store the
+        trajectory and cannot be cached. Default is False.
+    max_t_end : float, optional
+        If given, the time window of the 'event' and 'spectral' methods is doubled until
+        the exciton relaxes or ``max_t_end`` (in units of ``t_unit``) is reached. Only the
+        new time intervals are integrated. Default is None.
     kwargs : dict
         Additional keyword arguments for the master equation solver.
 
@@ -36,26 +58,63 @@ def calc_lifetime(upper_strand, tb_model_name, **kwargs):
     Examples
     --------
     >>> calc_lifetime("GCG", "ELM", relax_rate=3, unit="rad/ps")
+    770.0979385918653
+    >>> calc_lifetime("GCG", "ELM", method="grid", relax_rate=3, unit="rad/ps")
     775.5511022044088
     """
+    assert method in [
+        "event",
+        "spectral",
+        "grid",
+    ], "method must be 'event', 'spectral' or 'grid'"
     start_time = time.time()
-    me_solver = get_me_solver(upper_strand, tb_model_name, **kwargs)
-    gs_pop = me_solver.get_groundstate_pop()["groundstate"]
-    try:
-        _, index = next((val, i) for i, val in enumerate(gs_pop) if val >= 1 - 1 / np.e)
-        lifetime = me_solver.times[index]
-        if me_solver.t_unit == "ps":
-            lifetime *= 1000
-        end_time = time.time()
-        if DEFAULTS["verbose"]:
-            print(f"Calculation time: {end_time-start_time}")
-        return lifetime
-    except StopIteration:
+    if method == "spectral":
+        kwargs["solver_engine"] = "spectral"
+    me_kwargs = {**DEFAULTS["me_kwargs_default"], **kwargs}
+    if method == "event" and me_kwargs["solver_engine"] == "mcwf":
+        method = "grid"
+    assert (
+        not use_cache or method == "grid"
+    ), "use_cache is only supported for the 'grid' method"
+    threshold = 1 - 1 / np.e
+
+    if method in ["event", "spectral"]:
+        me_solver = get_me_solver(upper_strand, tb_model_name, **kwargs)
+        gs_op = me_solver.lindblad_diss.groundstate_pop_ops["groundstate"]
+        lifetime = me_solver.get_event_time(gs_op, threshold, max_t_end=max_t_end)
+    else:
+        # the solver is only set up if the ground state population is not cached
+        _, _, groundstate_pop, _ = calc_observables(
+            upper_strand,
+            tb_model_name,
+            quantities=["groundstate_pop"],
+            use_cache=use_cache,
+            **kwargs,
+        )
+        gs_pop = groundstate_pop["groundstate"]
+        times = np.linspace(0, int(me_kwargs["t_end"]), int(me_kwargs["t_steps"]))
+        index = next((i for i, val in enumerate(gs_pop) if val >= threshold), None)
+        lifetime = None if index is None else times[index]
+
+    if lifetime is None:
         return "no relaxation in the given time"
+    if me_kwargs["t_unit"] == "ps":
+        lifetime *= 1000
+    end_time = time.time()
+    if DEFAULTS["verbose"]:
+        print(f"Calculation time: {end_time-start_time}")
+    return lifetime
 
 
 def calc_lifetime_dict(
-    upper_strands, tb_model_name, filename, directory, num_cpu=None, **kwargs
+    upper_strands,
+    tb_model_name,
+    filename,
+    directory,
+    num_cpu=None,
+    method="event",
+    use_cache=False,
+    **kwargs,
 ):
     """Calculates the exciton lifetime for multiple upper strands using multiprocessing.
 
@@ -71,6 +130,12 @@ def calc_lifetime_dict(
         The directory where the lifetime dictionary is located.
     num_cpu : int, optional
         The number of CPU cores to use. Defaults to the total number of CPUs minus one.
+    method : str, optional
+        The method used to calculate the lifetime ('event', 'spectral' or 'grid').
+        Default is 'event'.
+    use_cache : bool, optional
+        If True, the results of the 'grid' method are loaded from and saved to the
+        on-disk cache. Default is False.
     kwargs : dict
         Additional keyword arguments for the master equation solver.
 
@@ -82,7 +147,11 @@ def calc_lifetime_dict(
     if not num_cpu:
         num_cpu = multiprocessing.cpu_count() - 1
     partial_calc_lifetime = partial(
-        calc_lifetime, tb_model_name=tb_model_name, **kwargs
+        calc_lifetime,
+        tb_model_name=tb_model_name,
+        method=method,
+        use_cache=use_cache,
+        **kwargs,
     )
     with multiprocessing.Pool(processes=num_cpu) as pool:
         lifetime_list = list(
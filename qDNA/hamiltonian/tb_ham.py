@@ -17,24 +17,20 @@ from itertools import chain
 import copy
 
 import numpy as np
+import scipy.sparse as sp
 
 from .. import DNA_Seq
 from ..tools import check_ham_kwargs, DEFAULTS, UNITS, SOURCES
-from ..utils import (
-    calc_amplitudes,
-    calc_average_pop,
-    calc_frequencies,
-    get_conversion,
-    get_conversion_dict,
-)
-from ..model.tb_basis import get_eh_basis, get_particle_eh_states
+from ..utils import calc_frequencies, get_conversion, get_conversion_dict
+from ..model.tb_basis import get_eh_basis
 from ..model.tb_model import TB_Model
+from ..model.tb_symmetry import get_reflection_perm, get_eh_perm, is_perm_symmetric
 from .tb_matrices import (
     tb_ham_1P,
     tb_ham_2P,
     add_groundstate,
-    add_interaction,
     delete_groundstate,
+    get_interaction_diag,
 )
 
 from .tb_params import wrap_load_tb_params
@@ -90,7 +86,9 @@ class TB_Ham:
         Electron-hole basis states.
     nn_cutoff : bool
         Nearest-neighbor cutoff for interactions.
-    matrix : np.ndarray
+    sparse : bool
+        Flag indicating if the 2P Hamiltonian matrix is stored as a sparse matrix.
+    matrix : np.ndarray or scipy.sparse.csr_matrix
         The Hamiltonian matrix.
     matrix_dim : int
         Dimension of the Hamiltonian matrix.
@@ -103,8 +101,12 @@ class TB_Ham:
         Retrieves the tight-binding parameters.
     get_eigensystem()
         Computes and returns the eigenvalues and eigenvectors of the Hamiltonian.
+    get_symmetry_perm()
+        Returns the reflection permutation if the Hamiltonian is invariant.
     get_matrix()
         Computes and returns the Hamiltonian matrix.
+    get_fourier_basis(init_states, quantities, end_states)
+        Computes Fourier components for several end states and all particles at once.
     get_fourier(init_state, end_state, quantities)
         Computes Fourier components of the Hamiltonian for given states.
     get_amplitudes(init_state, end_state)
@@ -165,7 +167,11 @@ class TB_Ham:
             self._relaxation = self.ham_kwargs.get("relaxation")
             self.eh_basis = get_eh_basis(self.tb_model.tb_dims)
             self._nn_cutoff = self.ham_kwargs.get("nn_cutoff")
+        self.sparse = self.ham_kwargs.get("sparse")
 
+        # the eigensystem is cached until the matrix changes
+        self._matrix_version = 0
+        self._eigensystem = None
         self.matrix = self.get_matrix()
         self.matrix_dim = self.matrix.shape[0]
         self.backbone = self.tb_model.num_strands in (3, 4)
@@ -199,6 +205,17 @@ class TB_Ham:
         ), "elements of new_particles must be of type str"
         self._particles = new_particles
 
+    @property
+    def matrix(self):  # pylint: disable=missing-function-docstring
+        return self._matrix
+
+    @matrix.setter
+    def matrix(self, new_matrix):
+        self._matrix = new_matrix
+
+        # invalidate the cached eigensystem
+        self._matrix_version += 1
+
     @property
     def coulomb_param(self):  # pylint: disable=missing-function-docstring
         return self._coulomb_param
@@ -213,7 +230,7 @@ class TB_Ham:
 
         # update the matrix
         if old_coulomb_param != new_coulomb_param:
-            self.matrix = self.get_matrix()
+            self._update_interaction()
 
     @property
     def exchange_param(self):  # pylint: disable=missing-function-docstring
@@ -225,11 +242,11 @@ class TB_Ham:
             new_exchange_param, float
         ), "exchange_param must be of type float"
         old_exchange_param = self._exchange_param
-        self._coulomb_param = new_exchange_param
+        self._exchange_param = new_exchange_param
 
         # update the matrix
         if old_exchange_param != new_exchange_param:
-            self.matrix = self.get_matrix()
+            self._update_interaction()
 
     @property
     def relaxation(self):  # pylint: disable=missing-function-docstring
@@ -262,7 +279,8 @@ class TB_Ham:
 
         # update the matrix
         if old_nn_cutoff != new_nearest_neighbor_cutoff:
-            self.matrix = self.get_matrix()
+            self._set_interaction_diags()
+            self._update_interaction()
 
     @property
     def unit(self):  # pylint: disable=missing-function-docstring
@@ -279,6 +297,7 @@ class TB_Ham:
         if new_unit != old_unit:
             self.matrix *= get_conversion(old_unit, new_unit)
             if self.description == "2P":
+                self._ham_diag *= get_conversion(old_unit, new_unit)
                 self.tb_params_electron = self.get_param_dict("electron")
                 self.tb_params_hole = self.get_param_dict("hole")
                 self.tb_params_exciton = self.get_param_dict("exciton")
@@ -352,11 +371,32 @@ class TB_Ham:
 
         return tb_params
 
+    def get_symmetry_perm(self):
+        """Detects the reflection symmetry of the Hamiltonian, i.e., the invariance under
+        swapping the strands and reversing the sites, which holds for self-complementary
+        sequences (e.g., GCGC).
+
+        Returns
+        -------
+        np.ndarray or None
+            The permutation of the basis of the Hamiltonian matrix (including the ground
+            state) or None if the Hamiltonian is not invariant.
+        """
+
+        perm = get_reflection_perm(self.tb_model.tb_dims, self.tb_basis)
+        if self.description == "2P":
+            perm = get_eh_perm(perm, groundstate=self.relaxation)
+        if not is_perm_symmetric(self.matrix, perm):
+            return None
+        return perm
+
     def get_eigensystem(self):
         """Compute the eigenvalues and eigenvectors of the matrix. This method computes
         the eigenvalues and eigenvectors of the matrix associated with the instance. If
         the description is "2P" and relaxation is enabled, the ground state is deleted
-        from the matrix before computing the eigensystem.
+        from the matrix before computing the eigensystem. The eigensystem is cached and
+        only recomputed after the matrix changed (every assignment of the matrix bumps
+        its version). The cached arrays are read-only.
 
         Returns
         -------
@@ -367,6 +407,11 @@ class TB_Ham:
                 The eigenvectors of the matrix.
         """
 
+        if self._eigensystem is not None:
+            version, eigv, eigs = self._eigensystem
+            if version == self._matrix_version:
+                return eigv, eigs
+
         matrix = self.matrix
 
         # remove the ground state if relaxation is enabled
@@ -374,7 +419,13 @@ class TB_Ham:
             if self.relaxation:
                 matrix = delete_groundstate(matrix)
 
-        return np.linalg.eigh(matrix)
+        if sp.issparse(matrix):
+            matrix = matrix.toarray()
+        eigv, eigs = np.linalg.eigh(matrix)
+        eigv.flags.writeable = False
+        eigs.flags.writeable = False
+        self._eigensystem = (self._matrix_version, eigv, eigs)
+        return eigv, eigs
 
     def get_matrix(self):
         """Generate the tight-binding Hamiltonian matrix based on the system
@@ -382,8 +433,9 @@ class TB_Ham:
 
         Returns
         -------
-        matrix : numpy.ndarray
-            The Hamiltonian matrix for the system.
+        matrix : numpy.ndarray or scipy.sparse.csr_matrix
+            The Hamiltonian matrix for the system (sparse for the "2P" description if
+            ``sparse`` is set).
 
         Notes
         -----
@@ -406,26 +458,13 @@ class TB_Ham:
                 self.tb_params_hole,
                 self.tb_params_exciton,
                 self.tb_basis_sites_dict,
+                sparse=self.sparse,
             )
 
-            # add interaction terms
-            if self.coulomb_param:
-                matrix = add_interaction(
-                    matrix,
-                    self.eh_basis,
-                    self.coulomb_param,
-                    "Coulomb",
-                    nn_cutoff=self.nn_cutoff,
-                )
-
-            if self.exchange_param:
-                matrix = add_interaction(
-                    matrix,
-                    self.eh_basis,
-                    self.exchange_param,
-                    "Exchange",
-                    nn_cutoff=self.nn_cutoff,
-                )
+            # add interaction terms, the components are cached for parameter updates
+            self._ham_diag = np.array(matrix.diagonal(), dtype=float)
+            self._set_interaction_diags()
+            matrix = self._set_diag(matrix, self._get_diag())
 
             # add relaxation terms
             if self._relaxation:
@@ -452,9 +491,175 @@ class TB_Ham:
 
         return matrix
 
+    def _set_interaction_diags(self):
+        """Caches the Coulomb and exchange diagonals for unit interaction parameters."""
+
+        self._coulomb_diag = get_interaction_diag(
+            self.eh_basis, "Coulomb", nn_cutoff=self.nn_cutoff
+        )
+        self._exchange_diag = get_interaction_diag(
+            self.eh_basis, "Exchange", nn_cutoff=self.nn_cutoff
+        )
+
+    def _get_diag(self):
+        """Returns the diagonal of the 2P Hamiltonian (without ground state) as the
+        linear combination of the cached non-interacting and interaction diagonals."""
+
+        return (
+            self._ham_diag
+            + self.coulomb_param * self._coulomb_diag
+            + self.exchange_param * self._exchange_diag
+        )
+
+    def _set_diag(self, matrix, diag):
+        """Replaces the diagonal of the exciton block (after the ground state, if
+        present) of a dense or sparse matrix. A new matrix is returned, such that
+        references to the previous matrix are not modified."""
+
+        offset = matrix.shape[0] - len(diag)
+        if sp.issparse(matrix):
+            diff = np.zeros(matrix.shape[0], dtype=np.result_type(matrix.dtype, diag))
+            diff[offset:] = diag - matrix.diagonal()[offset:]
+            return (matrix + sp.diags(diff)).tocsr()
+        matrix = matrix.astype(np.result_type(matrix.dtype, diag), copy=True)
+        idx = np.arange(offset, matrix.shape[0])
+        matrix[idx, idx] = diag
+        return matrix
+
+    def _update_interaction(self):
+        """Updates the interaction terms of the 2P Hamiltonian in O(D) from the cached
+        components instead of rebuilding the matrix."""
+
+        self.matrix = self._set_diag(self.matrix, self._get_diag())
+
+    def get_fourier_basis(self, init_states=None, quantities="all", end_states=None):
+        """Calculate the Fourier components of the transitions from the initial states
+        to the tight-binding sites for all particles at once. The quantities are
+        contracted from the eigenvectors with ``np.einsum`` instead of looping over the
+        end states.
+
+        Parameters
+        ----------
+        init_states : list, optional
+            Initial states in the electron-hole basis ("2P") or tight-binding basis
+            ("1P"). Defaults to all states of the basis.
+        quantities : list of str
+            List of quantities to calculate. Possible values are "amplitude",
+            "frequency", and "average_pop".
+        end_states : list of str, optional
+            Tight-binding sites to which the transitions are calculated. Defaults to
+            all sites of `self.tb_basis`.
+
+        Returns
+        -------
+        amplitudes_dict : dict
+            Dictionary containing for each particle the amplitudes with shape
+            (num_init_states, num_sites, num_end_states * num_frequencies), where
+            num_sites is the number of `end_states` and num_end_states is the number of
+            electron-hole states per site contributing to the particle population.
+        frequencies_dict : dict
+            Dictionary containing for each particle the frequencies matching the last
+            axis of the amplitudes.
+        average_pop_dict : dict
+            Dictionary containing for each particle the average populations with shape
+            (num_init_states, num_sites).
+
+        Raises
+        ------
+        AssertionError
+            If an initial state is not in `self.eh_basis` or `self.tb_basis` depending
+            on the description.
+            If an end state is not in `self.tb_basis`.
+
+        Notes
+        -----
+        .. note::
+
+            The amplitudes scale as :math:`D^3` per initial state (with :math:`D` the
+            dimension of the Hamiltonian), restrict `init_states` and `end_states` for
+            large systems.
+        """
+
+        eigv, eigs = self.get_eigensystem()
+
+        if quantities == "all":
+            quantities = ["amplitude", "frequency", "average_pop"]
+
+        # check if the initial states are in the electron-hole or tight-binding basis
+        basis = self.eh_basis if self.description == "2P" else self.tb_basis
+        if init_states is None:
+            init_states = basis
+        assert all(
+            init_state in basis for init_state in init_states
+        ), f"init_states must be in {basis}"
+        basis_idx = {state: idx for idx, state in enumerate(basis)}
+        init_eigs = eigs[[basis_idx[init_state] for init_state in init_states]]
+
+        # check if the end states are in the tight-binding basis
+        if end_states is None:
+            end_states = self.tb_basis
+        assert all(
+            end_state in self.tb_basis for end_state in end_states
+        ), f"end_states must be in tb_basis {self.tb_basis}"
+        end_idx = [self.tb_basis.index(end_state) for end_state in end_states]
+
+        # einsum subscripts of the end states and overlaps for each particle, the 2P
+        # eigenvectors are reshaped to (electron site, hole site, eigenstate)
+        num_sites = len(self.tb_basis)
+        if self.description == "2P":
+            end_eigs = eigs.reshape(num_sites, num_sites, -1)
+            subscripts = {
+                "electron": ("shk", "ishk"),
+                "hole": ("esk", "isek"),
+                "exciton": ("ssk", "isk"),
+            }
+        if self.description == "1P":
+            end_eigs = eigs
+            subscripts = dict.fromkeys(self.particles, ("sk", "isk"))
+
+        amplitudes_dict, frequencies_dict, average_pop_dict = {}, {}, {}
+        for particle in self.particles:
+            end_subscripts, overlap_subscripts = subscripts[particle]
+            num_end_states = num_sites if len(overlap_subscripts) == 4 else 1
+
+            # restrict the site axes of the eigenvectors to the end states
+            particle_eigs = end_eigs
+            for axis, subscript in enumerate(end_subscripts):
+                if subscript == "s":
+                    particle_eigs = np.take(particle_eigs, end_idx, axis=axis)
+
+            # calculate average population
+            if "average_pop" in quantities:
+                average_pop_dict[particle] = np.einsum(
+                    f"ik,{end_subscripts}->is", init_eigs**2, particle_eigs**2
+                )
+
+            # calculate amplitude
+            if "amplitude" in quantities:
+                overlaps = np.einsum(
+                    f"ik,{end_subscripts}->{overlap_subscripts}",
+                    init_eigs,
+                    particle_eigs,
+                )
+                rows, cols = np.triu_indices(eigs.shape[1], k=1)
+                amplitudes = overlaps[..., rows]
+                amplitudes *= overlaps[..., cols]
+                amplitudes *= 2
+                amplitudes_dict[particle] = np.real(amplitudes).reshape(
+                    len(init_states), len(end_idx), -1
+                )
+
+            # calculate frequency
+            if "frequency" in quantities:
+                frequencies_dict[particle] = np.tile(
+                    calc_frequencies(eigv), num_end_states
+                )
+        return amplitudes_dict, frequencies_dict, average_pop_dict
+
     def get_fourier(self, init_state, end_state, quantities):
         """Calculate the Fourier components of the transition between initial and end
-        states.
+        states. This is a view on `get_fourier_basis` restricted to a single initial and
+        end state.
 
         Parameters
         ----------
@@ -481,82 +686,18 @@ class TB_Ham:
             If `init_state` is not in `self.eh_basis` or `self.tb_basis` depending on the description.
         """
 
-        eigv, eigs = self.get_eigensystem()
-
-        if quantities == "all":
-            quantities = ["amplitude", "frequency", "average_pop"]
-
         # check if the end state is in the tight-binding basis
         assert (
             end_state in self.tb_basis
         ), f"end_state must be in tb_basis {self.tb_basis}"
 
-        # check if the initial state is in the electron-hole basis or tight-binding basis
-        if self.description == "2P":
-            assert (
-                init_state in self.eh_basis
-            ), f"init_state must be in tb_basis {self.eh_basis}"
-            init_state_idx = self.eh_basis.index(init_state)
-
-        if self.description == "1P":
-            assert (
-                init_state in self.tb_basis
-            ), f"init_state must be in tb_basis {self.tb_basis}"
-            init_state_idx = self.tb_basis.index(init_state)
-            end_state_idx = self.tb_basis.index(end_state)
-
-        amplitudes_dict, frequencies_dict, average_pop_dict = {}, {}, {}
-        for particle in self.particles:
-            if self.description == "2P":
-                # get the end states for the particle
-                end_states_idx = [
-                    self.eh_basis.index(end_state)
-                    for end_state in get_particle_eh_states(
-                        particle, end_state, self.tb_basis
-                    )
-                ]
-
-                # calculate amplitude
-                if "amplitude" in quantities:
-                    amplitudes_dict[particle] = list(
-                        chain.from_iterable(
-                            [
-                                calc_amplitudes(eigs, init_state_idx, es)
-                                for es in end_states_idx
-                            ]
-                        )
-                    )
-
-                # calculate frequency
-                if "frequency" in quantities:
-                    frequencies_dict[particle] = list(calc_frequencies(eigv)) * len(
-                        end_states_idx
-                    )
-
-                # calculate average population
-                if "average_pop" in quantities:
-                    average_pop_dict[particle] = np.sum(
-                        [
-                            calc_average_pop(eigs, init_state_idx, es)
-                            for es in end_states_idx
-                        ]
-                    )
-            if self.description == "1P":
-                # calculate amplitude
-                if "amplitude" in quantities:
-                    amplitudes_dict[particle] = calc_amplitudes(
-                        eigs, init_state_idx, end_state_idx
-                    )
-
-                # calculate frequency
-                if "frequency" in quantities:
-                    frequencies_dict[particle] = calc_frequencies(eigv)
-
-                # calculate average population
-                if "average_pop" in quantities:
-                    average_pop_dict[particle] = calc_average_pop(
-                        eigs, init_state_idx, end_state_idx
-                    )
+        amplitudes_dict, frequencies_dict, average_pop_dict = self.get_fourier_basis(
+            [init_state], quantities, end_states=[end_state]
+        )
+        for particle in amplitudes_dict:
+            amplitudes_dict[particle] = amplitudes_dict[particle][0, 0]
+        for particle in average_pop_dict:
+            average_pop_dict[particle] = average_pop_dict[particle][0, 0]
         return amplitudes_dict, frequencies_dict, average_pop_dict
 
     def get_amplitudes(
@@ -611,10 +752,11 @@ class TB_Ham:
         backbone_sites = upper_backbone_sites + lower_backbone_sites
 
         # calculate the backbone population
-        backbone_pop = dict(zip(self.particles, [0] * len(self.particles)))
-        for particle in self.particles:
-            for tb_site in backbone_sites:
-                backbone_pop[particle] += self.get_average_pop(init_state, tb_site)[
-                    particle
-                ]
+        average_pop_dict = self.get_fourier_basis(
+            [init_state], ["average_pop"], end_states=backbone_sites
+        )[2]
+        backbone_pop = {
+            particle: np.sum(average_pop[0])
+            for particle, average_pop in average_pop_dict.items()
+        }
         return backbone_pop
@@ -1,15 +1,16 @@
-from itertools import product
-
 import numpy as np
+import scipy.sparse as sp
 
 from ..model.tb_basis import get_eh_distance
 
 __all__ = [
     "set_matrix_element",
     "tb_ham_1P",
+    "get_tb_param_table",
     "tb_ham_2P",
     "add_groundstate",
     "delete_groundstate",
+    "get_interaction_diag",
     "add_interaction",
 ]
 
@@ -64,7 +65,9 @@ def tb_ham_1P(
     tb_param_dict,
     tb_basis_sites_dict,
 ):
-    """Constructs the particle tight-binding Hamiltonian matrix.
+    """Constructs the particle tight-binding Hamiltonian matrix. The parameters of all
+    entries of the precompiled configuration ``tb_model.tb_config_indices`` are looked
+    up in a parameter table and added to the matrix at once.
 
     Parameters
     ----------
@@ -89,31 +92,94 @@ def tb_ham_1P(
     array([[1. , 0.5],
            [0.5, 1. ]])
     """
-    matrix = np.zeros((tb_model.num_sites, tb_model.num_sites))
-
+    num_sites = tb_model.num_sites
     if tb_param_dict == {}:  # empty dictionary
-        return matrix
-
-    for tb_str, new_state, old_state in tb_model.tb_config:
-        if tb_str == "E":
-            tb_str = f"E_{tb_basis_sites_dict[old_state]}"
-        else:
-            tb_str = f"{tb_str}_{tb_basis_sites_dict[old_state]}{tb_basis_sites_dict[new_state]}"
-
-        # for interstrand hopping the direction is not imporant
-        if tb_str[0] in ["h", "r"] and tb_str not in tb_param_dict:
-            tb_str = f"{tb_str.split('_')[0]}_{tb_basis_sites_dict[new_state]}{tb_basis_sites_dict[old_state]}"
-
-        if tb_str not in tb_param_dict:
-            raise ValueError(
-                f"Tight-binding parameter '{tb_str}' not found in the parameter dictionary."
-            )
-
-        tb_val = tb_param_dict[tb_str]
-        matrix = set_matrix_element(
-            matrix, tb_val, new_state, old_state, tb_model.tb_basis
+        return np.zeros((num_sites, num_sites))
+
+    # the configuration is precompiled into integer arrays by the model
+    tb_strs, slots, rows, cols = tb_model.tb_config_indices
+    site_pos = {}
+    site_idx = np.array(
+        [
+            site_pos.setdefault(tb_basis_sites_dict[tb_state], len(site_pos))
+            for tb_state in tb_model.tb_basis
+        ]
+    )
+    tb_sites = list(site_pos)
+
+    # parameter vector with one value per configuration entry
+    param_table = get_tb_param_table(tb_param_dict, tb_strs, tb_sites)
+    tb_vals = param_table[slots, site_idx[cols], site_idx[rows]]
+    if np.isnan(tb_vals).any():
+        entry = np.flatnonzero(np.isnan(tb_vals))[0]
+        tb_str = tb_strs[slots[entry]]
+        old_site = tb_sites[site_idx[cols[entry]]]
+        new_site = tb_sites[site_idx[rows[entry]]]
+        tb_str = f"E_{old_site}" if tb_str == "E" else f"{tb_str}_{old_site}{new_site}"
+        raise ValueError(
+            f"Tight-binding parameter '{tb_str}' not found in the parameter dictionary."
         )
-    return matrix
+
+    # single scatter-add of all entries and their hermitian conjugates
+    offdiag = rows != cols
+    flat_idx = np.concatenate(
+        [rows * num_sites + cols, (cols * num_sites + rows)[offdiag]]
+    )
+    tb_vals = np.concatenate([tb_vals, tb_vals[offdiag]])
+    matrix = np.bincount(flat_idx, weights=tb_vals, minlength=num_sites**2)
+    return matrix.reshape(num_sites, num_sites)
+
+
+def get_tb_param_table(tb_param_dict, tb_strs, tb_sites):
+    """Arranges the tight-binding parameters in a table indexed by the parameter type,
+    the site of the old state and the site of the new state.
+
+    Parameters
+    ----------
+    tb_param_dict : Dict[str, float]
+        Dictionary of tight-binding parameters.
+    tb_strs : List[str]
+        The parameter types (e.g., 'E', 't', 'h').
+    tb_sites : List[str]
+        The tight-binding sites (e.g., 'G', 'C').
+
+    Returns
+    -------
+    np.ndarray
+        The table of shape (len(tb_strs), len(tb_sites), len(tb_sites)). Missing
+        parameters are NaN.
+
+    Notes
+    -----
+    .. note::
+
+        Site energies only depend on the site of the old state. For interstrand
+        hopping ('h', 'r+' and 'r-') the direction is not important, such that
+        the reversed parameter is used if the parameter is not given.
+
+    Examples
+    --------
+    >>> get_tb_param_table({"E_G": 1.0, "h_GC": 0.5}, ["E", "h"], ["C", "G"])
+    array([[[nan, nan],
+            [1. , 1. ]],
+    <BLANKLINE>
+           [[nan, 0.5],
+            [0.5, nan]]])
+    """
+
+    param_table = np.full((len(tb_strs), len(tb_sites), len(tb_sites)), np.nan)
+    for slot, tb_str in enumerate(tb_strs):
+        for old_idx, old_site in enumerate(tb_sites):
+            if tb_str == "E":
+                param_table[slot, old_idx] = tb_param_dict.get(f"E_{old_site}", np.nan)
+                continue
+            for new_idx, new_site in enumerate(tb_sites):
+                tb_val = tb_param_dict.get(f"{tb_str}_{old_site}{new_site}")
+                if tb_val is None and tb_str[0] in ["h", "r"]:
+                    tb_val = tb_param_dict.get(f"{tb_str}_{new_site}{old_site}")
+                if tb_val is not None:
+                    param_table[slot, old_idx, new_idx] = tb_val
+    return param_table
 
 
 def tb_ham_2P(
@@ -122,8 +188,12 @@ def tb_ham_2P(
     tb_param_dict_hole,
     tb_param_dict_exciton,
     tb_basis_sites_dict,
+    sparse=False,
 ):
-    """Constructs the electron-hole tight-binding Hamiltonian matrix.
+    """Constructs the electron-hole tight-binding Hamiltonian matrix
+    :math:`H_e \\otimes I + I \\otimes H_h` with the exciton hopping between the
+    states with electron and hole on the same site. The matrix is assembled from sparse
+    Kronecker products.
 
     Parameters
     ----------
@@ -137,10 +207,13 @@ def tb_ham_2P(
         Exciton tight-binding parameters.
     tb_basis_sites_dict : Dict[str, str]
         Dictionary mapping the TB basis to the TB sites.
+    sparse : bool, optional
+        If True, the matrix is returned as ``scipy.sparse.csr_matrix``. Default is
+        False.
 
     Returns
     -------
-    np.ndarray
+    np.ndarray or scipy.sparse.csr_matrix
         The electron-hole tight-binding Hamiltonian matrix.
 
     Examples
@@ -159,20 +232,23 @@ def tb_ham_2P(
     matrix_hole = tb_ham_1P(tb_model, tb_param_dict_hole, tb_basis_sites_dict)
     matrix_exciton = tb_ham_1P(tb_model, tb_param_dict_exciton, tb_basis_sites_dict)
 
-    dim = matrix_exciton.shape[0]
-    matrix = np.zeros((dim**2, dim**2))
+    dim = tb_model.num_sites
+    identity = sp.identity(dim, format="csr")
+    matrix = sp.kron(sp.csr_matrix(matrix_electron), identity) + sp.kron(
+        identity, sp.csr_matrix(matrix_hole)
+    )
 
-    # exciton matrix
-    if not np.allclose(matrix_exciton, np.zeros((dim, dim))):
-        for i, j in product(range(dim), repeat=2):
-            basis_matrix = np.zeros((dim, dim))
-            basis_matrix[i, j] = 1
-            matrix += matrix_exciton[i, j] * np.kron(basis_matrix, basis_matrix)
+    # the exciton hops between the states (i, i) and (j, j) with index i * dim + i
+    rows, cols = np.nonzero(matrix_exciton)
+    if len(rows):
+        matrix += sp.coo_matrix(
+            (matrix_exciton[rows, cols], (rows * (dim + 1), cols * (dim + 1))),
+            shape=(dim**2, dim**2),
+        )
 
-    matrix += np.kron(np.eye(tb_model.num_sites), matrix_hole) + np.kron(
-        matrix_electron, np.eye(tb_model.num_sites)
-    )
-    return matrix
+    if sparse:
+        return sp.csr_matrix(matrix)
+    return matrix.toarray()
 
 
 def add_groundstate(matrix):
@@ -180,12 +256,12 @@ def add_groundstate(matrix):
 
     Parameters
     ----------
-    matrix : np.ndarray
+    matrix : np.ndarray or scipy.sparse.spmatrix
         Input matrix.
 
     Returns
     -------
-    np.ndarray
+    np.ndarray or scipy.sparse.csr_matrix
         Matrix with an additional dimension for the ground state.
 
     Examples
@@ -196,6 +272,9 @@ def add_groundstate(matrix):
            [0., 3., 4.]])
     """
 
+    if sp.issparse(matrix):
+        return sp.block_diag([sp.csr_matrix((1, 1)), matrix], format="csr")
+
     N = matrix.shape[0]
     matrix = np.r_[np.zeros((1, N)), matrix]
     matrix = np.c_[np.zeros((N + 1, 1)), matrix]
@@ -207,12 +286,12 @@ def delete_groundstate(matrix):
 
     Parameters
     ----------
-    matrix : np.ndarray
+    matrix : np.ndarray or scipy.sparse.spmatrix
         Input matrix with ground state dimension.
 
     Returns
     -------
-    np.ndarray
+    np.ndarray or scipy.sparse.spmatrix
         Matrix without the ground state dimension.
 
     Examples
@@ -225,6 +304,51 @@ def delete_groundstate(matrix):
     return matrix[1:, 1:]
 
 
+def get_interaction_diag(eh_basis, interaction_type, nn_cutoff=False):
+    """Calculates the diagonal of the interaction between electron and hole for a unit
+    interaction parameter. Since the interaction is linear in the interaction parameter,
+    the interaction for any parameter is obtained by rescaling.
+
+    Parameters
+    ----------
+    eh_basis : List[Tuple[str, str]]
+        List of electron and hole positions as tuples of strings.
+    interaction_type : str
+        The type of interaction. Either 'Coulomb' or 'Exchange'.
+    nn_cutoff : bool, optional
+        If True, only nearest neighbor interactions are considered.
+
+    Returns
+    -------
+    np.ndarray
+        The interaction strengths of the electron-hole basis states.
+
+    Examples
+    --------
+    >>> eh_basis = [("(0, 0)", "(0, 0)"), ("(0, 0)", "(0, 1)")]
+    >>> get_interaction_diag(eh_basis, "Coulomb")
+    array([1.        , 0.22727273])
+    """
+
+    distance_list = get_eh_distance(eh_basis)
+    assert interaction_type in [
+        "Coulomb",
+        "Exchange",
+    ], "Interaction type not supported."
+
+    # as used by Bittner
+    interaction_diag = []
+    if interaction_type == "Coulomb":
+        interaction_diag = 1 / (1 + 3.4 / 1 * distance_list)
+    elif interaction_type == "Exchange":
+        interaction_diag = np.exp(-3.4 / 0.5 * distance_list)
+
+    # nearest neighbor cutoff
+    if nn_cutoff:
+        interaction_diag[distance_list > 1] = 0
+    return interaction_diag
+
+
 def add_interaction(
     matrix,
     eh_basis,
@@ -237,7 +361,7 @@ def add_interaction(
 
     Parameters
     ----------
-    matrix : np.ndarray
+    matrix : np.ndarray or scipy.sparse.spmatrix
         The initial Hamiltonian matrix.
     eh_basis : List[Tuple[str, str]]
         List of electron and hole positions as tuples of strings.
@@ -250,7 +374,7 @@ def add_interaction(
 
     Returns
     -------
-    np.ndarray
+    np.ndarray or scipy.sparse.csr_matrix
         Hamiltonian matrix with interaction terms added.
 
     Notes
@@ -269,32 +393,13 @@ def add_interaction(
            [1.17639077, 0.        ]])
     """
 
-    distance_list = get_eh_distance(eh_basis)
-    assert interaction_type in [
-        "Coulomb",
-        "Exchange",
-    ], "Interaction type not supported."
-
-    # as used by Bittner
-    interaction_strength_list = []
-    if interaction_type == "Coulomb":
-        interaction_strength_list = interaction_param / (1 + 3.4 / 1 * distance_list)
-    elif interaction_type == "Exchange":
-        interaction_strength_list = interaction_param * np.exp(
-            -3.4 / 0.5 * distance_list
-        )
-
-    # nearest neighbor cutoff
-    if nn_cutoff:
-        for i in np.where(distance_list > 1):
-            interaction_strength_list[i] = 0
+    interaction_strength_list = interaction_param * get_interaction_diag(
+        eh_basis, interaction_type, nn_cutoff=nn_cutoff
+    )
 
     # add interaction terms on the diagonal for exciton states
-    for eh_basis_state_idx, interaction_strength in enumerate(
-        interaction_strength_list
-    ):
-        eh_basis_state = eh_basis[eh_basis_state_idx]
-        matrix = set_matrix_element(
-            matrix, interaction_strength, eh_basis_state, eh_basis_state, eh_basis
-        )
+    if sp.issparse(matrix):
+        return sp.csr_matrix(matrix + sp.diags(interaction_strength_list))
+    matrix = np.array(matrix, dtype=float)
+    matrix[np.diag_indices_from(matrix)] += interaction_strength_list
     return matrix
@@ -1,3 +1,4 @@
 from .tb_model import *
 from .tb_config import *
 from .tb_basis import *
+from .tb_symmetry import *
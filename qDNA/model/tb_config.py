@@ -10,10 +10,12 @@ Shortcuts
 - FC: Fully Connected
 """
 
+import numpy as np
+
 from .. import TB_MODELS_PROPS
 from ..tools import TB_MODELS
 
-__all__ = ["get_tb_config", "TB_MODELS_PROPS"]
+__all__ = ["get_tb_config", "get_tb_config_indices", "TB_MODELS_PROPS"]
 
 # --------------------------------------------------------------------------
 
@@ -272,3 +274,41 @@ def get_tb_config(tb_model_name, tb_dims):
     tb_model_name = tb_model_name.upper()
     _, num_sites_per_strand = tb_dims
     return TB_CONFIGS[tb_model_name](num_sites_per_strand)
+
+
+def get_tb_config_indices(tb_config, tb_basis):
+    """Precompiles a tight-binding configuration into integer arrays, such that
+    Hamiltonians can be assembled without string operations on the basis states.
+
+    Parameters
+    ----------
+    tb_config : list of tuple
+        The configuration of the tight-binding model.
+    tb_basis : List[str]
+        The list of tight-binding basis states.
+
+    Returns
+    -------
+    tuple
+        tb_strs : List[str]
+            The parameter types of the configuration (e.g., 'E', 't', 'h').
+        slots : np.ndarray
+            The index of the parameter type in ``tb_strs`` for each entry.
+        rows : np.ndarray
+            The indices of the new states in ``tb_basis``.
+        cols : np.ndarray
+            The indices of the old states in ``tb_basis``.
+
+    Examples
+    --------
+    >>> tb_config = get_tb_config("WM", (1, 2))
+    >>> get_tb_config_indices(tb_config, ["(0, 0)", "(0, 1)"])
+    (['E', 't'], array([0, 0, 1]), array([0, 1, 1]), array([0, 1, 0]))
+    """
+
+    basis_idx = {tb_state: idx for idx, tb_state in enumerate(tb_basis)}
+    tb_strs = list(dict.fromkeys(tb_str for tb_str, _, _ in tb_config))
+    slots = np.array([tb_strs.index(tb_str) for tb_str, _, _ in tb_config], dtype=int)
+    rows = np.array([basis_idx[new_state] for _, new_state, _ in tb_config], dtype=int)
+    cols = np.array([basis_idx[old_state] for _, _, old_state in tb_config], dtype=int)
+    return tb_strs, slots, rows, cols
@@ -5,17 +5,35 @@ This module defines two classes for tight-binding models: Custom_TB_Model and TB
 - TB_Model provides a predefined tight-binding model based on the model name and dimensions, and retrieves the corresponding properties, configurations, and basis states.
 """
 
+from functools import cached_property, lru_cache
+
 from ..tools import DEFAULTS
 from .. import TB_MODELS_PROPS
 
 from .tb_basis import get_tb_basis, get_eh_basis
-from .tb_config import get_tb_config
+from .tb_config import get_tb_config, get_tb_config_indices
 
 __all__ = ["Custom_TB_Model", "TB_Model"]
 
 # ------------------------------------------------------------------------------------------------------------
 
 
+@lru_cache(maxsize=None)
+def _get_tb_config_indices(tb_model_name, tb_dims):
+    """Precompiles the configuration of a predefined model once per model name and
+    dimensions, such that the instances for a batch of sequences share the index
+    arrays. The arrays are read-only, since they are shared."""
+
+    tb_config = get_tb_config(tb_model_name, tb_dims)
+    tb_strs, slots, rows, cols = get_tb_config_indices(tb_config, get_tb_basis(tb_dims))
+    for array in (slots, rows, cols):
+        array.flags.writeable = False
+    return tuple(tb_strs), slots, rows, cols
+
+
+# ------------------------------------------------------------------------------------------------------------
+
+
 class Custom_TB_Model:
     """A class to define a custom tight-binding model.
 
@@ -46,6 +64,10 @@ class Custom_TB_Model:
         The configurations of the model.
     tb_basis : list of str
         The basis states of the model.
+    tb_config_indices : tuple
+        The configurations as integer arrays (parameter types, parameter slots, rows
+        and columns) used to assemble the Hamiltonian. They are computed on first
+        access.
     verbose : bool
         Verbose mode for printing debug information.
     """
@@ -84,6 +106,10 @@ class Custom_TB_Model:
         if self.verbose:
             print("Successfully initialized the Custom_TB_Model instance.")
 
+    @cached_property
+    def tb_config_indices(self):  # pylint: disable=missing-function-docstring
+        return get_tb_config_indices(self.tb_config, self.tb_basis)
+
     def __vars__(self) -> dict:
         """Returns the instance variables as a dictionary."""
         return vars(self)
@@ -128,6 +154,10 @@ class TB_Model:
         The configurations of the model.
     tb_basis : list of str
         The basis states of the model.
+    tb_config_indices : tuple
+        The configurations as integer arrays (parameter types, parameter slots, rows
+        and columns) used to assemble the Hamiltonian. They are shared between all
+        instances with the same model name and dimensions.
     eh_basis : list of str
         The electron-hole basis states of the model.
     verbose : bool
@@ -165,6 +195,9 @@ class TB_Model:
 
         self.tb_config = get_tb_config(self.tb_model_name, self.tb_dims)
         self.tb_basis = get_tb_basis(self.tb_dims)
+        self.tb_config_indices = _get_tb_config_indices(
+            self.tb_model_name, self.tb_dims
+        )
         self.eh_basis = get_eh_basis(self.tb_dims)
 
         if self.verbose:
@@ -0,0 +1,233 @@
+"""This module provides functions for the reflection symmetry of tight-binding models.
+Self-complementary sequences (e.g., GCGC) are invariant under swapping the strands and
+reversing the sites, :math:`(s, i) \\to (S - 1 - s, n - 1 - i)`. Since this reflection
+is an involution, the basis splits into a symmetric and an antisymmetric sector, in
+which invariant matrices are block-diagonal.
+
+Shortcuts
+---------
+- tb: tight-binding
+- eh: electron-hole
+- perm: permutation
+- dim: dimension
+"""
+
+import numpy as np
+import scipy.sparse as sp
+
+from .tb_basis import str_to_tuple
+
+__all__ = [
+    "get_reflection_perm",
+    "get_eh_perm",
+    "get_liouville_perm",
+    "is_perm_symmetric",
+    "get_sector_basis",
+    "get_sector_eigensystem",
+]
+
+# ------------------------------------------------------------------------------
+
+
+def get_reflection_perm(tb_dims, tb_basis):
+    """Returns the permutation of the tight-binding basis that swaps the strands and
+    reverses the sites.
+
+    Parameters
+    ----------
+    tb_dims : tuple
+        The dimensions of the model (number of strands, number of sites per strand).
+    tb_basis : List[str]
+        The list of tight-binding site basis states.
+
+    Returns
+    -------
+    np.ndarray
+        The permutation, i.e., the basis state ``perm[i]`` is the image of the basis
+        state ``i``.
+
+    Examples
+    --------
+    >>> get_reflection_perm((2, 2), ['(0, 0)', '(0, 1)', '(1, 0)', '(1, 1)'])
+    array([3, 2, 1, 0])
+    """
+
+    num_strands, num_sites_per_strand = tb_dims
+    images = [
+        str((num_strands - 1 - strand, num_sites_per_strand - 1 - site))
+        for strand, site in map(str_to_tuple, tb_basis)
+    ]
+    return np.array([tb_basis.index(image) for image in images])
+
+
+def get_eh_perm(perm, groundstate=False):
+    """Returns the permutation of the electron-hole basis that applies the permutation
+    of the tight-binding basis to both particles.
+
+    Parameters
+    ----------
+    perm : np.ndarray
+        The permutation of the tight-binding basis.
+    groundstate : bool, optional
+        If True, the ground state is prepended as a fixed point. Default is False.
+
+    Returns
+    -------
+    np.ndarray
+        The permutation of the electron-hole basis.
+
+    Examples
+    --------
+    >>> get_eh_perm(np.array([1, 0]), groundstate=True)
+    array([0, 4, 3, 2, 1])
+    """
+
+    num_sites = len(perm)
+    eh_perm = (num_sites * perm[:, None] + perm[None, :]).ravel()
+    if groundstate:
+        eh_perm = np.r_[0, eh_perm + 1]
+    return eh_perm
+
+
+def get_liouville_perm(perm):
+    """Returns the permutation of column-stacked density matrices
+    :math:`\\rho \\to P \\rho P^T`.
+
+    Parameters
+    ----------
+    perm : np.ndarray
+        The permutation of the basis of dimension :math:`D`.
+
+    Returns
+    -------
+    np.ndarray
+        The permutation of dimension :math:`D^2`.
+
+    Examples
+    --------
+    >>> get_liouville_perm(np.array([1, 0]))
+    array([3, 2, 1, 0])
+    """
+
+    dim = len(perm)
+    return (perm[:, None] + dim * perm[None, :]).ravel(order="F")
+
+
+def is_perm_symmetric(matrix, perm, tol=1e-10):
+    """Checks whether a matrix is invariant under a permutation of its basis.
+
+    Parameters
+    ----------
+    matrix : np.ndarray or scipy.sparse.spmatrix
+        The matrix.
+    perm : np.ndarray
+        The permutation of the basis.
+    tol : float, optional
+        Tolerance relative to the largest matrix element. Default is 1e-10.
+
+    Returns
+    -------
+    bool
+        True if the matrix commutes with the permutation.
+
+    Examples
+    --------
+    >>> is_perm_symmetric(np.array([[1, 2], [2, 1]]), np.array([1, 0]))
+    True
+    """
+
+    matrix = sp.csr_matrix(matrix)
+    deviation = abs(matrix[perm][:, perm] - matrix)
+    scale = abs(matrix).max() if matrix.nnz else 1.0
+    return deviation.max() <= tol * scale if deviation.nnz else True
+
+
+def get_sector_basis(perm):
+    """Returns the orthonormal bases of the symmetric and antisymmetric sector of an
+    involution. Fixed points are symmetric, each pair of exchanged basis states gives a
+    symmetric and an antisymmetric combination.
+
+    Parameters
+    ----------
+    perm : np.ndarray
+        The permutation of the basis, which must be an involution.
+
+    Returns
+    -------
+    tuple
+        The sector bases as sparse matrices of shape (D, D_+) and (D, D_-) with the
+        basis vectors as columns.
+
+    Examples
+    --------
+    >>> basis_plus, basis_minus = get_sector_basis(np.array([1, 0, 2]))
+    >>> basis_plus.toarray()
+    array([[0.70710678, 0.        ],
+           [0.70710678, 0.        ],
+           [0.        , 1.        ]])
+    """
+
+    perm = np.asarray(perm)
+    dim = len(perm)
+    assert np.all(perm[perm] == np.arange(dim)), "perm must be an involution"
+
+    states = np.arange(dim)
+    pairs = states[states < perm]
+    fixed_points = states[states == perm]
+
+    num_pairs, num_fixed_points = len(pairs), len(fixed_points)
+    pair_idx = np.tile(np.arange(num_pairs), 2)
+    norm = 1 / np.sqrt(2)
+
+    basis_plus = sp.csr_matrix(
+        (
+            np.r_[np.full(2 * num_pairs, norm), np.ones(num_fixed_points)],
+            (
+                np.r_[pairs, perm[pairs], fixed_points],
+                np.r_[pair_idx, num_pairs + np.arange(num_fixed_points)],
+            ),
+        ),
+        shape=(dim, num_pairs + num_fixed_points),
+    )
+    basis_minus = sp.csr_matrix(
+        (
+            np.r_[np.full(num_pairs, norm), np.full(num_pairs, -norm)],
+            (np.r_[pairs, perm[pairs]], pair_idx),
+        ),
+        shape=(dim, num_pairs),
+    )
+    return basis_plus, basis_minus
+
+
+def get_sector_eigensystem(matrix, perm):
+    """Computes the eigensystem of a Hermitian matrix that is invariant under an
+    involution by diagonalizing the blocks of the symmetric and antisymmetric sector.
+
+    Parameters
+    ----------
+    matrix : np.ndarray or scipy.sparse.spmatrix
+        The Hermitian matrix.
+    perm : np.ndarray
+        The involution under which the matrix is invariant.
+
+    Returns
+    -------
+    tuple
+        eigenvalues : np.ndarray
+            The eigenvalues in ascending order.
+        eigenvectors : np.ndarray
+            The eigenvectors as columns.
+    """
+
+    eigv, eigs = [], []
+    for basis in get_sector_basis(perm):
+        if basis.shape[1]:
+            block = basis.T @ matrix @ basis
+            if sp.issparse(block):
+                block = block.toarray()
+            block_eigv, block_eigs = np.linalg.eigh(block)
+            eigv.append(block_eigv)
+            eigs.append(basis @ block_eigs)
+    eigv, eigs = np.concatenate(eigv), np.hstack(eigs)
+    order = np.argsort(eigv)
+    return eigv[order], eigs[:, order]
@@ -13,5 +13,8 @@ PARTICLES: list = CONFIGS["PARTICLES"]
 UNITS: list = CONFIGS["UNITS"]
 T_UNITS: list = CONFIGS["T_UNITS"]
 SPECTRAL_DENSITIES: list = CONFIGS["SPECTRAL_DENSITIES"]
+SOLVER_ENGINES: list = CONFIGS["SOLVER_ENGINES"]
+SOLVER_METHODS: list = CONFIGS["SOLVER_METHODS"]
+PRECISIONS: list = CONFIGS["PRECISIONS"]
 
 from .check_input import *
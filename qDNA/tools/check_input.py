@@ -21,6 +21,7 @@ def check_ham_kwargs(**ham_kwargs):
         - 'exchange_param' (float or int): Interaction parameter.
         - 'relaxation' (bool): Relaxation flag.
         - 'nn_cutoff' (bool): Nearest neighbor cutoff flag.
+        - 'sparse' (bool): Flag for a sparse 2P Hamiltonian matrix.
         - 'particles' (list of str): List of particles involved.
     Raises
     ------
@@ -30,7 +31,7 @@ def check_ham_kwargs(**ham_kwargs):
         - 'source', 'description', and 'unit' must be of type str.
         - 'coulomb_param' must be of type float or int.
         - 'exchange_param' must be of type float or int.
-        - 'relaxation' and 'nn_cutoff' must be of type bool.
+        - 'relaxation', 'nn_cutoff' and 'sparse' must be of type bool.
         - 'particles' must be a list of strings.
         - All elements of 'particles' must be in CONFIG["PARTICLES"].
         - If 'description' is "1P", 'particles' must be either ["electron"] or ["hole"].
@@ -50,7 +51,7 @@ def check_ham_kwargs(**ham_kwargs):
     float_keys = ["coulomb_param", "exchange_param"]
     for key in float_keys:
         assert isinstance(kwargs.get(key), (float, int)), f"{key} must be of type float"
-    bool_keys = ["relaxation", "nn_cutoff"]
+    bool_keys = ["relaxation", "nn_cutoff", "sparse"]
     for key in bool_keys:
         assert isinstance(kwargs.get(key), bool), f"{key} must be of type bool"
     assert isinstance(kwargs.get("particles"), list), "particles must be of type list"
@@ -167,6 +168,21 @@ def check_me_kwargs(**me_kwargs):
         - "t_unit" (str): Time unit, must be one of the values in CONFIG["T_UNITS"].
         - "t_steps" (float or int): Number of time steps.
         - "t_end" (float or int): End time.
+        - "solver_engine" (str): Engine used to solve the master equation, must be one of the values in CONFIG["SOLVER_ENGINES"].
+        - "solver_method" (str): Integration method of qutip, must be one of the values in CONFIG["SOLVER_METHODS"].
+        - "solver_atol" (float): Absolute tolerance of the integrator.
+        - "solver_rtol" (float): Relative tolerance of the integrator.
+        - "solver_nsteps" (int): Maximum number of integrator steps between two time points.
+        - "solver_max_step" (float): Maximum step size of the integrator (0 means no limit).
+        - "krylov_tol" (float): Tolerance of the Krylov engine.
+        - "krylov_dim" (int): Dimension of the Krylov subspace.
+        - "krylov_max_memory" (float or int): Memory ceiling for the Krylov basis in MB.
+        - "mcwf_num_traj" (int): Number of quantum trajectories.
+        - "mcwf_seed" (int): Seed for the quantum trajectories.
+        - "mcwf_num_cpu" (int): Number of processes for the quantum trajectories.
+        - "reduce_groundstate" (bool): Flag for dropping the ground state coherences.
+        - "use_symmetry" (bool): Flag for the reduction to reflection symmetry sectors.
+        - "precision" (str): Floating-point precision of the Liouvillian engines, must be one of the values in CONFIG["PRECISIONS"].
     Raises
     ------
     AssertionError
@@ -175,6 +191,13 @@ def check_me_kwargs(**me_kwargs):
         - "init_e_state", "init_h_state", and "t_unit" must be of type str.
         - "t_steps" and "t_end" must be of type float or int.
         - "t_unit" must be in CONFIG["T_UNITS"].
+        - "solver_engine" must be in CONFIG["SOLVER_ENGINES"].
+        - "solver_method" must be in CONFIG["SOLVER_METHODS"].
+        - "solver_atol", "solver_rtol" and "solver_nsteps" must be positive, "solver_max_step" must be non-negative.
+        - "krylov_tol", "krylov_dim" and "krylov_max_memory" must be positive.
+        - "mcwf_num_traj" must be at least 2, "mcwf_seed" and "mcwf_num_cpu" must be non-negative.
+        - "reduce_groundstate" and "use_symmetry" must be of type bool.
+        - "precision" must be in CONFIG["PRECISIONS"].
     """
 
     # check for None values
@@ -182,14 +205,53 @@ def check_me_kwargs(**me_kwargs):
 
     # check datatypes
     kwargs = me_kwargs
-    string_keys = ["init_e_state", "init_h_state", "t_unit"]
+    string_keys = [
+        "init_e_state",
+        "init_h_state",
+        "t_unit",
+        "solver_engine",
+        "solver_method",
+        "precision",
+    ]
     for key in string_keys:
         assert isinstance(kwargs.get(key), str), f"{key} must be of type str"
-    float_keys = ["t_steps", "t_end"]
+    float_keys = [
+        "t_steps",
+        "t_end",
+        "solver_atol",
+        "solver_rtol",
+        "solver_nsteps",
+        "solver_max_step",
+        "krylov_tol",
+        "krylov_dim",
+        "krylov_max_memory",
+        "mcwf_num_traj",
+        "mcwf_seed",
+        "mcwf_num_cpu",
+    ]
     for key in float_keys:
         assert isinstance(kwargs.get(key), (float, int)), f"{key} must be of type float"
+    for key in ["reduce_groundstate", "use_symmetry"]:
+        assert isinstance(kwargs.get(key), bool), f"{key} must be of type bool"
 
     # check values
     assert (
         kwargs["t_unit"] in CONFIG["T_UNITS"]
     ), f"t_unit must be in {CONFIG['T_UNITS']}"
+    assert (
+        kwargs["solver_engine"] in CONFIG["SOLVER_ENGINES"]
+    ), f"solver_engine must be in {CONFIG['SOLVER_ENGINES']}"
+    assert (
+        kwargs["solver_method"] in CONFIG["SOLVER_METHODS"]
+    ), f"solver_method must be in {CONFIG['SOLVER_METHODS']}"
+    assert (
+        kwargs["precision"] in CONFIG["PRECISIONS"]
+    ), f"precision must be in {CONFIG['PRECISIONS']}"
+    for key in ["solver_atol", "solver_rtol", "solver_nsteps"]:
+        assert kwargs[key] > 0, f"{key} must be positive"
+    assert kwargs["solver_max_step"] >= 0, "solver_max_step must be non-negative"
+    for key in ["krylov_tol", "krylov_dim", "krylov_max_memory"]:
+        assert kwargs[key] > 0, f"{key} must be positive"
+    assert kwargs["mcwf_num_traj"] >= 2, "mcwf_num_traj must be at least 2"
+    for key in ["mcwf_seed", "mcwf_num_cpu"]:
+        assert kwargs[key] >= 0, f"{key} must be non-negative"
@@ -1,6 +1,7 @@
 """This module provides functions for analyzing Hamiltonians in quantum systems,
 including calculations of average population, amplitudes, frequencies, population using
-Fourier series, and inverse participation ratio (IPR).
+Fourier series, unitary time evolution of density matrices and inverse participation
+ratio (IPR).
 
 Notes
 -----
@@ -11,10 +12,9 @@ Notes
 - val: value
 - dims: dimensions
 - init: initial
+- dm: density matrix
 """
 
-from itertools import product
-
 import numpy as np
 
 __all__ = [
@@ -22,6 +22,8 @@ __all__ = [
     "calc_amplitudes",
     "calc_frequencies",
     "get_pop_fourier",
+    "get_dm_fourier",
+    "get_expect_fourier",
     "calc_ipr_hamiltonian",
 ]
 
@@ -67,17 +69,10 @@ def calc_amplitudes(eigs, init_state, end_state):
     np.ndarray
         A list of amplitudes for transitions.
     """
-    matrix_dimension = eigs.shape[0]
-    amplitudes = [
-        2
-        * eigs[end_state, i]
-        * eigs[init_state, i]
-        * eigs[end_state, j]
-        * eigs[init_state, j]
-        for i, j in product(range(matrix_dimension), repeat=2)
-        if i < j
-    ]
-    return np.real(np.array(amplitudes))
+    overlaps = eigs[end_state, :] * eigs[init_state, :]
+    rows, cols = np.triu_indices(eigs.shape[0], k=1)
+    amplitudes = 2 * overlaps[rows] * overlaps[cols]
+    return np.real(amplitudes)
 
 
 def calc_frequencies(eigv):
@@ -93,13 +88,9 @@ def calc_frequencies(eigv):
     np.ndarray
         A list of frequencies.
     """
-    matrix_dimension = len(eigv)
-    frequencies = [
-        abs(eigv[i] - eigv[j]).real
-        for i, j in product(range(matrix_dimension), repeat=2)
-        if i < j
-    ]
-    return np.array(frequencies)
+    rows, cols = np.triu_indices(len(eigv), k=1)
+    frequencies = np.abs(eigv[rows] - eigv[cols]).real
+    return frequencies
 
 
 def get_pop_fourier(t, average_pop, amplitudes, frequencies):
@@ -127,6 +118,85 @@ def get_pop_fourier(t, average_pop, amplitudes, frequencies):
     return population
 
 
+def _get_phases(times, eigv):
+    """Calculates the phase factors :math:`e^{-i (E_m - E_n) t}` for all pairs of
+    eigenvalues and all times. The returned array has the shape (T, D, D)."""
+
+    frequencies = np.subtract.outer(eigv, eigv)
+    return np.exp(-1j * np.multiply.outer(times, frequencies))
+
+
+def get_dm_fourier(times, init_dm, eigv, eigs):
+    r"""Calculates the density matrices of a closed system for all times using the
+    Fourier decomposition of the time evolution operator.
+
+    Parameters
+    ----------
+    times : np.ndarray
+        Time points.
+    init_dm : np.ndarray
+        Initial density matrix.
+    eigv : np.ndarray
+        Eigenvalue vector.
+    eigs : np.ndarray
+        Eigenvector matrix.
+
+    Returns
+    -------
+    np.ndarray
+        Density matrices of shape (T, D, D).
+
+    Notes
+    -----
+    .. note::
+
+        In the eigenbasis the density matrix elements only acquire a phase
+
+        .. math::
+            \rho_{mn}(t) = \rho_{mn}(0) e^{-i (E_m - E_n) t},
+
+        such that :math:`\rho(t) = U(t) \rho(0) U(t)^\dagger` is obtained for the
+        whole time grid with two batched basis changes.
+    """
+
+    glob_init_dm = eigs.conj().T @ init_dm @ eigs
+    glob_dms = glob_init_dm * _get_phases(times, eigv)
+    return eigs @ glob_dms @ eigs.conj().T
+
+
+def get_expect_fourier(times, init_dm, eigv, eigs, e_ops):
+    """Calculates the expectation values of observables of a closed system for all
+    times using the Fourier decomposition of the time evolution operator.
+
+    Parameters
+    ----------
+    times : np.ndarray
+        Time points.
+    init_dm : np.ndarray
+        Initial density matrix.
+    eigv : np.ndarray
+        Eigenvalue vector.
+    eigs : np.ndarray
+        Eigenvector matrix.
+    e_ops : np.ndarray
+        Observables of shape (K, D, D).
+
+    Returns
+    -------
+    np.ndarray
+        Complex expectation values of shape (K, T).
+    """
+
+    glob_init_dm = eigs.conj().T @ init_dm @ eigs
+    glob_e_ops = eigs.conj().T @ e_ops @ eigs
+
+    # Tr(O rho(t)) = sum_mn O_nm rho_mn(0) exp(-i (E_m - E_n) t)
+    dim = len(eigv)
+    coeffs = (np.transpose(glob_e_ops, (0, 2, 1)) * glob_init_dm).reshape(-1, dim**2)
+    phases = _get_phases(times, eigv).reshape(-1, dim**2)
+    return coeffs @ phases.T
+
+
 def calc_ipr_hamiltonian(eigs):
     r"""Calculates the inverse participation ratio (IPR) for each eigenstate of the
     Hamiltonian.
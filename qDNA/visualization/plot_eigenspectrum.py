@@ -28,7 +28,7 @@ def plot_eigv(ax, tb_ham, energy_unit="100meV"):
 
     # calculation
     eigv, _ = tb_ham.get_eigensystem()
-    eigv *= get_conversion(tb_ham.unit, energy_unit)
+    eigv = eigv * get_conversion(tb_ham.unit, energy_unit)
 
     # plotting
     ax.set_title("Eigenvalues")
@@ -114,13 +114,12 @@ def get_cumulative_average_pop(tb_ham, J_list):
     # pop_list contains the average population for each particle, J, and tb_site
     pop_list = np.zeros((len(tb_ham.particles), len(J_list), num_sites))
 
-    # calculate the average population for each particle, J, and tb_site using tb_ham.get_average_pop
+    # calculate the average population for each particle, J, and tb_site at once
     for J_idx, J in enumerate(J_list):
         tb_ham.coulomb_param = J
-        for tb_site_idx, tb_site in enumerate(tb_ham.tb_basis):
-            average_pop = tb_ham.get_average_pop(init_state, tb_site)
-            for particle_idx, particle in enumerate(tb_ham.particles):
-                pop_list[particle_idx][J_idx][tb_site_idx] = average_pop[particle]
+        average_pop = tb_ham.get_fourier_basis([init_state], ["average_pop"])[2]
+        for particle_idx, particle in enumerate(tb_ham.particles):
+            pop_list[particle_idx][J_idx] = average_pop[particle][0]
 
     # calculate the cumulative average population
     cumulative_pop_list = [0] * (num_sites + 1)
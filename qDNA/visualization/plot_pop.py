@@ -5,7 +5,7 @@ import numpy as np
 import matplotlib.pyplot as plt
 import seaborn as sns
 
-from qDNA.utils import calc_coherence, get_pop_fourier
+from qDNA.utils import get_pop_fourier
 from . import COLORS_PARTICLES
 
 __all__ = [
@@ -166,8 +166,6 @@ def plot_pop(ax, tb_site, me_solver, add_legend=True):
     description = me_solver.tb_ham.description
     if description == "2P":
         me_solver.get_pop()
-    elif description == "1P":
-        me_solver.get_result()
 
     # plotting
     particles = me_solver.tb_ham.particles
@@ -183,7 +181,7 @@ def plot_pop(ax, tb_site, me_solver, add_legend=True):
             tb_site_idx = tb_basis.index(tb_site)
             ax.plot(
                 me_solver.times,
-                [dm[tb_site_idx, tb_site_idx].real for dm in me_solver.result],
+                me_solver.get_trajectory(diagonal=True).get_pops()[:, tb_site_idx],
                 color=COLORS_PARTICLES[particle],
             )
 
@@ -245,8 +243,6 @@ def plot_coh(ax, me_solver):
     description = me_solver.tb_ham.description
     if description == "2P":
         me_solver.get_coh()
-    elif description == "1P":
-        me_solver.get_result()
 
     # plotting
     particles = me_solver.tb_ham.particles
@@ -261,7 +257,7 @@ def plot_coh(ax, me_solver):
         elif description == "1P":
             ax.plot(
                 me_solver.times,
-                [calc_coherence(dm.full()) for dm in me_solver.result],
+                me_solver.get_trajectory().get_coherence(),
                 label=particle,
                 color=COLORS_PARTICLES[particle],
             )
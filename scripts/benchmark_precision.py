@@ -0,0 +1,73 @@
+"""Benchmarks the speed and accuracy of single precision (complex64) against double
+precision (complex128) in the Liouvillian engines for all tight-binding models.
+
+For each model and engine the script reports the run times of the populations and the
+exciton lifetime in both precisions, the largest absolute deviation of the populations
+and the relative deviation of the lifetime.
+
+Usage: python scripts/benchmark_precision.py [--upper_strand GC] [--engines ...]
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from qDNA.dynamics import get_me_solver
+from qDNA.evaluation import calc_lifetime
+from qDNA.tools import TB_MODELS
+
+DISS_KWARGS = {"relax_rate": 3, "loc_deph_rate": 1, "unit": "rad/ps"}
+
+
+def run(upper_strand, tb_model_name, precision, **kwargs):
+    """Returns the populations, the lifetime and the run times in one precision."""
+
+    start = time.perf_counter()
+    me_solver = get_me_solver(upper_strand, tb_model_name, precision=precision, **kwargs)
+    pop = np.array(list(me_solver.get_pop().values()))
+    pop_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    lifetime = calc_lifetime(upper_strand, tb_model_name, precision=precision, **kwargs)
+    lifetime_time = time.perf_counter() - start
+    return pop, lifetime, pop_time, lifetime_time
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--upper_strand", default="GC")
+    parser.add_argument("--tb_models", nargs="+", default=TB_MODELS)
+    parser.add_argument(
+        "--engines", nargs="+", default=["propagator", "spectral", "krylov"]
+    )
+    args = parser.parse_args()
+
+    print(
+        f"{'model':>6} {'engine':>10} | {'pop [s]':>15} | {'lifetime [s]':>15} | "
+        f"{'pop err':>8} {'lifetime err':>12}"
+    )
+    for tb_model_name in args.tb_models:
+        for engine in args.engines:
+            kwargs = {**DISS_KWARGS, "solver_engine": engine}
+            pop, lifetime, pop_time, lifetime_time = run(
+                args.upper_strand, tb_model_name, "double", **kwargs
+            )
+            pop_32, lifetime_32, pop_time_32, lifetime_time_32 = run(
+                args.upper_strand, tb_model_name, "single", **kwargs
+            )
+            pop_err = np.max(np.abs(pop_32 - pop))
+            if isinstance(lifetime, str) or isinstance(lifetime_32, str):
+                lifetime_err = np.nan
+            else:
+                lifetime_err = abs(lifetime_32 - lifetime) / lifetime
+            print(
+                f"{tb_model_name:>6} {engine:>10} | "
+                f"{pop_time:6.2f} -> {pop_time_32:6.2f} | "
+                f"{lifetime_time:6.2f} -> {lifetime_time_32:6.2f} | "
+                f"{pop_err:8.1e} {lifetime_err:12.1e}"
+            )
+
+
+if __name__ == "__main__":
+    main()
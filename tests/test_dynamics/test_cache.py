@@ -0,0 +1,84 @@
+import os
+
+import pytest
+import numpy as np
+
+from qDNA.dynamics import (
+    get_me_solver,
+    get_cache_dir,
+    get_cache_key,
+    load_cache,
+    save_cache,
+    clear_cache,
+    calc_observables,
+)
+import qDNA.dynamics.cache as cache
+
+
+def test_get_cache_dir(tmp_path, monkeypatch):
+    monkeypatch.delenv("QDNA_CACHE_DIR", raising=False)
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    assert get_cache_dir() == os.path.join(str(tmp_path), "qDNA")
+    monkeypatch.delenv("XDG_CACHE_HOME")
+    assert get_cache_dir() == os.path.join(os.path.expanduser("~"), ".cache", "qDNA")
+    monkeypatch.setenv("QDNA_CACHE_DIR", str(tmp_path / "cache"))
+    assert get_cache_dir() == str(tmp_path / "cache")
+
+
+def test_get_cache_key():
+    key = get_cache_key("GC", "ELM", ["pop"], relax_rate=3)
+    assert key == get_cache_key("GC", "ELM", ["pop"], relax_rate=3.0, t_steps=500)
+    assert key != get_cache_key("GC", "ELM", ["pop"], relax_rate=2)
+    assert key != get_cache_key("GC", "ELM", ["pop", "coh"], relax_rate=3)
+    assert key != get_cache_key("GC", "FELM", ["pop"], relax_rate=3)
+    e_op = np.diag(np.arange(5.0))
+    key = get_cache_key("GC", "ELM", [], e_ops={"dipole": e_op})
+    assert key == get_cache_key("GC", "ELM", [], e_ops={"dipole": e_op.copy()})
+    assert key != get_cache_key("GC", "ELM", [], e_ops={"dipole": 2 * e_op})
+    assert key != get_cache_key("GC", "ELM", [], e_ops={"distance": e_op})
+
+
+def test_save_cache(tmp_path):
+    data = {"pop:electron": np.arange(1000.0)}
+    assert load_cache("a", directory=tmp_path) is None
+    save_cache("a", data, directory=tmp_path)
+    assert np.allclose(load_cache("a", directory=tmp_path)["pop:electron"], data["pop:electron"])
+
+    # the least recently used entry is evicted once the size limit is exceeded
+    size = os.path.getsize(tmp_path / "a.npz") / 2**20
+    save_cache("b", data, directory=tmp_path)
+    os.utime(tmp_path / "a.npz", (0, 0))
+    save_cache("c", data, directory=tmp_path, max_size=2.5 * size)
+    assert sorted(os.listdir(tmp_path)) == ["b.npz", "c.npz"]
+
+    clear_cache(directory=tmp_path)
+    assert not os.listdir(tmp_path)
+
+
+@pytest.mark.parametrize(
+    "upper_strand, tb_model_name, kwargs",
+    [("GC", "ELM", {"relax_rate": 3, "solver_engine": "propagator"})],
+)
+def test_calc_observables(upper_strand, tb_model_name, kwargs, tmp_path, monkeypatch):
+    monkeypatch.setattr(cache, "CACHE_DIR", str(tmp_path))
+    me_solver = get_me_solver(upper_strand, tb_model_name, **kwargs)
+    e_op = np.diag(np.arange(me_solver.ham_matrix.shape[0], dtype=float))
+    observables = me_solver.observe(e_ops={"e_op": e_op})
+
+    for _ in range(2):
+        cached_observables = calc_observables(
+            upper_strand, tb_model_name, e_ops={"e_op": e_op}, **kwargs
+        )
+        for observable, cached_observable in zip(observables, cached_observables):
+            assert observable.keys() == cached_observable.keys()
+            for key, value in observable.items():
+                assert np.allclose(cached_observable[key], value)
+    assert len(os.listdir(tmp_path)) == 1
+
+    # the cache directory can be passed explicitly
+    calc_observables(upper_strand, tb_model_name, cache_dir=tmp_path / "dir", **kwargs)
+    assert len(os.listdir(tmp_path / "dir")) == 1
+
+    # cache hits do not set up the solver
+    monkeypatch.setattr(cache, "get_me_solver", None)
+    calc_observables(upper_strand, tb_model_name, e_ops={"e_op": e_op}, **kwargs)
@@ -0,0 +1,25 @@
+import pytest
+import numpy as np
+import scipy.linalg
+import scipy.sparse as sp
+
+from qDNA.dynamics import get_krylov_dim, krylov_expmv
+
+
+@pytest.mark.parametrize(
+    "vec_dim, krylov_dim, max_memory, expected",
+    [(10**6, 30, 256, 15), (100, 30, 1024, 30), (10, 30, 1024, 10)],
+)
+def test_get_krylov_dim(vec_dim, krylov_dim, max_memory, expected):
+    assert get_krylov_dim(vec_dim, krylov_dim, max_memory) == expected
+
+
+@pytest.mark.parametrize("dim, t, krylov_dim", [(50, 2.0, 10), (200, 5.0, 20)])
+def test_krylov_expmv(dim, t, krylov_dim):
+    rng = np.random.default_rng(0)
+    matrix = sp.random(dim, dim, density=0.05, random_state=rng) * (1 + 1j)
+    matrix -= sp.identity(dim)
+    vec = rng.random(dim)
+    expected = scipy.linalg.expm(t * matrix.toarray()) @ vec
+    result = krylov_expmv(matrix.tocsr(), vec, t, krylov_dim=krylov_dim)
+    assert np.allclose(result, expected)
@@ -0,0 +1,34 @@
+import pytest
+import numpy as np
+import scipy.linalg
+import scipy.sparse as sp
+
+from qDNA.dynamics import ode_propagate
+
+
+@pytest.mark.parametrize("method", ["adams", "bdf"])
+def test_ode_propagate(method):
+    rng = np.random.default_rng(0)
+    dim = 20
+    matrix = sp.random(dim, dim, density=0.2, random_state=rng) * (1 + 1j)
+    matrix -= sp.identity(dim)
+    vec = rng.random(dim)
+    times = np.linspace(0, 2, 5)
+    e_ops_matrix = rng.random((2, dim))
+
+    expected = np.array([scipy.linalg.expm(t * matrix.toarray()) @ vec for t in times])
+    kwargs = {"method": method, "atol": 1e-10, "rtol": 1e-10}
+    vecs = ode_propagate(matrix, vec, times, **kwargs)
+    assert np.allclose(vecs, expected)
+
+    values, final_vec = ode_propagate(
+        matrix, vec, times, e_ops_matrix, return_final=True, **kwargs
+    )
+    assert np.allclose(values, e_ops_matrix @ expected.T)
+    assert np.allclose(final_vec, expected[-1])
+
+
+def test_ode_propagate_nsteps():
+    matrix = sp.csr_matrix(np.diag([-1.0, -100.0]))
+    with pytest.warns(UserWarning), pytest.raises(RuntimeError):
+        ode_propagate(matrix, np.ones(2), np.array([0, 100]), nsteps=1)
@@ -0,0 +1,36 @@
+import pytest
+import numpy as np
+
+from qDNA.dynamics import get_reduced_dm
+from qDNA.environment import get_eh_observable, get_tb_observable
+
+
+def _get_reduced_dm_loop(dm, particle, tb_basis):
+    reduced_dm = np.zeros((len(tb_basis), len(tb_basis)), dtype=complex)
+    for start_state in tb_basis:
+        for end_state in tb_basis:
+            observable = get_eh_observable(tb_basis, particle, start_state, end_state)
+            value = np.trace(observable @ dm)
+            reduced_dm += value * get_tb_observable(tb_basis, start_state, end_state).T
+    return reduced_dm
+
+
+@pytest.mark.parametrize("particle", ["electron", "hole", "exciton"])
+@pytest.mark.parametrize("groundstate", [False, True])
+def test_get_reduced_dm(particle, groundstate):
+    tb_basis = ["(0, 0)", "(0, 1)", "(1, 0)"]
+    dim = len(tb_basis) ** 2 + groundstate
+    rng = np.random.default_rng(0)
+    dms = rng.normal(size=(4, dim, dim)) + 1j * rng.normal(size=(4, dim, dim))
+
+    reduced_dms = get_reduced_dm(dms, particle, tb_basis)
+    assert reduced_dms.shape == (4, len(tb_basis), len(tb_basis))
+    for dm, reduced_dm in zip(dms, reduced_dms):
+        expected = _get_reduced_dm_loop(dm[groundstate:, groundstate:], particle, tb_basis)
+        assert np.allclose(get_reduced_dm(dm, particle, tb_basis), expected)
+        assert np.allclose(reduced_dm, expected)
+
+
+def test_get_reduced_dm_invalid_particle():
+    with pytest.raises(ValueError):
+        get_reduced_dm(np.eye(4), "proton", ["(0, 0)", "(1, 0)"])
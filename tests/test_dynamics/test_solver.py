@@ -0,0 +1,443 @@
+import multiprocessing
+
+import pytest
+import numpy as np
+import qutip as q
+
+from qDNA.dynamics import get_me_solver, run_mcwf
+
+
+@pytest.mark.parametrize(
+    "upper_strand, tb_model_name, kwargs",
+    [("GC", "ELM", {"relax_rate": 3, "loc_deph_rate": 1})],
+)
+def test_observe(upper_strand, tb_model_name, kwargs):
+    me_solver = get_me_solver(upper_strand, tb_model_name, **kwargs)
+    pop, coh, groundstate_pop, _ = me_solver.observe()
+
+    me_solver_ref = get_me_solver(upper_strand, tb_model_name, **kwargs)
+    for key, value in me_solver_ref.get_pop().items():
+        assert np.allclose(pop[key], value)
+    for key, value in me_solver_ref.get_coh().items():
+        assert np.allclose(coh[key], value)
+    assert np.allclose(
+        groundstate_pop["groundstate"],
+        me_solver_ref.get_groundstate_pop()["groundstate"],
+    )
+
+
+@pytest.mark.parametrize(
+    "upper_strand, tb_model_name, kwargs",
+    [
+        ("GCG", "ELM", {}),
+        ("GC", "ELM", {"description": "1P", "particles": ["hole"]}),
+    ],
+)
+def test_unitary_engine(upper_strand, tb_model_name, kwargs):
+    me_solver = get_me_solver(upper_strand, tb_model_name, **kwargs)
+    assert me_solver._get_solver_engine() == "unitary"
+    me_solver_ref = get_me_solver(
+        upper_strand, tb_model_name, solver_engine="qutip", **kwargs
+    )
+    for key, value in me_solver_ref.get_pop().items():
+        assert np.allclose(me_solver.get_pop()[key], value, atol=1e-3)
+    for dm, dm_ref in zip(me_solver.get_result(), me_solver_ref.get_result()):
+        assert np.allclose(dm.full(), dm_ref.full(), atol=5e-3)
+
+
+@pytest.mark.parametrize(
+    "upper_strand, tb_model_name, kwargs",
+    [
+        ("GC", "ELM", {"relax_rate": 3, "loc_deph_rate": 1}),
+        ("GCG", "ELM", {"glob_deph_rate": 1, "description": "1P", "particles": ["hole"]}),
+    ],
+)
+def test_propagator_engine(upper_strand, tb_model_name, kwargs):
+    me_solver = get_me_solver(
+        upper_strand, tb_model_name, solver_engine="propagator", **kwargs
+    )
+    me_solver_ref = get_me_solver(
+        upper_strand, tb_model_name, solver_engine="qutip", **kwargs
+    )
+    for key, value in me_solver_ref.get_pop().items():
+        assert np.allclose(me_solver.get_pop()[key], value, atol=1e-3)
+    for dm, dm_ref in zip(me_solver.get_result(), me_solver_ref.get_result()):
+        assert np.allclose(dm.full(), dm_ref.full(), atol=5e-3)
+
+
+@pytest.mark.parametrize(
+    "upper_strand, tb_model_name, kwargs",
+    [
+        ("GCG", "ELM", {"relax_rate": 3, "unit": "rad/ps"}),
+        ("GC", "ELM", {"relax_rate": 3, "unit": "rad/ps", "solver_engine": "propagator"}),
+    ],
+)
+def test_get_event_time(upper_strand, tb_model_name, kwargs):
+    me_solver = get_me_solver(upper_strand, tb_model_name, **kwargs)
+    gs_op = me_solver.lindblad_diss.groundstate_pop_ops["groundstate"]
+    threshold = 1 - 1 / np.e
+    gs_pop = np.array(me_solver.get_groundstate_pop()["groundstate"])
+    index = np.nonzero(gs_pop >= threshold)[0][0]
+
+    grid_time = me_solver.get_event_time(gs_op, threshold, refine=False)
+    assert grid_time == pytest.approx(me_solver.times[index])
+    event_time = me_solver.get_event_time(gs_op, threshold)
+    assert me_solver.times[index - 1] <= event_time <= me_solver.times[index]
+    assert me_solver.get_event_time(gs_op, 2) is None
+    # the refinement does not replace the propagator of the time grid
+    if me_solver._propagator is not None:
+        dt = me_solver.times[1] - me_solver.times[0]
+        assert me_solver._propagator[0] == pytest.approx(dt)
+
+
+@pytest.mark.parametrize(
+    "upper_strand, tb_model_name, kwargs",
+    [("GC", "ELM", {"relax_rate": 3, "loc_deph_rate": 1})],
+)
+def test_spectral_engine(upper_strand, tb_model_name, kwargs):
+    me_solver = get_me_solver(
+        upper_strand, tb_model_name, solver_engine="spectral", **kwargs
+    )
+    me_solver_ref = get_me_solver(
+        upper_strand, tb_model_name, solver_engine="propagator", **kwargs
+    )
+    for key, value in me_solver_ref.get_pop().items():
+        assert np.allclose(me_solver.get_pop()[key], value)
+    for dm, dm_ref in zip(me_solver.get_result(), me_solver_ref.get_result()):
+        assert np.allclose(dm.full(), dm_ref.full())
+
+    decay_rates = me_solver.get_decay_rates()
+    assert np.all(decay_rates > 0)
+    assert np.all(np.diff(decay_rates) >= 0)
+
+
+@pytest.mark.parametrize(
+    "upper_strand, tb_model_name, kwargs",
+    [
+        ("GCG", "ELM", {}),
+        ("GC", "ELM", {"relax_rate": 3, "loc_deph_rate": 1}),
+    ],
+)
+def test_get_time_average(upper_strand, tb_model_name, kwargs):
+    me_solver = get_me_solver(
+        upper_strand, tb_model_name, solver_engine="propagator", **kwargs
+    )
+    avg_pop = get_me_solver(upper_strand, tb_model_name, **kwargs).get_time_average(
+        quantities=["pop"]
+    )
+    for key, value in me_solver.get_pop().items():
+        assert np.isclose(avg_pop[key], np.mean(value))
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"relax_rate": 3, "loc_deph_rate": 1},
+        {"relax_rate": 3, "loc_deph_rate": 1, "reduce_groundstate": True},
+        {"relaxation": False, "glob_deph_rate": 1},
+    ],
+)
+def test_get_time_average_continuous(kwargs):
+    # the last case has several steady states and falls back to the trajectory
+    expected = get_me_solver("GC", "ELM", solver_engine="spectral", **kwargs)
+    expected = expected.get_time_average(quantities=["pop"], continuous=True)
+    me_solver = get_me_solver("GC", "ELM", solver_engine="krylov", **kwargs)
+    avg_pop = me_solver.get_time_average(quantities=["pop"], continuous=True)
+    for key, value in expected.items():
+        assert np.isclose(avg_pop[key], value, atol=1e-5)
+
+
+@pytest.mark.parametrize(
+    "upper_strand, tb_model_name, kwargs, init_states",
+    [
+        ("GC", "ELM", {}, [("(0, 0)", "(0, 0)"), ("(0, 0)", "(1, 0)")]),
+        (
+            "GC",
+            "ELM",
+            {"relax_rate": 3, "loc_deph_rate": 1},
+            [("(0, 0)", "(0, 0)"), ("(1, 0)", "(0, 0)")],
+        ),
+    ],
+)
+@pytest.mark.parametrize("solver_engine", ["propagator", "krylov", "scipy", "qutip"])
+def test_get_pop_batch(upper_strand, tb_model_name, kwargs, init_states, solver_engine):
+    me_solver = get_me_solver(
+        upper_strand, tb_model_name, solver_engine=solver_engine, **kwargs
+    )
+    pop_batch = me_solver.get_pop_batch(init_states)
+    # the ODE engines are only accurate up to their tolerances
+    atol = 1e-3 if solver_engine in ["scipy", "qutip"] else 1e-6
+    for idx, (init_e_state, init_h_state) in enumerate(init_states):
+        me_solver_ref = get_me_solver(
+            upper_strand,
+            tb_model_name,
+            init_e_state=init_e_state,
+            init_h_state=init_h_state,
+            solver_engine="propagator",
+            **kwargs,
+        )
+        for particle in me_solver.tb_ham.particles:
+            for site_idx, tb_site in enumerate(me_solver.tb_ham.tb_basis):
+                pop = me_solver_ref.get_pop()[particle + "_" + tb_site]
+                pop_batch_site = pop_batch[particle][idx, :, site_idx]
+                assert np.allclose(pop_batch_site, pop, atol=atol)
+
+
+@pytest.mark.parametrize(
+    "upper_strand, tb_model_name, kwargs",
+    [("GC", "ELM", {"relax_rate": 3, "loc_deph_rate": 1})],
+)
+def test_krylov_engine(upper_strand, tb_model_name, kwargs):
+    me_solver = get_me_solver(
+        upper_strand, tb_model_name, solver_engine="krylov", **kwargs
+    )
+    me_solver_ref = get_me_solver(
+        upper_strand, tb_model_name, solver_engine="propagator", **kwargs
+    )
+    for key, value in me_solver_ref.get_pop().items():
+        assert np.allclose(me_solver.get_pop()[key], value)
+
+
+@pytest.mark.parametrize(
+    "upper_strand, tb_model_name, kwargs",
+    [
+        ("GC", "ELM", {"relax_rate": 3, "loc_deph_rate": 1}),
+        ("GC", "ELM", {"relax_rate": 300, "solver_method": "bdf"}),
+    ],
+)
+def test_scipy_engine(upper_strand, tb_model_name, kwargs):
+    me_solver = get_me_solver(
+        upper_strand, tb_model_name, solver_engine="scipy", **kwargs
+    )
+    me_solver_ref = get_me_solver(
+        upper_strand, tb_model_name, solver_engine="qutip", **kwargs
+    )
+    for key, value in me_solver_ref.get_pop().items():
+        assert np.allclose(me_solver.get_pop()[key], value, atol=1e-6)
+
+    # the states are streamed as arrays and only wrapped into Qobj by get_result
+    assert isinstance(me_solver._solve({}, as_array=True), np.ndarray)
+    trajectory = me_solver.get_trajectory()
+    assert not me_solver.result
+    result = me_solver.get_result()
+    assert all(isinstance(dm, q.Qobj) for dm in result)
+    # the trajectory is integrated chunk by chunk, which restarts the ODE solver
+    assert np.allclose(trajectory.data, [dm.full() for dm in result], atol=1e-4)
+
+    # the Liouvillian is assembled from the sparse Hamiltonian matrix
+    me_solver_sparse = get_me_solver(
+        upper_strand, tb_model_name, solver_engine="scipy", sparse=True, **kwargs
+    )
+    assert np.allclose(
+        me_solver_sparse.get_liouvillian().toarray(),
+        me_solver.get_liouvillian().toarray(),
+    )
+
+
+@pytest.mark.parametrize(
+    "upper_strand, tb_model_name, kwargs",
+    [("GC", "ELM", {"relax_rate": 3, "loc_deph_rate": 0.01, "t_steps": 100})],
+)
+def test_mcwf_engine(upper_strand, tb_model_name, kwargs):
+    me_solver = get_me_solver(
+        upper_strand, tb_model_name, solver_engine="mcwf", mcwf_num_traj=200, **kwargs
+    )
+    me_solver_ref = get_me_solver(
+        upper_strand, tb_model_name, solver_engine="propagator", **kwargs
+    )
+    pop = me_solver.get_pop()
+    for key, value in me_solver_ref.get_pop().items():
+        std_err = me_solver.mcwf_std_err[key]
+        assert np.all(np.abs(pop[key] - value) <= 5 * std_err + 1e-3)
+
+
+def test_mcwf_in_daemon_process():
+    # daemonic pool workers cannot start a pool and run the trajectories serially
+    ham_matrix = np.array([[0, 1], [1, 0]], dtype=complex)
+    c_ops = [np.array([[0, 1], [0, 0]], dtype=complex)]
+    init_dm = np.diag([0, 1]).astype(complex)
+    e_ops = np.array([np.diag([1, 0])], dtype=complex)
+    args = (ham_matrix, c_ops, init_dm, np.linspace(0, 2, 5), e_ops)
+    kwargs = {"num_traj": 20, "seed": 0}
+    expected = run_mcwf(*args, **kwargs)
+    with multiprocessing.Pool(processes=1) as pool:
+        result = pool.apply(run_mcwf, args, {**kwargs, "num_cpu": 2})
+    assert np.allclose(result[0], expected[0])
+
+
+@pytest.mark.parametrize(
+    "upper_strand, tb_model_name, kwargs",
+    [("GC", "ELM", {"relax_rate": 3, "solver_engine": "propagator"})],
+)
+def test_iter_result(upper_strand, tb_model_name, kwargs):
+    me_solver = get_me_solver(upper_strand, tb_model_name, **kwargs)
+    gs_op = me_solver.lindblad_diss.groundstate_pop_ops["groundstate"]
+    stream = list(me_solver.iter_result(e_ops={"groundstate": gs_op}))
+    assert not me_solver.result
+    assert np.allclose([t for t, _ in stream], me_solver.times)
+    assert np.allclose(
+        [expect["groundstate"] for _, expect in stream],
+        me_solver.get_groundstate_pop()["groundstate"],
+    )
+
+    # the stream stops as soon as the callback returns True
+    times = [t for t, _ in me_solver.iter_result(callback=lambda t, dm: t > 1)]
+    assert times[-1] > 1 and times[-2] <= 1
+
+
+@pytest.mark.parametrize(
+    "upper_strand, tb_model_name, kwargs",
+    [
+        ("GC", "ELM", {"relax_rate": 3, "loc_deph_rate": 1}),
+        ("GC", "ELM", {"relax_rate": 3, "solver_engine": "spectral"}),
+        ("GC", "ELM", {"solver_engine": "unitary"}),
+    ],
+)
+def test_extend(upper_strand, tb_model_name, kwargs):
+    me_solver = get_me_solver(
+        upper_strand, tb_model_name, t_end=1, t_steps=101, **kwargs
+    )
+    e_op = me_solver.lindblad_diss.pop_ops["electron_(0, 0)"]
+    me_solver.observe(e_ops={"custom": e_op})
+    me_solver.get_result()
+    me_solver.extend(2)
+
+    me_solver_ref = get_me_solver(
+        upper_strand, tb_model_name, t_end=2, t_steps=201, **kwargs
+    )
+    pop, coh, groundstate_pop, expect = me_solver_ref.observe(e_ops={"custom": e_op})
+    assert me_solver.t_steps == 201 and np.allclose(me_solver.times, me_solver_ref.times)
+    for observable, observable_ref in zip(
+        [me_solver.pop, me_solver.coh, me_solver.groundstate_pop, me_solver.expect],
+        [pop, coh, groundstate_pop, expect],
+    ):
+        for key, value in observable_ref.items():
+            assert np.allclose(observable[key], value, atol=1e-4)
+    assert np.allclose(
+        [dm.full() for dm in me_solver.result],
+        [dm.full() for dm in me_solver_ref.get_result()],
+        atol=1e-4,
+    )
+
+
+@pytest.mark.parametrize(
+    "upper_strand, tb_model_name, kwargs",
+    [("GC", "ELM", {"relax_rate": 3, "solver_engine": "propagator"})],
+)
+def test_t_steps_subsample(upper_strand, tb_model_name, kwargs):
+    me_solver = get_me_solver(upper_strand, tb_model_name, t_steps=101, **kwargs)
+    pop = dict(me_solver.get_pop())
+    me_solver.t_steps = 51
+    assert me_solver.pop
+    for key, value in pop.items():
+        assert np.allclose(me_solver.pop[key], value[::2])
+
+    # the results are reset if the new time grid is not a subset of the old one
+    me_solver.t_steps = 50
+    assert not me_solver.pop
+
+
+@pytest.mark.parametrize(
+    "upper_strand, tb_model_name, kwargs, solver_method",
+    [
+        ("GC", "ELM", {"relax_rate": 3}, "adams"),
+        ("GC", "ELM", {"relax_rate": 300}, "bdf"),
+    ],
+)
+def test_solver_method(upper_strand, tb_model_name, kwargs, solver_method):
+    me_solver = get_me_solver(upper_strand, tb_model_name, **kwargs)
+    assert me_solver._get_solver_method() == solver_method
+    me_solver_ref = get_me_solver(
+        upper_strand, tb_model_name, solver_engine="propagator", **kwargs
+    )
+    for key, value in me_solver_ref.get_pop().items():
+        assert np.allclose(me_solver.get_pop()[key], value, atol=1e-3)
+
+    # the integrator options are passed to qutip
+    me_solver = get_me_solver(upper_strand, tb_model_name, solver_nsteps=1, **kwargs)
+    with pytest.raises(Exception), pytest.warns(UserWarning):
+        me_solver.get_pop()
+
+
+@pytest.mark.parametrize(
+    "upper_strand, tb_model_name, kwargs",
+    [("GC", "ELM", {"relax_rate": 3, "loc_deph_rate": 1, "t_steps": 100})],
+)
+@pytest.mark.parametrize("solver_engine", ["propagator", "spectral", "krylov"])
+def test_reduce_groundstate(upper_strand, tb_model_name, kwargs, solver_engine):
+    me_solver = get_me_solver(
+        upper_strand,
+        tb_model_name,
+        solver_engine=solver_engine,
+        reduce_groundstate=True,
+        **kwargs,
+    )
+    me_solver_ref = get_me_solver(
+        upper_strand, tb_model_name, solver_engine="propagator", **kwargs
+    )
+    dim = me_solver.tb_ham.matrix_dim
+    assert me_solver.get_liouvillian().shape == ((dim - 1) ** 2 + 1,) * 2
+
+    pop, _, groundstate_pop, _ = me_solver.observe()
+    for key, value in me_solver_ref.get_pop().items():
+        assert np.allclose(pop[key], value)
+    assert np.allclose(
+        groundstate_pop["groundstate"],
+        me_solver_ref.get_groundstate_pop()["groundstate"],
+    )
+    result = me_solver.get_result()
+    assert np.allclose(result[-1].full(), me_solver_ref.get_result()[-1].full())
+
+
+@pytest.mark.parametrize(
+    "upper_strand, tb_model_name, kwargs",
+    [
+        ("GC", "ELM", {"relax_rate": 3, "loc_deph_rate": 1, "t_steps": 100}),
+        ("GC", "ELM", {"relax_rate": 3, "reduce_groundstate": True, "t_steps": 100}),
+    ],
+)
+@pytest.mark.parametrize("solver_engine", ["propagator", "spectral", "krylov"])
+def test_use_symmetry(upper_strand, tb_model_name, kwargs, solver_engine):
+    me_solver = get_me_solver(
+        upper_strand,
+        tb_model_name,
+        solver_engine=solver_engine,
+        use_symmetry=True,
+        **kwargs,
+    )
+    me_solver_ref = get_me_solver(
+        upper_strand, tb_model_name, solver_engine=solver_engine, **kwargs
+    )
+    dim = me_solver_ref.get_liouvillian().shape[0]
+    pop, coh, _, _ = me_solver.observe()
+    assert len(me_solver.sector_dims) == 2 and sum(me_solver.sector_dims) == dim
+    for key, value in me_solver_ref.get_pop().items():
+        assert np.allclose(pop[key], value, atol=1e-6)
+    for key, value in me_solver_ref.get_coh().items():
+        assert np.allclose(coh[key], value, atol=1e-6)
+    result = me_solver.get_result()
+    assert np.allclose(
+        result[-1].full(), me_solver_ref.get_result()[-1].full(), atol=1e-6
+    )
+
+
+@pytest.mark.parametrize(
+    "upper_strand, tb_model_name, kwargs",
+    [("GC", "ELM", {"relax_rate": 3, "loc_deph_rate": 1, "t_steps": 100})],
+)
+@pytest.mark.parametrize("solver_engine", ["propagator", "spectral", "krylov"])
+def test_single_precision(upper_strand, tb_model_name, kwargs, solver_engine):
+    me_solver = get_me_solver(
+        upper_strand,
+        tb_model_name,
+        solver_engine=solver_engine,
+        precision="single",
+        **kwargs,
+    )
+    assert me_solver.get_liouvillian().dtype == np.complex64
+    me_solver_ref = get_me_solver(
+        upper_strand, tb_model_name, solver_engine=solver_engine, **kwargs
+    )
+    for key, value in me_solver_ref.get_pop().items():
+        assert np.allclose(me_solver.get_pop()[key], value, atol=1e-3)
+    assert me_solver.get_trajectory(diagonal=True).data.dtype == np.complex64
@@ -0,0 +1,21 @@
+import pytest
+import numpy as np
+
+from qDNA.dynamics import get_average_factors
+
+
+@pytest.mark.parametrize(
+    "exponents, times, continuous",
+    [
+        (np.array([0, -1, 2j, -0.5 + 3j]), np.linspace(0, 2, 11), False),
+        (np.array([0, 2 * np.pi * 1j]), np.linspace(1, 3, 3), False),
+        (np.array([-1, 2j]), np.linspace(0, 2, 11), True),
+    ],
+)
+def test_get_average_factors(exponents, times, continuous):
+    factors = get_average_factors(exponents, times, continuous)
+    if continuous:
+        expected = np.expm1(exponents * times[-1]) / (exponents * times[-1])
+    else:
+        expected = np.mean(np.exp(np.outer(exponents, times)), axis=1)
+    assert np.allclose(factors, expected)
@@ -0,0 +1,52 @@
+import pytest
+import numpy as np
+
+from qDNA.dynamics import get_me_solver, get_reduced_dm
+from qDNA.utils import calc_coherence
+
+
+@pytest.mark.parametrize(
+    "upper_strand, tb_model_name, kwargs",
+    [("GC", "ELM", {"relax_rate": 3, "solver_engine": "propagator"})],
+)
+def test_get_trajectory(upper_strand, tb_model_name, kwargs):
+    me_solver = get_me_solver(upper_strand, tb_model_name, **kwargs)
+    trajectory = me_solver.get_trajectory()
+    result = [dm.full() for dm in me_solver.get_result()]
+    assert trajectory.data.shape == (me_solver.t_steps,) + result[0].shape
+
+    assert np.allclose(trajectory.get_pops(), [np.diag(dm).real for dm in result])
+    assert np.allclose(trajectory.get_coherence(), [calc_coherence(dm) for dm in result])
+    tb_basis = me_solver.tb_model.tb_basis
+    assert np.allclose(
+        trajectory.get_reduced("electron", tb_basis)[-1],
+        get_reduced_dm(result[-1], "electron", tb_basis),
+    )
+    gs_op = me_solver.lindblad_diss.groundstate_pop_ops["groundstate"]
+    assert np.allclose(
+        trajectory.expect(gs_op).real,
+        me_solver.get_groundstate_pop()["groundstate"],
+    )
+
+
+@pytest.mark.parametrize(
+    "upper_strand, tb_model_name, kwargs",
+    [("GC", "ELM", {"relax_rate": 3, "solver_engine": "propagator"})],
+)
+def test_get_trajectory_compact(upper_strand, tb_model_name, kwargs, tmp_path):
+    me_solver = get_me_solver(upper_strand, tb_model_name, **kwargs)
+    pops = me_solver.get_trajectory().get_pops()
+
+    trajectory = me_solver.get_trajectory(
+        diagonal=True, dtype=np.complex64, filename=tmp_path / "trajectory.dat"
+    )
+    assert isinstance(trajectory.data, np.memmap)
+    assert trajectory.nbytes == 8 * pops.size
+    assert np.allclose(trajectory.get_pops(), pops, atol=1e-6)
+
+    # observables with off-diagonal elements need the full density matrices
+    e_op = np.diag(np.arange(pops.shape[1], dtype=float))
+    assert np.allclose(trajectory.expect(e_op), pops @ np.diag(e_op), atol=1e-5)
+    e_op[0, 1] = e_op[1, 0] = 1
+    with pytest.raises(AssertionError, match="off-diagonal"):
+        trajectory.expect(e_op)
@@ -0,0 +1,58 @@
+import pytest
+import numpy as np
+
+from qDNA import DNA_Seq
+from qDNA.hamiltonian import TB_Ham
+from qDNA.environment import (
+    Lindblad_Diss,
+    get_dissipator,
+    get_jump_dissipator,
+    get_diag_dissipator,
+    get_eigenbasis_dissipator,
+)
+
+
+def test_get_jump_dissipator():
+    dim = 4
+    rows, cols, rates = [0, 0, 1, 2], [2, 3, 3, 2], [1.0, 2.0, 0.5, 0.3]
+    c_ops = []
+    for row, col, rate in zip(rows, cols, rates):
+        c_op = np.zeros((dim, dim))
+        c_op[row, col] = np.sqrt(rate)
+        c_ops.append(c_op)
+    dissipator = get_jump_dissipator(dim, rows, cols, rates)
+    assert np.allclose(dissipator.toarray(), get_dissipator(c_ops).toarray())
+
+
+@pytest.mark.parametrize("eigenbasis", [False, True])
+def test_get_diag_dissipator(eigenbasis):
+    dim = 5
+    rng = np.random.default_rng(0)
+    amplitudes = rng.normal(size=(3, dim)) + 1j * rng.normal(size=(3, dim))
+    if eigenbasis:
+        eigs, _ = np.linalg.qr(rng.normal(size=(dim, dim)))
+        c_ops = [eigs @ np.diag(a) @ eigs.T for a in amplitudes]
+        dissipator = get_eigenbasis_dissipator(eigs, amplitudes)
+    else:
+        c_ops = [np.diag(a) for a in amplitudes]
+        dissipator = get_diag_dissipator(amplitudes)
+    assert np.allclose(dissipator.toarray(), get_dissipator(c_ops).toarray())
+
+
+@pytest.mark.parametrize(
+    "ham_kwargs, diss_kwargs",
+    [
+        ({"description": "2P"}, {"relax_rate": 3, "loc_deph_rate": 1}),
+        ({"description": "2P"}, {"relax_rate": 3, "glob_deph_rate": 1}),
+        ({"description": "2P", "relaxation": False}, {"glob_deph_rate": 1}),
+        ({"description": "2P"}, {"relax_rate": 3, "loc_therm": True}),
+        ({"description": "1P", "particles": ["electron"]}, {"loc_deph_rate": 1}),
+        ({"description": "1P", "particles": ["hole"]}, {"glob_deph_rate": 1}),
+    ],
+)
+def test_lindblad_diss_get_dissipator(ham_kwargs, diss_kwargs):
+    tb_ham = TB_Ham(DNA_Seq("GC", "ELM"), **ham_kwargs)
+    lindblad_diss = Lindblad_Diss(tb_ham, **diss_kwargs)
+    lindblad_diss.unit = "rad/fs"
+    expected = get_dissipator(lindblad_diss.c_ops).toarray()
+    assert np.allclose(lindblad_diss.get_dissipator().toarray(), expected)
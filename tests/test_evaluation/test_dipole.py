@@ -1,7 +1,10 @@
+import os
+
 import pytest
 import numpy as np
 
 from qDNA.evaluation import calc_dipole, calc_dipole_moment
+import qDNA.dynamics.cache as cache
 
 
 @pytest.mark.parametrize(
@@ -12,6 +15,16 @@ def test_calc_dipole(upper_strand, tb_model_name, average, expected):
     assert np.allclose(calc_dipole(upper_strand, tb_model_name, average), expected)
 
 
+@pytest.mark.parametrize("average", [True, False])
+def test_calc_dipole_cache(average, tmp_path, monkeypatch):
+    monkeypatch.setattr(cache, "CACHE_DIR", str(tmp_path))
+    expected = calc_dipole("GCG", "ELM", average)
+    for _ in range(2):
+        dipole = calc_dipole("GCG", "ELM", average, use_cache=True)
+        assert np.allclose(dipole, expected)
+    assert len(os.listdir(tmp_path)) == 1
+
+
 @pytest.mark.parametrize(
     "upper_strand, tb_model_name, expected", [("GCG", "ELM", 14.177784530660903)]
 )
@@ -1,7 +1,10 @@
+import os
+
 import pytest
 import numpy as np
 
-from qDNA.evaluation import calc_exciton_transfer
+from qDNA.evaluation import calc_exciton_transfer, calc_backbone_transfer
+import qDNA.dynamics.cache as cache
 
 
 @pytest.mark.parametrize(
@@ -34,3 +37,19 @@ def test_calc_exciton_transfer(upper_strand, tb_model_name, expected):
         list(calc_exciton_transfer(upper_strand, tb_model_name)[1].values()),
         list(expected[1].values()),
     )
+
+
+@pytest.mark.parametrize(
+    "upper_strand, tb_model_name, func",
+    [("GC", "ELM", calc_exciton_transfer), ("GC", "FELM", calc_backbone_transfer)],
+)
+def test_calc_transfer_cache(upper_strand, tb_model_name, func, tmp_path, monkeypatch):
+    monkeypatch.setattr(cache, "CACHE_DIR", str(tmp_path))
+    expected = func(upper_strand, tb_model_name)
+    for _ in range(2):
+        transfer = func(upper_strand, tb_model_name, use_cache=True)
+        assert np.allclose(
+            np.array([list(pop.values()) for pop in np.atleast_1d(transfer)]),
+            np.array([list(pop.values()) for pop in np.atleast_1d(expected)]),
+        )
+    assert len(os.listdir(tmp_path)) == 1
@@ -7,7 +7,47 @@ from qDNA.evaluation import calc_lifetime
     "upper_strand, tb_model_name, kwargs, expected",
     [
         # Case where ground state population reaches threshold and unit is rad/ps
-        ("GCG", "ELM", {"relax_rate": 3, "unit": "rad/ps"}, 775.5511022044088),
+        ("GCG", "ELM", {"relax_rate": 3, "unit": "rad/ps"}, pytest.approx(770.098)),
+        # Case where the lifetime is calculated from the spectrum of the Liouvillian
+        (
+            "GCG",
+            "ELM",
+            {"relax_rate": 3, "unit": "rad/ps", "method": "spectral"},
+            pytest.approx(770.098),
+        ),
+        # Case where the lifetime is taken from the time grid
+        (
+            "GCG",
+            "ELM",
+            {"relax_rate": 3, "unit": "rad/ps", "method": "grid"},
+            775.5511022044088,
+        ),
+        # Case where the time window is extended until the ground state is reached
+        (
+            "GCG",
+            "ELM",
+            {
+                "relax_rate": 3,
+                "unit": "rad/ps",
+                "t_unit": "fs",
+                "t_end": 300,
+                "t_steps": 300,
+                "max_t_end": 3000,
+            },
+            pytest.approx(770.098),
+        ),
+        # Case where the mcwf engine falls back to the time grid
+        (
+            "GCG",
+            "ELM",
+            {
+                "relax_rate": 3,
+                "unit": "rad/ps",
+                "solver_engine": "mcwf",
+                "mcwf_num_traj": 100,
+            },
+            pytest.approx(775.551, rel=0.25),
+        ),
         # Case with no relaxation occurring in the given time
         (
             "GCG",
@@ -19,3 +59,9 @@ from qDNA.evaluation import calc_lifetime
 )
 def test_calc_lifetime(upper_strand, tb_model_name, kwargs, expected):
     assert calc_lifetime(upper_strand, tb_model_name, **kwargs) == expected
+
+
+@pytest.mark.parametrize("method", ["event", "spectral"])
+def test_calc_lifetime_cache(method):
+    with pytest.raises(AssertionError):
+        calc_lifetime("GCG", "ELM", method=method, use_cache=True, relax_rate=3)
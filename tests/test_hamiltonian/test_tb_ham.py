@@ -0,0 +1,185 @@
+import pytest
+import numpy as np
+import scipy.sparse as sp
+
+from qDNA import DNA_Seq
+from qDNA.model import TB_Model
+from qDNA.hamiltonian import TB_Ham, tb_ham_1P, tb_ham_2P
+from qDNA.environment import Lindblad_Diss
+from qDNA.model import get_particle_eh_states
+from qDNA.utils import calc_amplitudes, calc_average_pop, calc_frequencies
+
+
+@pytest.mark.parametrize(
+    "tb_param_dict, expected",
+    [
+        (
+            {"E_G": 1.0, "E_C": 2.0, "t_GC": 0.1, "t_CG": 0.2, "h_GC": 0.3},
+            [
+                [1.0, 0.1, 0.3, 0.0],
+                [0.1, 2.0, 0.0, 0.3],
+                [0.3, 0.0, 2.0, 0.1],
+                [0.0, 0.3, 0.1, 1.0],
+            ],
+        )
+    ],
+)
+def test_tb_ham_1P(tb_param_dict, expected):
+    tb_model = TB_Model("LM", (2, 2))
+    tb_sites = ["G", "C", "C", "G"]
+    tb_basis_sites_dict = dict(zip(tb_model.tb_basis, tb_sites))
+    matrix = tb_ham_1P(tb_model, tb_param_dict, tb_basis_sites_dict)
+    assert np.allclose(matrix, expected)
+
+    del tb_param_dict["E_C"]
+    with pytest.raises(ValueError, match="E_C"):
+        tb_ham_1P(tb_model, tb_param_dict, tb_basis_sites_dict)
+
+
+@pytest.mark.parametrize("tb_dims", [(2, 2), (2, 3)])
+def test_tb_ham_2P(tb_dims):
+    tb_model = TB_Model("ELM", tb_dims)
+    tb_sites = ["G", "C", "A", "T", "C", "G"][: tb_model.num_sites]
+    tb_basis_sites_dict = dict(zip(tb_model.tb_basis, tb_sites))
+    tb_param_dict = {
+        f"{tb_str}_{site1}{site2}": 0.1 * idx + 0.01 * (idx1 + 4 * idx2)
+        for idx, tb_str in enumerate(["t", "h", "r+", "r-"])
+        for idx1, site1 in enumerate("ATGC")
+        for idx2, site2 in enumerate("ATGC")
+    }
+    tb_param_dict.update({"E_A": 1.0, "E_T": 2.0, "E_G": 3.0, "E_C": 4.0})
+    tb_param_dict_exciton = {key: 0.5 * val for key, val in tb_param_dict.items()}
+
+    matrix_1P = tb_ham_1P(tb_model, tb_param_dict, tb_basis_sites_dict)
+    matrix_exciton = tb_ham_1P(tb_model, tb_param_dict_exciton, tb_basis_sites_dict)
+    identity = np.eye(tb_model.num_sites)
+    expected = np.kron(matrix_1P, identity) + np.kron(identity, matrix_1P)
+    for i, j in np.ndindex(matrix_exciton.shape):
+        basis_matrix = np.zeros_like(matrix_exciton)
+        basis_matrix[i, j] = 1
+        expected += matrix_exciton[i, j] * np.kron(basis_matrix, basis_matrix)
+
+    args = (tb_model, tb_param_dict, tb_param_dict, tb_param_dict_exciton)
+    matrix = tb_ham_2P(*args, tb_basis_sites_dict)
+    assert isinstance(matrix, np.ndarray) and np.allclose(matrix, expected)
+    matrix = tb_ham_2P(*args, tb_basis_sites_dict, sparse=True)
+    assert sp.issparse(matrix) and np.allclose(matrix.toarray(), expected)
+
+
+@pytest.mark.parametrize(
+    "upper_strand, tb_model_name, kwargs",
+    [
+        ("GCG", "ELM", {"coulomb_param": 1.0, "exchange_param": 0.5}),
+        ("GC", "FLM", {"relaxation": False, "coulomb_param": 2.0, "nn_cutoff": False}),
+    ],
+)
+def test_sparse_tb_ham(upper_strand, tb_model_name, kwargs):
+    dna_seq = DNA_Seq(upper_strand, tb_model_name)
+    tb_ham = TB_Ham(dna_seq, **kwargs)
+    tb_ham_sparse = TB_Ham(dna_seq, sparse=True, **kwargs)
+    assert sp.issparse(tb_ham_sparse.matrix)
+    assert np.allclose(tb_ham_sparse.matrix.toarray(), tb_ham.matrix)
+    assert np.allclose(tb_ham_sparse.get_eigensystem()[0], tb_ham.get_eigensystem()[0])
+
+    tb_ham.relaxation = tb_ham_sparse.relaxation = not tb_ham.relaxation
+    assert np.allclose(tb_ham_sparse.matrix.toarray(), tb_ham.matrix)
+
+
+@pytest.mark.parametrize(
+    "upper_strand, tb_model_name, kwargs",
+    [
+        ("GCG", "ELM", {"relaxation": True, "nn_cutoff": True}),
+        ("GC", "FLM", {"relaxation": False, "nn_cutoff": False}),
+        ("GCG", "ELM", {"relaxation": True, "nn_cutoff": False, "sparse": True}),
+    ],
+)
+def test_update_interaction(upper_strand, tb_model_name, kwargs):
+    dna_seq = DNA_Seq(upper_strand, tb_model_name)
+    tb_ham = TB_Ham(dna_seq, **kwargs)
+    tb_ham.unit = "meV"
+    matrix = sp.csr_matrix(tb_ham.matrix).toarray()
+    previous_matrix = tb_ham.matrix
+    tb_ham.coulomb_param = 2.0
+    tb_ham.exchange_param = 0.5
+    tb_ham.nn_cutoff = not kwargs["nn_cutoff"]
+    assert tb_ham.coulomb_param == 2.0 and tb_ham.exchange_param == 0.5
+    # references to the previous matrix are not modified
+    assert np.allclose(sp.csr_matrix(previous_matrix).toarray(), matrix)
+
+    kwargs = {**kwargs, "unit": "meV", "coulomb_param": 2.0, "exchange_param": 0.5}
+    kwargs["nn_cutoff"] = not kwargs["nn_cutoff"]
+    expected = TB_Ham(dna_seq, **kwargs)
+    assert np.allclose(*(sp.csr_matrix(h.matrix).toarray() for h in (tb_ham, expected)))
+
+    tb_ham.coulomb_param = 0.0
+    expected = TB_Ham(dna_seq, **{**kwargs, "coulomb_param": 0.0})
+    assert np.allclose(*(sp.csr_matrix(h.matrix).toarray() for h in (tb_ham, expected)))
+
+
+@pytest.mark.parametrize(
+    "tb_model_name, diss_kwargs",
+    [("ELM", {"loc_therm": True}), ("FLM", {"glob_deph_rate": 1})],
+)
+def test_cached_eigensystem(monkeypatch, tb_model_name, diss_kwargs):
+    eigh = np.linalg.eigh
+    calls = []
+    monkeypatch.setattr(np.linalg, "eigh", lambda m: calls.append(m) or eigh(m))
+
+    tb_ham = TB_Ham(DNA_Seq("GC", tb_model_name))
+    Lindblad_Diss(tb_ham, relax_rate=3, **diss_kwargs).get_dissipator()
+    init_state = (tb_ham.tb_basis[0], tb_ham.tb_basis[0])
+    tb_ham.get_average_pop(init_state, tb_ham.tb_basis[-1])
+    if tb_ham.backbone:
+        tb_ham.get_backbone_pop(init_state)
+    assert len(calls) == 1
+
+    tb_ham.coulomb_param = 1.0
+    eigv, eigs = tb_ham.get_eigensystem()
+    assert len(calls) == 2 and not eigv.flags.writeable
+    expected = TB_Ham(DNA_Seq("GC", tb_model_name), coulomb_param=1.0)
+    assert np.allclose(eigv, expected.get_eigensystem()[0])
+
+
+@pytest.mark.parametrize(
+    "upper_strand, tb_model_name, kwargs",
+    [
+        ("GC", "FLM", {"coulomb_param": 1.0}),
+        ("GCA", "ELM", {"description": "1P", "particles": ["hole"]}),
+    ],
+)
+def test_get_fourier_basis(upper_strand, tb_model_name, kwargs):
+    tb_ham = TB_Ham(DNA_Seq(upper_strand, tb_model_name), **kwargs)
+    eigv, eigs = tb_ham.get_eigensystem()
+    basis = tb_ham.eh_basis if tb_ham.description == "2P" else tb_ham.tb_basis
+    init_states = basis[:2]
+    amplitudes, frequencies, average_pop = tb_ham.get_fourier_basis(init_states)
+
+    for particle in tb_ham.particles:
+        for init_idx, init_state in enumerate(init_states):
+            for site_idx, tb_site in enumerate(tb_ham.tb_basis):
+                end_states = [tb_site]
+                if tb_ham.description == "2P":
+                    end_states = get_particle_eh_states(
+                        particle, tb_site, tb_ham.tb_basis
+                    )
+                init = basis.index(init_state)
+                ends = [basis.index(end_state) for end_state in end_states]
+                expected = sum(calc_average_pop(eigs, init, end) for end in ends)
+                assert np.isclose(average_pop[particle][init_idx, site_idx], expected)
+                expected = np.concatenate([calc_amplitudes(eigs, init, e) for e in ends])
+                assert np.allclose(amplitudes[particle][init_idx, site_idx], expected)
+        expected = np.tile(calc_frequencies(eigv), len(ends))
+        assert np.allclose(frequencies[particle], expected)
+
+    fourier = tb_ham.get_fourier(init_states[1], tb_ham.tb_basis[-1], "all")
+    for particle in tb_ham.particles:
+        assert np.allclose(fourier[0][particle], amplitudes[particle][1, -1])
+        assert np.isclose(fourier[2][particle], average_pop[particle][1, -1])
+
+    # the end states restrict the site axis
+    end_states = tb_ham.tb_basis[::-2]
+    end_idx = [tb_ham.tb_basis.index(end_state) for end_state in end_states]
+    restricted = tb_ham.get_fourier_basis(init_states, end_states=end_states)
+    for particle in tb_ham.particles:
+        assert np.allclose(restricted[0][particle], amplitudes[particle][:, end_idx])
+        assert np.allclose(restricted[2][particle], average_pop[particle][:, end_idx])
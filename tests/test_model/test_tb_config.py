@@ -1,6 +1,6 @@
 import pytest
 
-from qDNA.model import get_tb_config
+from qDNA.model import get_tb_config, get_tb_config_indices, get_tb_basis
 
 
 @pytest.mark.parametrize(
@@ -185,3 +185,27 @@ def test_get_tb_config_FELM(input, expected):
 )
 def test_get_tb_config_FC(input, expected):
     assert get_tb_config(*input) == expected
+
+
+@pytest.mark.parametrize(
+    "input, expected",
+    [
+        (
+            ("LM", (2, 2)),
+            (
+                ["E", "t", "h"],
+                [0, 0, 1, 0, 0, 1, 2, 2],
+                [0, 1, 1, 2, 3, 2, 0, 1],
+                [0, 1, 0, 2, 3, 3, 2, 3],
+            ),
+        )
+    ],
+)
+def test_get_tb_config_indices(input, expected):
+    tb_config = get_tb_config(*input)
+    tb_basis = get_tb_basis(input[1])
+    tb_strs, slots, rows, cols = get_tb_config_indices(tb_config, tb_basis)
+    assert tb_strs == expected[0]
+    assert slots.tolist() == expected[1]
+    assert rows.tolist() == expected[2]
+    assert cols.tolist() == expected[3]
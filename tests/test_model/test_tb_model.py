@@ -0,0 +1,32 @@
+import pytest
+import numpy as np
+
+from qDNA.model import (
+    TB_Model,
+    Custom_TB_Model,
+    get_tb_config,
+    get_tb_basis,
+    get_tb_config_indices,
+)
+
+
+@pytest.mark.parametrize("tb_model_name, tb_dims", [("ELM", (2, 3)), ("FLM", (4, 2))])
+def test_tb_config_indices(tb_model_name, tb_dims):
+    tb_model = TB_Model(tb_model_name, tb_dims)
+    expected = get_tb_config_indices(tb_model.tb_config, tb_model.tb_basis)
+    assert list(tb_model.tb_config_indices[0]) == expected[0]
+    for array, expected_array in zip(tb_model.tb_config_indices[1:], expected[1:]):
+        assert np.array_equal(array, expected_array) and not array.flags.writeable
+
+    # the index arrays are shared between instances with the same name and dimensions
+    other_tb_model = TB_Model(tb_model_name, tb_dims)
+    assert other_tb_model.tb_config_indices is tb_model.tb_config_indices
+
+    # the index arrays of custom models are computed on first access
+    tb_config = get_tb_config(tb_model_name, tb_dims)
+    custom_tb_model = Custom_TB_Model(
+        tb_model_name, tb_dims, get_tb_basis(tb_dims), tb_config
+    )
+    assert "tb_config_indices" not in vars(custom_tb_model)
+    assert custom_tb_model.tb_config_indices[0] == expected[0]
+    assert "tb_config_indices" in vars(custom_tb_model)
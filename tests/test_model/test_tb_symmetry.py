@@ -0,0 +1,62 @@
+import pytest
+import numpy as np
+
+from qDNA import DNA_Seq
+from qDNA.hamiltonian import TB_Ham
+from qDNA.model import (
+    get_reflection_perm,
+    get_eh_perm,
+    get_liouville_perm,
+    get_sector_basis,
+    get_sector_eigensystem,
+)
+
+
+@pytest.mark.parametrize(
+    "tb_dims, tb_basis, expected",
+    [
+        ((2, 2), ["(0, 0)", "(0, 1)", "(1, 0)", "(1, 1)"], [3, 2, 1, 0]),
+        ((1, 3), ["(0, 0)", "(0, 1)", "(0, 2)"], [2, 1, 0]),
+    ],
+)
+def test_get_reflection_perm(tb_dims, tb_basis, expected):
+    assert get_reflection_perm(tb_dims, tb_basis).tolist() == expected
+
+
+def test_get_liouville_perm():
+    perm = get_eh_perm(np.array([2, 1, 0]), groundstate=True)
+    dim = len(perm)
+    dm = np.random.default_rng(0).normal(size=(dim, dim))
+    vec_perm = get_liouville_perm(perm)
+    assert np.allclose(
+        dm.ravel(order="F")[vec_perm], dm[perm][:, perm].ravel(order="F")
+    )
+
+
+def test_get_sector_basis():
+    perm = np.array([3, 1, 4, 0, 2])
+    basis_plus, basis_minus = get_sector_basis(perm)
+    assert basis_plus.shape == (5, 3) and basis_minus.shape == (5, 2)
+    basis = np.hstack([basis_plus.toarray(), basis_minus.toarray()])
+    assert np.allclose(basis.T @ basis, np.eye(5))
+    assert np.allclose(basis_plus.toarray()[perm], basis_plus.toarray())
+    assert np.allclose(basis_minus.toarray()[perm], -basis_minus.toarray())
+
+
+@pytest.mark.parametrize(
+    "upper_strand, tb_model_name, ham_kwargs, symmetric",
+    [
+        ("GCGC", "ELM", {}, True),
+        ("GC", "FELM", {"relaxation": False}, True),
+        ("GCG", "ELM", {}, False),
+        ("GCGC", "ELM", {"description": "1P", "particles": ["hole"]}, True),
+    ],
+)
+def test_get_symmetry_perm(upper_strand, tb_model_name, ham_kwargs, symmetric):
+    tb_ham = TB_Ham(DNA_Seq(upper_strand, tb_model_name), **ham_kwargs)
+    perm = tb_ham.get_symmetry_perm()
+    assert (perm is not None) == symmetric
+    if symmetric:
+        eigv, eigs = get_sector_eigensystem(tb_ham.matrix, perm)
+        assert np.allclose(eigv, np.linalg.eigvalsh(tb_ham.matrix))
+        assert np.allclose(tb_ham.matrix @ eigs, eigs * eigv)
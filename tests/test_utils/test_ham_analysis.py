@@ -6,6 +6,8 @@ from qDNA.utils import (
     calc_amplitudes,
     calc_frequencies,
     get_pop_fourier,
+    get_dm_fourier,
+    get_expect_fourier,
 )
 
 matrix = np.array([[0, 1], [1, 0]])
@@ -39,3 +41,18 @@ def test_calc_frequencies(eigs, eigv, state1, state2, t, expected):
     frequencies = calc_frequencies(eigv)
     pop_fourier = get_pop_fourier(t, average_pop, amplitudes, frequencies)
     assert np.allclose(pop_fourier, expected)
+
+
+@pytest.mark.parametrize(
+    "eigs, eigv, state1, state2, t, expected",
+    [(eigs, eigv, 0, 0, 10, 0.7040410309066957)],
+)
+def test_get_dm_fourier(eigs, eigv, state1, state2, t, expected):
+    init_dm = np.zeros((2, 2))
+    init_dm[state1, state1] = 1
+    dm = get_dm_fourier(np.array([t]), init_dm, eigv, eigs)[0]
+    assert np.allclose(dm[state2, state2], expected)
+    assert np.allclose(
+        get_expect_fourier(np.array([t]), init_dm, eigv, eigs, np.array([init_dm])),
+        expected,
+    )
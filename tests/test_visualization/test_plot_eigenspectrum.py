@@ -0,0 +1,29 @@
+import pytest
+import numpy as np
+import matplotlib
+
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt
+
+from qDNA import DNA_Seq
+from qDNA.hamiltonian import TB_Ham
+from qDNA.utils import get_conversion
+from qDNA.visualization import plot_eigv, plot_eigs
+
+
+@pytest.mark.parametrize(
+    "upper_strand, tb_model_name, kwargs",
+    [("GCG", "ELM", {}), ("GC", "FLM", {"description": "1P", "particles": ["hole"]})],
+)
+def test_plot_eigv(upper_strand, tb_model_name, kwargs):
+    tb_ham = TB_Ham(DNA_Seq(upper_strand, tb_model_name), **kwargs)
+    eigv, _ = tb_ham.get_eigensystem()
+    expected = eigv * get_conversion(tb_ham.unit, "meV")
+
+    fig, ax = plt.subplots()
+    plot_eigv(ax, tb_ham, energy_unit="meV")
+    plot_eigs(ax, tb_ham, 0)
+    assert np.allclose(ax.lines[0].get_ydata(), expected)
+    # the cached eigenvalues are not modified
+    assert np.allclose(tb_ham.get_eigensystem()[0], eigv)
+    plt.close(fig)